@@ -3,7 +3,6 @@ import platform
 import shutil
 from pathlib import Path
 
-import pandas as pd
 import streamlit as st
 
 from whisper_tiktok.config.logger_config import setup_logger
@@ -14,12 +13,17 @@ from whisper_tiktok.voice_manager import VoicesManager
 
 
 def _setup_event_loop():
-    """Setup event loop for Windows if needed."""
+    """Setup event loop for Windows if needed.
+
+    The proactor loop is required to run ffmpeg and yt-dlp asynchronously.
+    """
     if platform.system() == "Windows":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 
 def json_to_df(json_file):
+    import pandas as pd
+
     return pd.read_json(json_file)
 
 
@@ -150,8 +154,35 @@ async def run_pipeline(
         # Run application
         app_instance = Application(container, logger)
 
-        await app_instance.run()
-        st_log.success("Pipeline completed successfully!")
+        render_bars = {}
+
+        def show_progress(progress):
+            bar = render_bars.get(progress.output)
+            if bar is None:
+                bar = render_bars[progress.output] = st.progress(0.0)
+            bar.progress(
+                (progress.percent or 0) / 100,
+                text=f"Rendering {progress.output.name}"
+                + (f" ({progress.speed}x)" if progress.speed else ""),
+            )
+
+        unsubscribe = container.progress_bus().subscribe(show_progress)
+        try:
+            report = await app_instance.run()
+        finally:
+            unsubscribe()
+        if report.failed:
+            st_log.warning(
+                f"Pipeline completed with {report.failed} failed video(s) out of "
+                f"{report.succeeded + report.failed}"
+            )
+            for failure in report.failures:
+                st.error(
+                    f"#{failure.index} {failure.video.get('series', 'Unknown')} "
+                    f"({failure.stage}): {failure.error}"
+                )
+        else:
+            st_log.success("Pipeline completed successfully!")
 
     except Exception as e:
         logger.exception("Pipeline failed")
@@ -0,0 +1,5 @@
+"""Offline performance benchmarks of the Whisper TikTok pipeline.
+
+Run the suite with ``python -m benchmarks run`` and compare two result files
+with ``python -m benchmarks compare``.
+"""
@@ -0,0 +1,184 @@
+"""Command line entry point of the benchmark suite.
+
+Usage:
+    python -m benchmarks run --videos 4 --output benchmarks/baselines/main.json
+    python -m benchmarks compare benchmarks/baselines/main.json current.json
+    python -m benchmarks quantization speech1.wav speech2.wav --model small
+"""
+
+import asyncio
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.results import BenchmarkRun, compare_runs
+
+app = typer.Typer(help="Whisper TikTok performance benchmarks", add_completion=False)
+console = Console()
+
+
+@app.command()
+def run(
+    videos: int = typer.Option(4, min=1, help="Videos per pipeline batch"),
+    repeat: int = typer.Option(3, min=1, help="Timed runs per case"),
+    profile: str = typer.Option("draft", help="Render profile of the compositions"),
+    whisper: str = typer.Option(
+        "stub", help="'stub' to skip Whisper, or a Whisper model such as 'tiny'"
+    ),
+    speech_seconds: float = typer.Option(20, min=1, help="Narration length"),
+    output: Path = typer.Option(
+        Path("benchmarks/baselines/latest.json"), help="Result file to write"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", help="Log pipeline progress"),
+):
+    """Run the suite on synthetic media and store the timings as JSON."""
+    from benchmarks.suite import BenchmarkSuite
+
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING)
+    with tempfile.TemporaryDirectory(prefix="whisper-tiktok-bench-") as tmp:
+        suite = BenchmarkSuite(
+            Path(tmp),
+            videos=videos,
+            repeat=repeat,
+            profile=profile,
+            whisper=whisper,
+            speech_seconds=speech_seconds,
+        )
+        result = asyncio.run(suite.run())
+
+    table = Table(title="Benchmark results")
+    table.add_column("Case", style="cyan")
+    table.add_column("Median (s)", justify="right")
+    table.add_column("Min (s)", justify="right")
+    for name, case in result.cases.items():
+        table.add_row(name, f"{case.median:.4f}", f"{min(case.runs):.4f}")
+    console.print(table)
+
+    result.save(output)
+    console.print(f"Results saved to {output}")
+
+
+@app.command()
+def compare(
+    baseline: Path = typer.Argument(..., exists=True, help="Reference result file"),
+    current: Path = typer.Argument(..., exists=True, help="Result file to check"),
+    threshold: float = typer.Option(
+        0.1, min=0.0, help="Relative slowdown flagged as a regression"
+    ),
+    output: Path | None = typer.Option(None, help="Write the comparison as JSON"),
+):
+    """Compare two result files, exiting with 1 when a case regressed."""
+    comparisons = compare_runs(
+        BenchmarkRun.load(baseline), BenchmarkRun.load(current), threshold
+    )
+
+    table = Table(title=f"{current.name} vs {baseline.name}")
+    table.add_column("Case", style="cyan")
+    table.add_column("Baseline (s)", justify="right")
+    table.add_column("Current (s)", justify="right")
+    table.add_column("Change", justify="right")
+    for c in comparisons:
+        style = "bold red" if c.regressed else "green" if c.change < 0 else None
+        table.add_row(
+            c.name,
+            f"{c.baseline:.4f}",
+            f"{c.current:.4f}",
+            f"{c.change:+.1%}",
+            style=style,
+        )
+    console.print(table)
+
+    if output is not None:
+        output.write_text(
+            json.dumps([c.to_dict() for c in comparisons], indent=2), encoding="utf-8"
+        )
+
+    regressions = [c for c in comparisons if c.regressed]
+    if regressions:
+        console.print(
+            f"[bold red]{len(regressions)} regression(s) above "
+            f"{threshold:.0%}[/bold red]"
+        )
+        raise typer.Exit(code=1)
+    console.print("[bold green]No regressions[/bold green]")
+
+
+@app.command()
+def quantization(
+    audio_files: list[Path] = typer.Argument(
+        ..., exists=True, dir_okay=False, help="Fixed set of audio files"
+    ),
+    model: str = typer.Option("tiny", help="Whisper model to compare"),
+    repeat: int = typer.Option(3, min=1, help="Timed transcriptions per file"),
+    cache_dir: Path | None = typer.Option(
+        None, help="Directory caching the quantized weights (default: temporary)"
+    ),
+    output: Path = typer.Option(
+        Path("benchmarks/baselines/quantization.json"), help="Result file to write"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", help="Log progress"),
+):
+    """Compare the int8 quantized Whisper model with fp32 on the CPU."""
+    from benchmarks.quantization import QuantizationBenchmark
+
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING)
+    with tempfile.TemporaryDirectory(prefix="whisper-tiktok-int8-") as tmp:
+        result = QuantizationBenchmark(
+            audio_files, model, repeat, cache_dir or Path(tmp)
+        ).run()
+
+    params = result.params
+    table = Table(title=f"int8 vs fp32 ({model}, {params['threads']} threads)")
+    table.add_column("Metric", style="cyan")
+    table.add_column("fp32", justify="right")
+    table.add_column("int8", justify="right")
+    table.add_row(
+        "Load (s)",
+        f"{result.cases['load_fp32'].median:.2f}",
+        f"{result.cases['load_int8'].median:.2f}",
+    )
+    table.add_row(
+        "Transcription (s)",
+        f"{sum(result.cases['transcribe_fp32'].runs):.2f}",
+        f"{sum(result.cases['transcribe_int8'].runs):.2f}",
+    )
+    table.add_row(
+        "Weights (MB)",
+        f"{params['fp32_bytes'] / 2**20:.0f}",
+        f"{params['int8_bytes'] / 2**20:.0f}",
+    )
+    console.print(table)
+    console.print(
+        f"Speedup: {params['speedup']:.2f}x, "
+        f"memory reduction: {params['memory_reduction']:.0%}"
+    )
+
+    drift = Table(title="Word timestamp drift of int8 (s)")
+    drift.add_column("Audio", style="cyan")
+    drift.add_column("Matched", justify="right")
+    drift.add_column("Mean start", justify="right")
+    drift.add_column("Max start", justify="right")
+    drift.add_column("Mean end", justify="right")
+    drift.add_column("Max end", justify="right")
+    for name, d in params["drift"].items():
+        drift.add_row(
+            name,
+            f"{d['match_ratio']:.0%}",
+            f"{d['mean_start']:.3f}",
+            f"{d['max_start']:.3f}",
+            f"{d['mean_end']:.3f}",
+            f"{d['max_end']:.3f}",
+        )
+    console.print(drift)
+
+    result.save(output)
+    console.print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    app()
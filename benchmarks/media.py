@@ -0,0 +1,105 @@
+"""Synthetic media generated locally with ffmpeg lavfi sources."""
+
+from pathlib import Path
+
+from whisper_tiktok.execution.command_executor import CommandExecutor
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+
+SAMPLE_SCRIPT = (
+    "Crazy facts that you did not know - Part 1. The King is invaluable, "
+    "it can never be captured and the game ends as soon as it is trapped. "
+    "Follow us for more"
+)
+
+
+async def _ffmpeg(executor: CommandExecutor, *arguments: str) -> None:
+    result = await executor.execute(["ffmpeg", "-hide_banner", *arguments, "-y"])
+    if not result.success:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+
+
+async def make_background(
+    executor: CommandExecutor, path: Path, duration: float = 120
+) -> Path:
+    """Render a landscape 1080p test pattern, like a downloaded background."""
+    await _ffmpeg(
+        executor,
+        "-f",
+        "lavfi",
+        "-i",
+        f"testsrc2=size=1920x1080:rate=30:duration={duration}",
+        "-pix_fmt",
+        "yuv420p",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        "-g",
+        "60",
+        path.as_posix(),
+    )
+    return path
+
+
+async def make_speech(
+    executor: CommandExecutor, path: Path, duration: float = 20
+) -> Path:
+    """Render a tone standing in for synthesized speech, as edge-tts MP3."""
+    await _ffmpeg(
+        executor,
+        "-f",
+        "lavfi",
+        "-i",
+        f"sine=frequency=220:sample_rate=24000:duration={duration}",
+        "-c:a",
+        "libmp3lame",
+        "-b:a",
+        "48k",
+        path.as_posix(),
+    )
+    return path
+
+
+def synthetic_words(text: str, duration: float) -> list[WordBoundary]:
+    """Spread the words of a script evenly over the audio."""
+    words = text.split()
+    step = duration / max(len(words), 1)
+    return [
+        WordBoundary(word, i * step, (i + 0.8) * step) for i, word in enumerate(words)
+    ]
+
+
+def _srt_timestamp(seconds: float) -> str:
+    minutes, rest = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours:02d}:{minutes:02d}:{rest:06.3f}".replace(".", ",")
+
+
+def _ass_timestamp(seconds: float) -> str:
+    minutes, rest = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours:d}:{minutes:02d}:{rest:05.2f}"
+
+
+def write_subtitles(words: list[WordBoundary], srt_file: Path, ass_file: Path) -> None:
+    """Write one cue per word, standing in for Whisper's subtitles."""
+    srt_file.write_text(
+        "\n".join(
+            f"{i}\n{_srt_timestamp(w.start)} --> {_srt_timestamp(w.end)}\n{w.text}\n"
+            for i, w in enumerate(words, start=1)
+        ),
+        encoding="utf-8",
+    )
+    events = "\n".join(
+        f"Dialogue: 0,{_ass_timestamp(w.start)},{_ass_timestamp(w.end)},Default,{w.text}"
+        for w in words
+    )
+    ass_file.write_text(
+        "[Script Info]\nScriptType: v4.00+\nPlayResX: 1080\nPlayResY: 1920\n\n"
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, Alignment\n"
+        "Style: Default,Arial,72,&H00FFFFFF,5\n\n"
+        "[Events]\nFormat: Layer, Start, End, Style, Text\n"
+        f"{events}\n",
+        encoding="utf-8",
+    )
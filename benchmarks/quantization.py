@@ -0,0 +1,182 @@
+"""Benchmark of the int8 quantized Whisper models against fp32."""
+
+import difflib
+import logging
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks.results import BenchmarkRun
+from whisper_tiktok.services.model_registry import model_size_bytes
+from whisper_tiktok.services.transcription_service import (
+    WhisperPrecision,
+    load_whisper_model,
+)
+
+logger = logging.getLogger("whisper_tiktok.benchmarks")
+
+
+@dataclass(frozen=True)
+class TimedWord:
+    """A transcribed word and its timestamps, in seconds."""
+
+    word: str
+    start: float
+    end: float
+
+
+@dataclass(frozen=True)
+class TimestampDrift:
+    """Difference between the word timestamps of two transcriptions.
+
+    Attributes:
+        matched: Number of words found in both transcriptions.
+        match_ratio: Share of the reference words found in the candidate.
+        mean_start: Mean absolute difference of the start times.
+        max_start: Largest absolute difference of the start times.
+        mean_end: Mean absolute difference of the end times.
+        max_end: Largest absolute difference of the end times.
+    """
+
+    matched: int
+    match_ratio: float
+    mean_start: float
+    max_start: float
+    mean_end: float
+    max_end: float
+
+
+def _normalize(word: str) -> str:
+    return "".join(char for char in word.lower() if char.isalnum())
+
+
+def timestamp_drift(
+    reference: list[TimedWord], candidate: list[TimedWord]
+) -> TimestampDrift:
+    """Compare the timestamps of the words common to two transcriptions.
+
+    Words are matched on their normalized text, so a model that hears a word
+    differently only lowers the match ratio instead of shifting the others.
+    """
+    matcher = difflib.SequenceMatcher(
+        a=[_normalize(w.word) for w in reference],
+        b=[_normalize(w.word) for w in candidate],
+        autojunk=False,
+    )
+    pairs = [
+        (reference[block.a + i], candidate[block.b + i])
+        for block in matcher.get_matching_blocks()
+        for i in range(block.size)
+    ]
+    if not pairs:
+        return TimestampDrift(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    starts = [abs(a.start - b.start) for a, b in pairs]
+    ends = [abs(a.end - b.end) for a, b in pairs]
+    return TimestampDrift(
+        matched=len(pairs),
+        match_ratio=len(pairs) / len(reference),
+        mean_start=statistics.fmean(starts),
+        max_start=max(starts),
+        mean_end=statistics.fmean(ends),
+        max_end=max(ends),
+    )
+
+
+class QuantizationBenchmark:
+    """Compares the int8 quantized model with the fp32 model on the CPU.
+
+    Both models transcribe the same audio files. The run records the load
+    and transcription times, the size of the weights and, for every file, the
+    drift of the int8 word timestamps from the fp32 ones.
+
+    Args:
+        audio_files: Fixed set of audio files to transcribe.
+        model: Whisper model name.
+        repeat: Timed transcriptions per file and precision.
+        cache_dir: Directory caching the quantized weights.
+    """
+
+    def __init__(
+        self,
+        audio_files: list[Path],
+        model: str = "tiny",
+        repeat: int = 3,
+        cache_dir: Path | None = None,
+    ):
+        self.audio_files = audio_files
+        self.model = model
+        self.repeat = max(1, repeat)
+        self.cache_dir = cache_dir
+
+    def _load(self, precision: WhisperPrecision) -> tuple[object, float]:
+        started = time.perf_counter()
+        model = load_whisper_model(
+            self.model, "cpu", precision.value, quantized_cache_dir=self.cache_dir
+        )
+        return model, time.perf_counter() - started
+
+    def _transcribe(self, model, audio_file: Path) -> tuple[list[TimedWord], float]:
+        runs = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            result = model.transcribe(
+                audio_file.as_posix(), fp16=False, word_timestamps=True
+            )
+            runs.append(time.perf_counter() - started)
+        words = [
+            TimedWord(word.word, word.start, word.end) for word in result.all_words()
+        ]
+        return words, statistics.median(runs)
+
+    def run(self) -> BenchmarkRun:
+        """Transcribe the audio files with both precisions.
+
+        Returns:
+            The timings as cases, the speedup, sizes and drift as params.
+        """
+        import torch
+
+        result = BenchmarkRun(
+            params={
+                "model": self.model,
+                "audio_files": [path.name for path in self.audio_files],
+                "repeat": self.repeat,
+                "threads": torch.get_num_threads(),
+            }
+        )
+        words: dict[WhisperPrecision, list[list[TimedWord]]] = {}
+        totals: dict[WhisperPrecision, float] = {}
+
+        for precision in (WhisperPrecision.FP32, WhisperPrecision.INT8):
+            model, load_time = self._load(precision)
+            if precision is WhisperPrecision.INT8 and self.cache_dir is not None:
+                # The first load quantized the model, time the cached one
+                del model
+                result.params["int8_quantize_seconds"] = load_time
+                model, load_time = self._load(precision)
+            result.add(f"load_{precision.value}", [load_time])
+            result.params[f"{precision.value}_bytes"] = model_size_bytes(model)
+
+            words[precision], times = [], []
+            for audio_file in self.audio_files:
+                logger.info(f"Transcribing {audio_file.name} ({precision.value})")
+                file_words, seconds = self._transcribe(model, audio_file)
+                words[precision].append(file_words)
+                times.append(seconds)
+            result.add(f"transcribe_{precision.value}", times)
+            totals[precision] = sum(times)
+            del model
+
+        fp32, int8 = WhisperPrecision.FP32, WhisperPrecision.INT8
+        result.params["speedup"] = totals[fp32] / totals[int8] if totals[int8] else 0.0
+        result.params["memory_reduction"] = 1 - (
+            result.params["int8_bytes"] / result.params["fp32_bytes"]
+        )
+        result.params["drift"] = {
+            path.name: asdict(timestamp_drift(reference, candidate))
+            for path, reference, candidate in zip(
+                self.audio_files, words[fp32], words[int8]
+            )
+        }
+        return result
@@ -0,0 +1,116 @@
+"""Benchmark result files and regression detection."""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class CaseResult:
+    """Timings of one benchmark case, in seconds."""
+
+    name: str
+    runs: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+    def to_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "median": self.median,
+            "min": min(self.runs),
+            "max": max(self.runs),
+        }
+
+
+@dataclass
+class BenchmarkRun:
+    """Results of a whole benchmark run and the environment it ran in."""
+
+    cases: dict[str, CaseResult] = field(default_factory=dict)
+    params: dict = field(default_factory=dict)
+    machine: str = field(default_factory=platform.node)
+    python: str = field(default_factory=lambda: sys.version.split()[0])
+    created_at: float = field(default_factory=time.time)
+
+    def add(self, name: str, runs: list[float]) -> CaseResult:
+        result = self.cases[name] = CaseResult(name, runs)
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            "machine": self.machine,
+            "python": self.python,
+            "created_at": self.created_at,
+            "params": self.params,
+            "cases": {name: case.to_dict() for name, case in self.cases.items()},
+        }
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkRun":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        run = cls(
+            params=data.get("params", {}),
+            machine=data.get("machine", ""),
+            python=data.get("python", ""),
+            created_at=data.get("created_at", 0.0),
+        )
+        for name, case in data.get("cases", {}).items():
+            run.add(name, case["runs"])
+        return run
+
+
+@dataclass
+class Comparison:
+    """Change of the median time of a case between two runs."""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of the median, positive when slower."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        return self.change > self.threshold
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "change": self.change, "regressed": self.regressed}
+
+
+def compare_runs(
+    baseline: BenchmarkRun, current: BenchmarkRun, threshold: float = 0.1
+) -> list[Comparison]:
+    """Compare the cases present in both runs.
+
+    Args:
+        baseline: Reference run.
+        current: Run to check.
+        threshold: Relative slowdown of the median above which a case is
+            flagged as a regression, e.g. 0.1 for 10%.
+
+    Returns:
+        One comparison per common case, in the order of the current run.
+    """
+    return [
+        Comparison(name, baseline.cases[name].median, case.median, threshold)
+        for name, case in current.cases.items()
+        if name in baseline.cases
+    ]
@@ -0,0 +1,54 @@
+"""Offline stand-ins for the network and model backed services."""
+
+import hashlib
+import shutil
+from pathlib import Path
+
+from benchmarks.media import SAMPLE_SCRIPT, synthetic_words, write_subtitles
+from whisper_tiktok.interfaces.transcription_service import ITranscriptionService
+from whisper_tiktok.interfaces.tts_service import ITTSService, WordBoundary
+from whisper_tiktok.interfaces.video_downloader import IVideoDownloader
+
+
+class StubDownloader(IVideoDownloader):
+    """Downloader copying a local background instead of calling yt-dlp."""
+
+    def __init__(self, source: Path):
+        self.source = source
+
+    async def download(self, url: str, output_dir: Path, timeout=None) -> Path:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        video_id = hashlib.sha256(url.encode("utf-8")).hexdigest()[:11]
+        output = output_dir / f"{video_id}{self.source.suffix}"
+        shutil.copyfile(self.source, output)
+        return output
+
+
+class StubTTS(ITTSService):
+    """TTS copying a pre-rendered speech sample instead of calling edge-tts."""
+
+    def __init__(self, speech: Path, duration: float):
+        self.speech = speech
+        self.duration = duration
+
+    async def synthesize(self, text, output_file, voice, **options) -> None:
+        shutil.copyfile(self.speech, output_file)
+
+    async def synthesize_with_boundaries(
+        self, text, output_file, voice, **options
+    ) -> list[WordBoundary]:
+        await self.synthesize(text, output_file, voice)
+        return synthetic_words(text, self.duration)
+
+
+class StubTranscription(ITranscriptionService):
+    """Transcription writing evenly timed subtitles instead of running Whisper."""
+
+    def __init__(self, duration: float):
+        self.duration = duration
+
+    def transcribe(self, audio_file, srt_file, ass_file, model, options):
+        write_subtitles(
+            synthetic_words(SAMPLE_SCRIPT, self.duration), srt_file, ass_file
+        )
+        return srt_file, ass_file
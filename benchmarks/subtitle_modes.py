@@ -0,0 +1,134 @@
+"""Compare subtitle timings from edge-tts word boundaries against Whisper.
+
+The script synthesizes a script once with word boundaries, then transcribes the
+same audio with Whisper. It reports the runtime of both subtitle paths and how
+far apart the word timings of the two paths are.
+
+Usage:
+    python benchmarks/subtitle_modes.py --model small --runs 3
+"""
+
+import asyncio
+import difflib
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import stable_whisper
+import typer
+
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+from whisper_tiktok.services.tts_service import TTSService
+from whisper_tiktok.services.word_subtitle_service import WordSubtitleService
+
+SAMPLE_TEXT = (
+    "Whisper TikTok turns a short script into a narrated video. "
+    "The narration is synthesized, subtitles are timed word by word, "
+    "and everything is rendered on top of a background clip in one go."
+)
+
+logger = logging.getLogger("whisper_tiktok.benchmarks")
+
+
+def _normalize(word: str) -> str:
+    return "".join(c for c in word.lower() if c.isalnum())
+
+
+def compare_timings(
+    reference: list[WordBoundary], words: list[WordBoundary]
+) -> dict[str, float]:
+    """Match words of two timings and summarize their start/end differences."""
+    matcher = difflib.SequenceMatcher(
+        a=[_normalize(w.text) for w in reference],
+        b=[_normalize(w.text) for w in words],
+        autojunk=False,
+    )
+    start_ms, end_ms = [], []
+    for block in matcher.get_matching_blocks():
+        for offset in range(block.size):
+            ref = reference[block.a + offset]
+            other = words[block.b + offset]
+            start_ms.append(abs(ref.start - other.start) * 1000)
+            end_ms.append(abs(ref.end - other.end) * 1000)
+
+    def p95(values: list[float]) -> float:
+        return statistics.quantiles(values, n=20)[-1] if len(values) > 1 else 0.0
+
+    return {
+        "matched_words": len(start_ms),
+        "match_ratio": len(start_ms) / max(len(reference), 1),
+        "start_mean_ms": statistics.fmean(start_ms) if start_ms else 0.0,
+        "start_p95_ms": p95(start_ms),
+        "end_mean_ms": statistics.fmean(end_ms) if end_ms else 0.0,
+        "end_p95_ms": p95(end_ms),
+    }
+
+
+def _whisper_words(result) -> list[WordBoundary]:
+    return [WordBoundary(w.word, w.start, w.end) for w in result.all_words()]
+
+
+def main(
+    text: str = typer.Option(SAMPLE_TEXT, help="Script to synthesize"),
+    voice: str = typer.Option("en-US-ChristopherNeural", help="TTS voice"),
+    model: str = typer.Option("small", help="Whisper model size"),
+    runs: int = typer.Option(3, min=1, help="Timed runs per subtitle mode"),
+    output: Path | None = typer.Option(None, help="Write the results as JSON"),
+):
+    """Benchmark TTS word-boundary subtitles against Whisper transcription."""
+    tts = TTSService(logger)
+    subtitles = WordSubtitleService(logger)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        audio = workdir / "speech.mp3"
+
+        # Synthesis costs the same in both modes, only the subtitle step differs
+        started = time.perf_counter()
+        boundaries = asyncio.run(tts.synthesize_with_boundaries(text, audio, voice))
+        synthesis_seconds = time.perf_counter() - started
+
+        tts_seconds = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subtitles.write(
+                boundaries, workdir / "tts.srt", workdir / "tts.ass", options={}
+            )
+            tts_seconds.append(time.perf_counter() - started)
+
+        # Model loading is part of the cost the TTS mode avoids
+        started = time.perf_counter()
+        whisper_model = stable_whisper.load_model(model)
+        load_seconds = time.perf_counter() - started
+
+        whisper_seconds = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = whisper_model.transcribe(
+                audio.as_posix(), regroup=True, word_timestamps=True
+            )
+            result.to_srt_vtt((workdir / "whisper.srt").as_posix(), word_level=True)
+            result.to_ass((workdir / "whisper.ass").as_posix(), word_level=True)
+            whisper_seconds.append(time.perf_counter() - started)
+
+    report = {
+        "words": len(boundaries),
+        "synthesis_seconds": synthesis_seconds,
+        "tts": {"median_seconds": statistics.median(tts_seconds)},
+        "whisper": {
+            "model": model,
+            "load_seconds": load_seconds,
+            "median_seconds": statistics.median(whisper_seconds),
+        },
+        "timing_difference": compare_timings(boundaries, _whisper_words(result)),
+    }
+    typer.echo(json.dumps(report, indent=2))
+    if output is not None:
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    typer.run(main)
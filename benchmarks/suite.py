@@ -0,0 +1,217 @@
+"""Benchmark cases timing the pipeline on synthetic media."""
+
+import contextlib
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from dependency_injector import providers
+
+from benchmarks.media import (
+    SAMPLE_SCRIPT,
+    make_background,
+    make_speech,
+    synthetic_words,
+    write_subtitles,
+)
+from benchmarks.results import BenchmarkRun
+from benchmarks.stubs import StubDownloader, StubTranscription, StubTTS
+from whisper_tiktok.container import Container
+from whisper_tiktok.execution.command_executor import CommandExecutor
+from whisper_tiktok.main import Application
+from whisper_tiktok.services.ffmpeg_service import FFmpegService, MediaInfo
+from whisper_tiktok.services.media_probe import probe_native
+from whisper_tiktok.services.render_profile import load_render_profile
+
+logger = logging.getLogger("whisper_tiktok.benchmarks")
+
+
+@contextlib.contextmanager
+def working_directory(path: Path):
+    """Temporarily change the working directory, where video.json is read."""
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+
+class BenchmarkSuite:
+    """Times the pipeline stages on locally generated media.
+
+    Args:
+        workdir: Scratch directory for the synthetic media and the runs.
+        videos: Number of videos per batch in the full pipeline runs.
+        repeat: Number of timed runs per case.
+        profile: Render profile used by the compositions.
+        whisper: "stub" to skip Whisper, or the name of a Whisper model.
+        speech_seconds: Length of the synthetic narration.
+        background_seconds: Length of the synthetic background.
+    """
+
+    def __init__(
+        self,
+        workdir: Path,
+        videos: int = 4,
+        repeat: int = 3,
+        profile: str = "draft",
+        whisper: str = "stub",
+        speech_seconds: float = 20,
+        background_seconds: float = 120,
+    ):
+        self.workdir = workdir
+        self.videos = videos
+        self.repeat = repeat
+        self.profile = profile
+        self.whisper = whisper
+        self.speech_seconds = speech_seconds
+        self.background_seconds = background_seconds
+        self.executor = CommandExecutor(logger)
+        self.ffmpeg = FFmpegService(
+            self.executor, logger, render_profile=load_render_profile(profile)
+        )
+
+    async def run(self) -> BenchmarkRun:
+        """Generate the media and run every case."""
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self.background = await make_background(
+            self.executor, self.workdir / "background.mp4", self.background_seconds
+        )
+        self.speech = await make_speech(
+            self.executor, self.workdir / "speech.mp3", self.speech_seconds
+        )
+
+        result = BenchmarkRun(
+            params={
+                "videos": self.videos,
+                "repeat": self.repeat,
+                "profile": self.profile,
+                "whisper": self.whisper,
+                "speech_seconds": self.speech_seconds,
+                "background_seconds": self.background_seconds,
+            }
+        )
+        await self._bench_probing(result)
+        await self._bench_compose(result)
+        await self._bench_application(result)
+        return result
+
+    async def _time(self, case: Callable[[int], Awaitable[None]]) -> list[float]:
+        runs = []
+        for attempt in range(self.repeat):
+            started = time.perf_counter()
+            await case(attempt)
+            runs.append(time.perf_counter() - started)
+        return runs
+
+    async def _bench_probing(self, result: BenchmarkRun) -> None:
+        info = await self.ffmpeg.get_media_info(self.speech)
+
+        async def parse(_: int) -> None:
+            for _ in range(1000):
+                MediaInfo(info.return_code, info.json, info.error).duration
+
+        async def probe(_: int) -> None:
+            await self.ffmpeg.get_media_info(self.speech)
+
+        async def keyframes(_: int) -> None:
+            await self.ffmpeg.probe_keyframes(self.background)
+
+        async def native(_: int) -> None:
+            for path in (self.speech, self.background):
+                probe_native(path)
+
+        result.add("media_info.duration_x1000", await self._time(parse))
+        result.add("ffprobe.media_info", await self._time(probe))
+        result.add("native_probe.mp3_mp4", await self._time(native))
+        result.add("ffprobe.keyframes", await self._time(keyframes))
+
+    async def _bench_compose(self, result: BenchmarkRun) -> None:
+        srt_file = self.workdir / "subtitles.srt"
+        ass_file = self.workdir / "subtitles.ass"
+        write_subtitles(
+            synthetic_words(SAMPLE_SCRIPT, self.speech_seconds), srt_file, ass_file
+        )
+        duration = MediaInfo.convert_time(self.speech_seconds)
+
+        async def compose(attempt: int) -> None:
+            await self.ffmpeg.compose_video(
+                background=self.background,
+                audio=self.speech,
+                subtitles=ass_file,
+                output=self.workdir / f"compose-{attempt}.mp4",
+                start_time=0,
+                duration=duration,
+            )
+
+        result.add(f"compose_video.{self.profile}", await self._time(compose))
+
+    def _container(self, workspace: Path) -> Container:
+        container = Container()
+        container.workspace_path.override(providers.Object(workspace))
+        container.video_downloader.override(
+            providers.Factory(StubDownloader, source=self.background)
+        )
+        container.tts_backend.override(
+            providers.Factory(StubTTS, speech=self.speech, duration=self.speech_seconds)
+        )
+        if self.whisper == "stub":
+            container.transcription_service.override(
+                providers.Factory(StubTranscription, duration=self.speech_seconds)
+            )
+        container.config.from_dict(
+            {
+                "model": "tiny" if self.whisper == "stub" else self.whisper,
+                "background_url": "https://example.invalid/background",
+                "tts_voice": "en-US-ChristopherNeural",
+                "Fontname": "Arial",
+                "Fontsize": 21,
+                "highlight_color": "00F0FF",
+                "Alignment": 5,
+                "render_profile": self.profile,
+                "background_seek": "round-robin",
+                "on_error": "abort",
+                "metrics_dir": workspace / "metrics",
+            }
+        )
+        return container
+
+    async def _bench_application(self, result: BenchmarkRun) -> None:
+        strategy_runs: dict[str, list[float]] = {}
+
+        async def pipeline(attempt: int) -> None:
+            # A fresh workspace per run keeps every cache cold
+            workspace = self.workdir / f"batch-{attempt}"
+            workspace.mkdir()
+            videos = [
+                {
+                    "series": "Benchmark",
+                    "part": f"Part {i + 1}",
+                    "text": SAMPLE_SCRIPT,
+                    "outro": f"Video {i + 1}",
+                    "tags": [],
+                }
+                for i in range(self.videos)
+            ]
+            (workspace / "video.json").write_text(json.dumps(videos), encoding="utf-8")
+
+            container = self._container(workspace)
+            with working_directory(workspace):
+                report = await Application(container, logger).run()
+            if report.failed:
+                raise RuntimeError(f"Benchmark batch failed: {report.failures}")
+
+            histogram = container.metrics().histogram(
+                "whisper_tiktok_strategy_duration_seconds", ""
+            )
+            for labels, cumulative, total in histogram.samples():
+                name = dict(labels)["strategy"]
+                strategy_runs.setdefault(name, []).append(total / cumulative[-1])
+
+        result.add(f"application.run.{self.videos}_videos", await self._time(pipeline))
+        for name, runs in strategy_runs.items():
+            result.add(f"strategy.{name}", runs)
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+
+import pytest
+
+from whisper_tiktok.execution.batch_scheduler import BatchScheduler, FailurePolicy
+from whisper_tiktok.processors.video_processor import VideoProcessor
+from whisper_tiktok.strategies.processing_strategy import (
+    ProcessingContext,
+    ProcessingStrategy,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _SleepStrategy(ProcessingStrategy):
+    def __init__(self, stage: str, tracker: dict, requires: set[str] = frozenset()):
+        self.stage = stage
+        self.tracker = tracker
+        self.requires = frozenset(requires)
+        self.provides = frozenset({stage})
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        if context.video_data.get("fail_at") == self.stage:
+            raise RuntimeError(f"boom at {self.stage}")
+        running = self.tracker.setdefault(self.stage, [0, 0])
+        running[0] += 1
+        running[1] = max(running[1], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        context.artifacts[self.stage] = True
+        return context
+
+
+class _FakeFactory:
+    def __init__(self, tmp_path, tracker: dict):
+        self.tmp_path = tmp_path
+        self.tracker = tracker
+
+    def create_processors(self, videos, config: dict):
+        for video_data in videos:
+            yield self.create_processor(video_data, config)
+
+    def create_processor(self, video_data: dict, config: dict) -> VideoProcessor:
+        return VideoProcessor(
+            uuid=str(video_data["id"]),
+            video_data=video_data,
+            config={**config, "workspace_path": self.tmp_path},
+            strategies=[
+                _SleepStrategy("download", self.tracker),
+                _SleepStrategy("tts", self.tracker),
+                _SleepStrategy("transcription", self.tracker, {"tts"}),
+                _SleepStrategy(
+                    "composition", self.tracker, {"download", "transcription"}
+                ),
+            ],
+            logger=logger,
+        )
+
+
+def test_stage_limits_are_respected(tmp_path):
+    tracker: dict = {}
+    scheduler = BatchScheduler(
+        _FakeFactory(tmp_path, tracker),
+        config={},
+        logger=logger,
+        stage_limits={"tts": 3, "transcription": 1, "composition": 2},
+        queue_size=1,
+    )
+
+    report = asyncio.run(scheduler.run({"id": i} for i in range(10)))
+
+    assert report.succeeded == 10
+    assert tracker["download"][1] == 1
+    assert tracker["tts"][1] <= 3
+    assert tracker["transcription"][1] == 1
+    assert tracker["composition"][1] <= 2
+
+
+def test_skip_policy_keeps_processing(tmp_path):
+    videos = [{"id": i} for i in range(5)]
+    videos[2]["fail_at"] = "transcription"
+    scheduler = BatchScheduler(
+        _FakeFactory(tmp_path, {}),
+        config={},
+        logger=logger,
+        failure_policy=FailurePolicy.SKIP,
+    )
+
+    report = asyncio.run(scheduler.run(videos))
+
+    assert report.succeeded == 4
+    assert [(f.index, f.stage) for f in report.failures] == [(3, "transcription")]
+
+
+def test_retries_rerun_only_missing_artifacts(tmp_path):
+    attempts = []
+
+    class _FlakyStrategy(_SleepStrategy):
+        async def execute(self, context):
+            attempts.append(context.uuid)
+            if len(attempts) == 1:
+                raise RuntimeError("transient")
+            return await super().execute(context)
+
+    tracker: dict = {}
+    factory = _FakeFactory(tmp_path, tracker)
+    original = factory.create_processor
+
+    def create_processor(video_data, config):
+        processor = original(video_data, config)
+        processor.strategies[3] = _FlakyStrategy(
+            "composition", tracker, {"download", "transcription"}
+        )
+        return processor
+
+    factory.create_processor = create_processor
+    scheduler = BatchScheduler(factory, config={}, logger=logger, max_retries=1)
+
+    report = asyncio.run(scheduler.run([{"id": 0}]))
+
+    assert report.succeeded == 1
+    assert attempts == ["0", "0"]
+
+
+def test_abort_policy_raises_original_error(tmp_path):
+    videos = [{"id": 0, "fail_at": "tts"}, {"id": 1}]
+    scheduler = BatchScheduler(
+        _FakeFactory(tmp_path, {}),
+        config={},
+        logger=logger,
+        failure_policy=FailurePolicy.ABORT,
+    )
+
+    with pytest.raises(RuntimeError, match="boom at tts"):
+        asyncio.run(scheduler.run(videos))
@@ -0,0 +1,43 @@
+from benchmarks.results import BenchmarkRun, compare_runs
+
+
+def test_regressions_above_threshold_are_flagged(tmp_path):
+    baseline = BenchmarkRun()
+    baseline.add("compose", [1.0, 1.1, 0.9])
+    baseline.add("probe", [0.2, 0.2, 0.2])
+    baseline.save(tmp_path / "baseline.json")
+
+    current = BenchmarkRun()
+    current.add("compose", [1.3, 1.2, 1.25])
+    current.add("probe", [0.21, 0.2, 0.21])
+    current.add("new_case", [1.0])
+
+    comparisons = compare_runs(
+        BenchmarkRun.load(tmp_path / "baseline.json"), current, threshold=0.1
+    )
+
+    assert [(c.name, c.regressed) for c in comparisons] == [
+        ("compose", True),
+        ("probe", False),
+    ]
+
+
+def test_timestamp_drift_matches_words_across_transcriptions():
+    from benchmarks.quantization import TimedWord, timestamp_drift
+
+    reference = [
+        TimedWord(" Hello", 0.0, 0.4),
+        TimedWord(" big", 0.5, 0.7),
+        TimedWord(" world.", 0.8, 1.2),
+    ]
+    candidate = [
+        TimedWord(" hello", 0.1, 0.4),
+        TimedWord(" World", 0.8, 1.5),
+    ]
+
+    drift = timestamp_drift(reference, candidate)
+
+    assert drift.matched == 2
+    assert abs(drift.match_ratio - 2 / 3) < 1e-9
+    assert abs(drift.max_start - 0.1) < 1e-9
+    assert abs(drift.max_end - 0.3) < 1e-9
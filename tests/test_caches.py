@@ -0,0 +1,149 @@
+import asyncio
+import logging
+
+from whisper_tiktok.interfaces.tts_service import ITTSService, WordBoundary
+from whisper_tiktok.repositories.background_cache import BackgroundCache
+from whisper_tiktok.repositories.background_proxy_cache import BackgroundProxyCache
+from whisper_tiktok.repositories.cache_index import CacheIndex
+from whisper_tiktok.repositories.keyframe_index import KeyframeIndex
+from whisper_tiktok.services.cached_tts_service import CachedTTSService
+from whisper_tiktok.services.ffmpeg_service import BackgroundFilter
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _FakeDownloader:
+    def __init__(self, size=10):
+        self.calls = []
+        self.size = size
+
+    async def download(self, url, output_dir):
+        self.calls.append(url)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        video = output_dir / f"{url.rsplit('=', 1)[-1]}.mp4"
+        video.write_bytes(b"x" * self.size)
+        return video
+
+
+def test_background_downloads_are_shared_and_persisted(tmp_path):
+    downloader = _FakeDownloader()
+    cache = BackgroundCache(tmp_path, downloader, logger)
+
+    async def fetch_twice():
+        return await asyncio.gather(cache.get("yt?v=abc"), cache.get("yt?v=abc"))
+
+    first, second = asyncio.run(fetch_twice())
+    reopened = BackgroundCache(tmp_path, downloader, logger)
+    third = asyncio.run(reopened.get("yt?v=abc"))
+
+    assert downloader.calls == ["yt?v=abc"]
+    assert first == second == third
+    assert third.id == "abc" and third.size == 10 and len(third.sha256) == 64
+
+
+def test_background_eviction_removes_the_keyframe_index(tmp_path):
+    cache = BackgroundCache(tmp_path, _FakeDownloader(size=600 * 1024), logger, 1)
+    first = asyncio.run(cache.get("yt?v=abc"))
+    sidecar = KeyframeIndex.sidecar_of(first.path)
+    sidecar.write_text("{}", encoding="utf-8")
+
+    asyncio.run(cache.get("yt?v=def"))
+
+    assert not first.path.exists() and not sidecar.exists()
+
+
+def test_cache_index_evicts_least_recently_used(tmp_path):
+    index = CacheIndex(tmp_path, logger, max_bytes=25)
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 10)
+        index.put(name, path)
+        if name == "b":
+            index.get("a")
+
+    assert "b" not in index
+    assert not (tmp_path / "b").exists()
+    assert index.get("a") is not None and index.get("c") is not None
+
+
+class _FakeTTS(ITTSService):
+    def __init__(self):
+        self.calls = []
+
+    async def synthesize(self, text, output_file, voice, **options):
+        self.calls.append(text)
+        await asyncio.sleep(0.01)
+        output_file.write_bytes(text.encode())
+
+
+def test_tts_cache_reuses_audio_for_equivalent_scripts(tmp_path):
+    backend = _FakeTTS()
+    tts = CachedTTSService(backend, tmp_path / "cache", logger)
+
+    async def run():
+        await asyncio.gather(
+            tts.synthesize("Hello  world\n", tmp_path / "a.mp3", "voice"),
+            tts.synthesize("Hello world", tmp_path / "b.mp3", "voice"),
+        )
+        await tts.synthesize("Hello world", tmp_path / "c.mp3", "voice")
+        await tts.synthesize("Hello world", tmp_path / "d.mp3", "other-voice")
+
+    asyncio.run(run())
+
+    assert len(backend.calls) == 2
+    assert (tmp_path / "c.mp3").read_bytes() == (tmp_path / "a.mp3").read_bytes()
+    assert (tts.stats.hits, tts.stats.misses) == (1, 3)
+
+
+class _FakeWordTTS(_FakeTTS):
+    async def synthesize_with_boundaries(self, text, output_file, voice, **options):
+        await self.synthesize(text, output_file, voice)
+        return [
+            WordBoundary(word, float(i), i + 0.5) for i, word in enumerate(text.split())
+        ]
+
+
+def test_tts_cache_keeps_word_boundaries(tmp_path):
+    backend = _FakeWordTTS()
+    tts = CachedTTSService(backend, tmp_path / "cache", logger)
+
+    async def run():
+        await tts.synthesize("Hello world", tmp_path / "a.mp3", "voice")
+        return await tts.synthesize_with_boundaries(
+            "Hello world", tmp_path / "b.mp3", "voice"
+        )
+
+    words = asyncio.run(run())
+
+    assert len(backend.calls) == 1
+    assert words == [WordBoundary("Hello", 0.0, 0.5), WordBoundary("world", 1.0, 1.5)]
+
+
+class _FakeFFmpeg:
+    def __init__(self, blur_sigma=2):
+        self.background_filter = BackgroundFilter(blur_sigma=blur_sigma)
+        self.built = []
+
+    async def build_proxy(self, background, output, timeout=None):
+        self.built.append(background.name)
+        await asyncio.sleep(0.01)
+        output.write_bytes(background.read_bytes())
+        return output
+
+
+def test_proxy_cache_builds_each_background_once(tmp_path):
+    background = tmp_path / "bg.mp4"
+    background.write_bytes(b"video")
+    ffmpeg = _FakeFFmpeg()
+    cache = BackgroundProxyCache(tmp_path / "proxy", ffmpeg, logger)
+
+    async def run():
+        return await asyncio.gather(*(cache.get(background, "abc") for _ in range(3)))
+
+    proxies = asyncio.run(run())
+
+    assert ffmpeg.built == ["bg.mp4"]
+    assert len(set(proxies)) == 1 and proxies[0].read_bytes() == b"video"
+    # Changing the filter parameters invalidates the proxy
+    other = BackgroundProxyCache(tmp_path / "proxy", _FakeFFmpeg(blur_sigma=0), logger)
+    assert other.cache_key("abc") != cache.cache_key("abc")
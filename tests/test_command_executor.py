@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from whisper_tiktok.execution.command_executor import (
+    CommandExecutor,
+    CommandTimeoutError,
+)
+from whisper_tiktok.services.ffmpeg_progress import FFmpegProgressParser
+
+logger = logging.getLogger("whisper_tiktok.tests")
+SLEEP = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+def test_execute_captures_output():
+    executor = CommandExecutor(logger)
+
+    result = asyncio.run(
+        executor.execute([sys.executable, "-c", "print('out'); exit(3)"])
+    )
+
+    assert result.returncode == 3
+    assert result.stdout.strip() == "out"
+
+
+def test_stdout_is_kept_as_written():
+    executor = CommandExecutor(logger)
+    script = "import sys; sys.stdout.write('{' + 'x' * 200000 + '}\\n\\n\\rend')"
+
+    result = asyncio.run(executor.execute([sys.executable, "-c", script]))
+
+    assert result.stdout == "{" + "x" * 200000 + "}\n\n\rend"
+
+
+def test_timeout_kills_child_process():
+    executor = CommandExecutor(logger)
+    start = time.monotonic()
+
+    with pytest.raises(CommandTimeoutError):
+        asyncio.run(executor.execute(SLEEP, timeout=0.2))
+
+    assert time.monotonic() - start < 10
+
+
+def test_commands_do_not_block_the_event_loop():
+    executor = CommandExecutor(logger)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    async def run():
+        task = asyncio.create_task(executor.execute(SLEEP))
+        await ticker()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert len(ticks) == 5
+
+
+def test_stderr_is_bounded_and_stdout_is_streamed():
+    executor = CommandExecutor(logger, stderr_lines=3)
+    lines = []
+    script = (
+        "import sys\n"
+        "for i in range(1000): print(f'err {i}', file=sys.stderr)\n"
+        "print('a'); print('b', end='\\r'); print('c')\n"
+    )
+
+    result = asyncio.run(
+        executor.execute([sys.executable, "-c", script], on_stdout_line=lines.append)
+    )
+
+    assert result.stderr.splitlines() == ["err 997", "err 998", "err 999"]
+    assert lines == ["a", "b", "c"]
+    assert result.stdout == ""
+
+
+def test_ffmpeg_progress_parser():
+    events = []
+    parser = FFmpegProgressParser(Path("out.mp4"), events.append, total_duration=10)
+    report = "frame=120\nfps=60.0\nout_time_us=4000000\nspeed=2.5x\nprogress=continue"
+    for line in (report + "\nframe=300\nout_time_us=N/A\nprogress=end").splitlines():
+        parser.feed(line)
+
+    assert [(e.frame, e.out_time, e.speed, e.percent) for e in events] == [
+        (120, 4.0, 2.5, 40.0),
+        (300, 0.0, None, 100.0),
+    ]
@@ -1,5 +1,40 @@
+import subprocess
+import sys
+
 import whisper_tiktok
 
+# Backends that must only be imported by the code paths using them
+HEAVY_MODULES = {"torch", "whisper", "stable_whisper", "edge_tts", "pandas"}
+
+# Cap on the cumulative import time of the CLI, measured by the interpreter
+# rather than a wall clock. The CLI imports in about 0.3s, torch alone takes
+# several seconds, so the cap leaves room for slow CI machines.
+STARTUP_BUDGET_US = 2_000_000
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time of every module imported by ``module``, in µs."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
 
 def test_whisper_tiktok_import():
     assert whisper_tiktok is not None
+
+
+def test_cli_startup_skips_heavy_backends():
+    times = _import_times("whisper_tiktok.main")
+
+    assert not HEAVY_MODULES & times.keys()
+    assert times["whisper_tiktok.main"] < STARTUP_BUDGET_US
@@ -0,0 +1,36 @@
+import json
+import logging
+
+import pytest
+
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+from whisper_tiktok.repositories.job_manifest import (
+    JobManifest,
+    decode_artifact,
+    encode_artifact,
+)
+from whisper_tiktok.services.silence_trimmer import SpeechMap
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+def test_only_known_artifact_types_are_rebuilt(tmp_path):
+    artifacts = {
+        "audio_file": tmp_path / "job.wav",
+        "word_boundaries": [WordBoundary("Hello", 0.5, 1.5)],
+        "speech_map": SpeechMap(((0.35, 1.65),), 2.0),
+    }
+    decoded = decode_artifact(encode_artifact(artifacts))
+    assert decoded["audio_file"] == artifacts["audio_file"]
+    assert decoded["word_boundaries"] == artifacts["word_boundaries"]
+    assert decoded["speech_map"].trimmed_duration == pytest.approx(1.3)
+
+    forged = {"__dataclass__": "subprocess:Popen", "fields": {"args": ["true"]}}
+    with pytest.raises(ValueError):
+        decode_artifact(forged)
+
+    # A manifest written by someone else is ignored, not imported
+    path = tmp_path / "manifest.json"
+    entry = {"inputs": "digest", "artifacts": {"__dict__": {"bad": forged}}}
+    path.write_text(json.dumps({"steps": {"step": entry}}), encoding="utf-8")
+    assert JobManifest(path, logger).lookup("step", "digest") is None
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+
+from whisper_tiktok.execution.queue_worker import QueueWorker
+from whisper_tiktok.processors.video_processor import VideoProcessor
+from whisper_tiktok.repositories.job_queue import JobQueue
+from whisper_tiktok.strategies.processing_strategy import (
+    ProcessingContext,
+    ProcessingStrategy,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+VIDEOS = [{"series": "Queue", "part": str(i)} for i in range(6)]
+
+
+class _WriteStrategy(ProcessingStrategy):
+    requires = frozenset()
+    provides = frozenset({"final_video"})
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        if context.video_data.get("fail"):
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.01)
+        output = context.output_path / f"{context.uuid}.mp4"
+        output.write_text(context.video_data["part"])
+        context.artifacts["final_video"] = output
+        return context
+
+
+class _Factory:
+    def create_processor(
+        self, video_data: dict, config: dict, uuid_str: str
+    ) -> VideoProcessor:
+        if "part" not in video_data:
+            raise KeyError("part")
+        return VideoProcessor(
+            uuid=uuid_str,
+            video_data=video_data,
+            config=config,
+            strategies=[_WriteStrategy()],
+            logger=logger,
+        )
+
+
+def _worker(queue: JobQueue, tmp_path, worker_id: str) -> QueueWorker:
+    return QueueWorker(
+        queue, _Factory(), {}, logger, worker_id, tmp_path / "jobs", poll_interval=0
+    )
+
+
+def test_expired_leases_are_claimed_again(tmp_path):
+    queue = JobQueue(
+        tmp_path / "queue.sqlite", logger, lease_seconds=0.5, max_attempts=2
+    )
+    assert queue.enqueue(VIDEOS[:1]) == 1
+    assert queue.enqueue(VIDEOS[:1]) == 0
+
+    job = queue.claim("crashed")
+    assert queue.claim("other") is None
+    assert queue.heartbeat(job.id, "crashed")
+
+    # Let the lease expire without any heartbeat
+    time.sleep(0.6)
+    again = queue.claim("other")
+
+    assert again.id == job.id and again.attempts == 2
+    assert not queue.heartbeat(job.id, "crashed")
+    assert not queue.fail(again.id, "other", "boom")
+    assert queue.counts()["failed"] == 1
+
+
+def test_workers_share_the_queue(tmp_path):
+    queue = JobQueue(tmp_path / "queue.sqlite", logger)
+    queue.enqueue([*VIDEOS, {"series": "Queue", "part": "x", "fail": True}])
+
+    async def run_workers():
+        return await asyncio.gather(
+            _worker(queue, tmp_path, "w1").run(), _worker(queue, tmp_path, "w2").run()
+        )
+
+    reports = asyncio.run(run_workers())
+
+    assert sum(report.succeeded for report in reports) == len(VIDEOS)
+    assert queue.counts() == {"queued": 0, "leased": 0, "done": 6, "failed": 1}
+    assert sum(row.done for row in queue.throughput()) == len(VIDEOS)
+    for video in VIDEOS:
+        job = JobQueue.job_id(video)
+        output = tmp_path / "jobs" / job / "output" / job
+        assert (output / f"{job}.mp4").read_text() == video["part"]
+
+
+def test_max_jobs_caps_concurrent_claims(tmp_path):
+    queue = JobQueue(tmp_path / "queue.sqlite", logger)
+    queue.enqueue(VIDEOS)
+    worker = QueueWorker(
+        queue,
+        _Factory(),
+        {},
+        logger,
+        "w1",
+        tmp_path / "jobs",
+        concurrency=4,
+        max_jobs=2,
+        poll_interval=0,
+    )
+
+    report = asyncio.run(worker.run())
+
+    assert report.succeeded == 2
+    assert queue.counts()["queued"] == len(VIDEOS) - 2
+
+
+def test_jobs_failing_before_their_pipeline_are_failed(tmp_path):
+    queue = JobQueue(tmp_path / "queue.sqlite", logger, max_attempts=1)
+    queue.enqueue([{"series": "Queue"}, *VIDEOS[:2]])
+
+    report = asyncio.run(_worker(queue, tmp_path, "w1").run())
+
+    assert report.succeeded == 2 and report.failed == 1
+    assert queue.counts() == {"queued": 0, "leased": 0, "done": 2, "failed": 1}
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import logging
+import os
+import struct
+import wave
+
+import pytest
+
+from whisper_tiktok.execution.command_executor import ExecutionResult
+from whisper_tiktok.services.ffmpeg_service import MediaInfo
+from whisper_tiktok.services.media_probe import MediaProber, probe_native
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+# MPEG 2 layer III, 48 kbit/s, 24 kHz, mono: the edge-tts format
+MP3_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC0])
+MP3_FRAME = 144
+
+
+def _mp3(frames: int, xing_frames: int | None = None) -> bytes:
+    id3 = b"ID3\x04\x00\x00" + bytes([0, 0, 0, 20]) + b"\x00" * 20
+    first = bytearray(MP3_HEADER + b"\x00" * (MP3_FRAME - 4))
+    if xing_frames is not None:
+        first[13:25] = b"Xing" + struct.pack(">II", 1, xing_frames)
+    frame = MP3_HEADER + b"\x00" * (MP3_FRAME - 4)
+    return id3 + bytes(first) + frame * (frames - 1)
+
+
+def _box(kind: bytes, *children: bytes) -> bytes:
+    payload = b"".join(children)
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _track(handler: bytes, entry: bytes, timescale: int, duration: int) -> bytes:
+    mdhd = _box(b"mdhd", b"\x00" * 12 + struct.pack(">II", timescale, duration))
+    hdlr = _box(b"hdlr", b"\x00" * 8 + handler + b"\x00" * 12)
+    stsd = _box(b"stsd", struct.pack(">II", 0, 1) + entry)
+    stbl = _box(b"stbl", stsd)
+    return _box(b"trak", _box(b"mdia", mdhd, hdlr, _box(b"minf", stbl)))
+
+
+def _mp4() -> bytes:
+    video = _box(b"avc1", b"\x00" * 24 + struct.pack(">HH", 1920, 1080) + b"\x00" * 50)
+    audio = _box(
+        b"mp4a", b"\x00" * 16 + struct.pack(">HHHHI", 2, 16, 0, 0, 44100 << 16)
+    )
+    moov = _box(
+        b"moov",
+        _box(b"mvhd", b"\x00" * 12 + struct.pack(">II", 1000, 12500) + b"\x00" * 80),
+        _track(b"vide", video, 15360, 192000),
+        _track(b"soun", audio, 44100, 551250),
+    )
+    return _box(b"ftyp", b"isom") + _box(b"mdat", b"\x00" * 4096) + moov
+
+
+def test_native_probes_read_headers(tmp_path):
+    scanned = tmp_path / "scanned.mp3"
+    scanned.write_bytes(_mp3(100))
+    tagged = tmp_path / "tagged.mp3"
+    tagged.write_bytes(_mp3(100, xing_frames=250))
+    narration = tmp_path / "narration.wav"
+    with wave.open(str(narration), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(24000)
+        wav.writeframes(b"\x00\x00" * 36000)
+    video = tmp_path / "video.mp4"
+    video.write_bytes(_mp4())
+
+    mp3 = probe_native(scanned)
+    assert mp3.audio.codec_name == "mp3" and mp3.audio.sample_rate == 24000
+    assert mp3.audio_duration == 100 * 576 / 24000
+    assert probe_native(tagged).audio_duration == 250 * 576 / 24000
+    assert probe_native(narration).audio_duration == 1.5
+    mp4 = probe_native(video)
+    assert mp4.duration == 12.5
+    assert (mp4.video.codec_name, mp4.video.width, mp4.video.height) == (
+        "h264",
+        1920,
+        1080,
+    )
+    assert (mp4.audio.codec_name, mp4.audio.channels) == ("aac", 2)
+    assert mp4.audio_duration == 12.5
+
+
+class _FFprobe:
+    def __init__(self):
+        self.calls = 0
+
+    async def execute(self, command, timeout=None, on_stdout_line=None):
+        self.calls += 1
+        output = {
+            "streams": [{"codec_type": "audio", "codec_name": "opus", "duration": "3"}],
+            "format": {"format_name": "matroska,webm", "duration": "3.0"},
+        }
+        return ExecutionResult(returncode=0, stdout=json.dumps(output), stderr="")
+
+
+def test_probes_are_memoized_until_the_file_changes(tmp_path):
+    executor = _FFprobe()
+    prober = MediaProber(executor, logger)
+    narration = tmp_path / "narration.mp3"
+    narration.write_bytes(_mp3(10))
+    webm = tmp_path / "clip.webm"
+    webm.write_bytes(b"\x1a\x45\xdf\xa3")
+
+    async def probe_all():
+        return [await prober.probe(path) for path in (narration, webm, webm)]
+
+    first, clip, again = asyncio.run(probe_all())
+    assert executor.calls == 1 and clip is again
+    assert clip.audio_duration == 3.0
+
+    narration.write_bytes(_mp3(20))
+    os.utime(narration, ns=(0, 0))
+    changed = asyncio.run(prober.probe(narration))
+    assert changed.audio_duration == 2 * first.audio_duration
+
+    info = MediaInfo(0, json.dumps({"streams": [{"codec_type": "video"}]}), "")
+    with pytest.raises(ValueError):
+        info.duration
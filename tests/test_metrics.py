@@ -0,0 +1,44 @@
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from whisper_tiktok.execution.command_executor import CommandExecutor
+from whisper_tiktok.utils.metrics import MetricsRegistry
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+def test_histograms_and_counters_are_exported(tmp_path):
+    metrics = MetricsRegistry()
+    duration = metrics.histogram("step_seconds", "Step duration", buckets=(1, 10))
+    duration.observe(0.5, stage="tts")
+    duration.observe(5, stage="tts")
+    metrics.counter("steps_total", "Steps").inc(stage="tts", status="success")
+
+    metrics.write_textfile(tmp_path / "metrics.prom")
+    metrics.write_json(tmp_path / "metrics.json")
+
+    text = (tmp_path / "metrics.prom").read_text()
+    assert "# TYPE step_seconds histogram" in text
+    assert 'step_seconds_bucket{stage="tts",le="1"} 1' in text
+    assert 'step_seconds_bucket{stage="tts",le="+Inf"} 2' in text
+    assert 'step_seconds_sum{stage="tts"} 5.5' in text
+    assert 'steps_total{stage="tts",status="success"} 1' in text
+
+    summary = json.loads((tmp_path / "metrics.json").read_text())
+    assert summary["histograms"]["step_seconds"][0]["mean"] == 2.75
+
+
+def test_command_executor_records_commands():
+    metrics = MetricsRegistry()
+    executor = CommandExecutor(logger, metrics=metrics)
+
+    asyncio.run(executor.execute([sys.executable, "-c", "raise SystemExit(3)"]))
+
+    program = Path(sys.executable).stem
+    commands = metrics.counter("whisper_tiktok_commands_total", "")
+    durations = metrics.histogram("whisper_tiktok_command_duration_seconds", "")
+    assert commands.value(program=program, status="failure") == 1
+    assert durations.count(program=program) == 1
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+
+from whisper_tiktok.services.model_registry import ModelKey, WhisperModelRegistry
+
+logger = logging.getLogger("whisper_tiktok.tests")
+MIB = 1024 * 1024
+
+
+class _Tensor:
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+
+    def numel(self):
+        return self.nbytes
+
+    def element_size(self):
+        return 1
+
+
+class _Model:
+    def __init__(self, name, size_mb):
+        self.name = name
+        self.size_mb = size_mb
+
+    def parameters(self):
+        return [_Tensor(self.size_mb * MIB)]
+
+
+SIZES = {"tiny": 1, "base": 2, "small": 3}
+
+
+def _registry(budget_mb=None, evicted=None):
+    loads = []
+
+    def loader(name, device, precision):
+        loads.append(name)
+        return _Model(name, SIZES[name])
+
+    registry = WhisperModelRegistry(
+        loader, logger, memory_budget_mb=budget_mb, on_evict=evicted
+    )
+    return registry, loads
+
+
+def test_models_are_loaded_once():
+    registry, loads = _registry()
+
+    first = registry.get("tiny", "cpu")
+    second = registry.get("tiny", "cpu")
+    registry.get("tiny", "cpu", "fp16")
+
+    assert first is second
+    assert loads == ["tiny", "tiny"]
+    assert (registry.stats.hits, registry.stats.misses) == (1, 2)
+
+
+def test_least_recently_used_model_is_evicted():
+    evicted = []
+    registry, _ = _registry(budget_mb=5, evicted=evicted.append)
+
+    registry.get("tiny", "cpu")
+    registry.get("base", "cpu")
+    registry.get("tiny", "cpu")
+    registry.get("small", "cpu")
+
+    assert evicted == [ModelKey("base", "cpu", "fp32")]
+    assert ModelKey("tiny", "cpu", "fp32") in registry
+    assert registry.memory_used == 4 * MIB
+
+
+def test_inference_on_a_model_is_serialized():
+    registry, _ = _registry()
+    running, overlaps = [], []
+
+    def infer(name):
+        with registry.use(name, "cpu") as model:
+            running.append(model)
+            if sum(m is model for m in running) > 1:
+                overlaps.append(model.name)
+            time.sleep(0.02)
+            running.remove(model)
+
+    threads = [
+        threading.Thread(target=infer, args=(name,))
+        for name in ("tiny", "tiny", "tiny", "base")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == []
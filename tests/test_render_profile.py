@@ -0,0 +1,76 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from whisper_tiktok.services.ffmpeg_service import FFmpegService
+from whisper_tiktok.services.render_calibration import CalibrationResult
+from whisper_tiktok.services.render_profile import (
+    RENDER_PROFILES,
+    RenderProfileError,
+    load_output_variants,
+    load_render_profile,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+def test_profile_drives_filters_and_encoder():
+    service = FFmpegService(None, logger, render_profile=RENDER_PROFILES["draft"])
+
+    filters = service._build_video_filters(Path("subs.ass"))
+    command = service._build_ffmpeg_command(
+        Path("bg.mp4"), Path("a.mp3"), Path("out.mp4"), 0, "00:00:10.000", filters
+    )
+
+    assert "scale=w=540:h=960:flags=bilinear" in filters
+    assert command[command.index("-preset") + 1] == "ultrafast"
+    assert command[command.index("-crf") + 1] == "28"
+
+
+def test_calibrated_profile_is_loaded_from_file(tmp_path):
+    calibration_file = tmp_path / "render_calibration.json"
+    with pytest.raises(RenderProfileError):
+        load_render_profile("calibrated", calibration_file)
+
+    base = RENDER_PROFILES["standard"]
+    CalibrationResult(
+        profile=base.with_preset("veryfast", name="calibrated"),
+        measurements=[],
+        min_ssim=0.95,
+    ).save(calibration_file)
+
+    profile = load_render_profile("calibrated", calibration_file)
+    assert (profile.name, profile.preset, profile.crf) == ("calibrated", "veryfast", 23)
+
+
+def test_variants_share_one_decode(tmp_path):
+    subtitles = tmp_path / "subs.ass"
+    subtitles.write_text("[Script Info]\nPlayResX: 384\nPlayResY: 288\n")
+    service = FFmpegService(None, logger)
+    variants = load_output_variants(["reels", "feed", "reels"])
+
+    graph = service._build_variants_graph(subtitles, variants, prefiltered=False)
+    command = service._build_variants_command(
+        Path("bg.mp4"),
+        Path("a.mp3"),
+        Path("out.mp4"),
+        0,
+        "00:00:10.000",
+        graph,
+        variants,
+    )
+
+    assert command.count("-i") == 2
+    assert graph.count("gblur") == 1 and "split=3[v0][v1][v2]" in graph
+    assert "force_style='MarginV=58'" in graph
+    assert "crop=1080:1350" in graph and graph.count("crop=1080:1350") == 1
+    assert [a for a in command if a.endswith(".mp4")][1:] == [
+        "out.mp4",
+        "out.reels.mp4",
+        "out.feed.mp4",
+    ]
+    assert command[command.index("-maxrate") + 1] == "5M"
+    assert command.count("-threads") == 3
+    with pytest.raises(RenderProfileError):
+        load_output_variants(["vine"])
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+from whisper_tiktok.repositories.keyframe_index import KeyframeIndex
+from whisper_tiktok.services.segment_picker import BackgroundSeek, SegmentPicker
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _FakeFFmpeg:
+    def __init__(self):
+        self.probes = 0
+
+    async def probe_keyframes(self, file_path):
+        self.probes += 1
+        return [0.0, 10.0, 20.0, 30.0, 40.0], 50.0
+
+
+def test_keyframes_are_probed_once_and_stored_next_to_the_video(tmp_path):
+    video = tmp_path / "bg.mp4"
+    video.write_bytes(b"video")
+    ffmpeg = _FakeFFmpeg()
+
+    first = asyncio.run(KeyframeIndex(ffmpeg, logger).get(video))
+    second = asyncio.run(KeyframeIndex(ffmpeg, logger).get(video))
+
+    assert ffmpeg.probes == 1
+    assert (tmp_path / "bg.mp4.keyframes.json").is_file()
+    assert first == second and first.starts_fitting(15) == [0.0, 10.0, 20.0, 30.0]
+
+
+def test_round_robin_offsets_do_not_overlap(tmp_path):
+    video = tmp_path / "bg.mp4"
+    video.write_bytes(b"video")
+    picker = SegmentPicker(
+        KeyframeIndex(_FakeFFmpeg(), logger), logger, mode=BackgroundSeek.ROUND_ROBIN
+    )
+
+    async def run():
+        return [await picker.pick(video, 15) for _ in range(3)]
+
+    # The third video no longer fits after 20 + 15 s and wraps around
+    assert asyncio.run(run()) == [0.0, 20.0, 0.0]
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from whisper_tiktok.execution.command_executor import ExecutionResult
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+from whisper_tiktok.services.silence_trimmer import (
+    SilenceTrimmer,
+    SpeechMap,
+    detect_speech,
+)
+from whisper_tiktok.strategies.processing_strategy import (
+    ProcessingContext,
+    SilenceTrimStrategy,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+RATE = 16000
+
+
+def _narration(*parts: tuple[str, float]) -> np.ndarray:
+    """Tone bursts standing for speech between near silent pauses."""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for kind, seconds in parts:
+        n = int(seconds * RATE)
+        if kind == "speech":
+            chunks.append(8000 * np.sin(np.arange(n) * 2 * np.pi * 220 / RATE))
+        else:
+            chunks.append(rng.normal(0, 20, n))
+    return np.concatenate(chunks).astype(np.int16)
+
+
+SAMPLES = _narration(
+    ("silence", 0.5),
+    ("speech", 1.0),
+    ("silence", 1.2),
+    ("speech", 0.8),
+    ("silence", 0.6),
+)
+
+
+class _DecodingExecutor:
+    """Stands for ffmpeg, writing the PCM of SAMPLES to the requested file."""
+
+    def __init__(self):
+        self.commands = []
+
+    async def execute(self, command, timeout=None, on_stdout_line=None):
+        self.commands.append(command)
+        SAMPLES.astype("<i2").tofile(command[-2])
+        return ExecutionResult(returncode=0, stdout="", stderr="")
+
+
+def test_speech_regions_are_found_and_long_pauses_shortened():
+    speech = detect_speech(SAMPLES, RATE)
+
+    assert len(speech) == 2
+    assert abs(speech[0][0] - 0.5) < 0.03 and abs(speech[0][1] - 1.5) < 0.03
+    assert abs(speech[1][0] - 2.7) < 0.03 and abs(speech[1][1] - 3.5) < 0.03
+
+    speech_map = SpeechMap.build(speech, len(SAMPLES) / RATE, max_pause=0.3)
+
+    # 1.8s of speech, a 0.3s pause and 0.15s at both ends
+    assert abs(speech_map.trimmed_duration - 2.4) < 0.06
+    assert abs(speech_map.to_trimmed(1.0) - 0.65) < 0.03
+    assert abs(speech_map.to_trimmed(3.0) - 1.75) < 0.03
+
+
+def test_strategy_replaces_the_narration(tmp_path):
+    trimmer = SilenceTrimmer(_DecodingExecutor(), logger, sample_rate=RATE)
+    strategy = SilenceTrimStrategy(trimmer, logger, word_boundaries=True)
+    context = ProcessingContext(
+        video_data={},
+        uuid="job",
+        media_path=tmp_path,
+        output_path=tmp_path,
+        config={},
+        artifacts={
+            "audio_file": tmp_path / "job.mp3",
+            "word_boundaries": [WordBoundary("Hello", 0.5, 1.5)],
+        },
+    )
+
+    asyncio.run(strategy.execute(context))
+
+    trimmed = context.artifacts["audio_file"]
+    assert trimmed == tmp_path / "job.trimmed.wav"
+    with wave.open(str(trimmed)) as wav:
+        duration = wav.getnframes() / wav.getframerate()
+    assert abs(duration - context.artifacts["speech_map"].trimmed_duration) < 1e-3
+    word = context.artifacts["word_boundaries"][0]
+    assert abs(word.start - 0.15) < 0.03 and abs(word.end - 1.15) < 0.03
+    assert sorted(Path(tmp_path).iterdir()) == [trimmed]
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+
+from whisper_tiktok.interfaces.transcription_service import ITranscriptionService
+from whisper_tiktok.strategies.processing_strategy import (
+    ProcessingContext,
+    TranscriptionStrategy,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _FakeTranscription(ITranscriptionService):
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio_file, srt_file, ass_file, model, options):
+        self.calls.append(("transcribe",))
+        return srt_file, ass_file
+
+    def align(self, audio_file, text, srt_file, ass_file, model, options, **kwargs):
+        self.calls.append(("align", text, kwargs["language"]))
+        return srt_file, ass_file
+
+
+def _context(tmp_path, **artifacts) -> ProcessingContext:
+    return ProcessingContext(
+        video_data={},
+        uuid="job",
+        media_path=tmp_path,
+        output_path=tmp_path,
+        config={"model": "tiny", "tts_voice": "it-IT-DiegoNeural"},
+        artifacts=artifacts,
+    )
+
+
+def test_alignment_uses_the_tts_script(tmp_path):
+    service = _FakeTranscription()
+    strategy = TranscriptionStrategy(service, logger, align=True)
+    context = _context(tmp_path, audio_file=tmp_path / "a.mp3", script="Ciao")
+
+    asyncio.run(strategy.execute(context))
+
+    assert strategy.requires == {"audio_file", "script"}
+    assert service.calls == [("align", "Ciao", "it")]
+    assert context.artifacts["ass_file"] == tmp_path / "job.ass"
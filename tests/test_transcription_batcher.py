@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from pathlib import Path
+
+from whisper_tiktok.execution.transcription_batcher import TranscriptionBatcher
+from whisper_tiktok.interfaces.transcription_service import (
+    ITranscriptionService,
+    TranscriptionJob,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _FakeService(ITranscriptionService):
+    def __init__(self, corrupt: str | None = None):
+        self.batches: list[int] = []
+        self.corrupt = corrupt
+
+    def transcribe(self, audio_file, srt_file, ass_file, model, options):
+        if audio_file.stem == self.corrupt:
+            raise RuntimeError(f"cannot decode {audio_file}")
+        return srt_file, ass_file
+
+    def transcribe_batch(self, jobs, model, options):
+        self.batches.append(len(jobs))
+        if any(job.audio_file.stem == self.corrupt for job in jobs):
+            raise RuntimeError("cannot decode the batch")
+        return [(job.srt_file, job.ass_file) for job in jobs]
+
+
+def _job(name: str) -> TranscriptionJob:
+    return TranscriptionJob(
+        Path(f"{name}.mp3"), Path(f"{name}.srt"), Path(f"{name}.ass")
+    )
+
+
+def test_concurrent_requests_are_batched():
+    service = _FakeService()
+    batcher = TranscriptionBatcher(service, logger, batch_size=3, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(
+            *(batcher.transcribe(_job(str(i)), "small", {}) for i in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert service.batches == [3, 2]
+    assert results[4] == (Path("4.srt"), Path("4.ass"))
+
+
+def test_a_failed_batch_only_fails_its_bad_clip():
+    service = _FakeService(corrupt="1")
+    batcher = TranscriptionBatcher(service, logger, batch_size=3, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(
+            *(batcher.transcribe(_job(str(i)), "small", {}) for i in range(3)),
+            return_exceptions=True,
+        )
+
+    first, bad, last = asyncio.run(run())
+
+    assert service.batches == [3]
+    assert first == (Path("0.srt"), Path("0.ass"))
+    assert isinstance(bad, RuntimeError) and "1.mp3" in str(bad)
+    assert last == (Path("2.srt"), Path("2.ass"))
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+from whisper_tiktok.execution.transcription_pool import TranscriptionPool, core_slices
+from whisper_tiktok.interfaces.transcription_service import ITranscriptionService
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _ProcessService(ITranscriptionService):
+    def __init__(self, threads, model):
+        self.threads = threads
+        self.model = model
+
+    def transcribe(self, audio_file, srt_file, ass_file, model, options):
+        logging.getLogger("whisper_tiktok").warning(f"Transcribing {audio_file.name}")
+        srt_file.write_text(f"{os.getpid()} {self.threads} {self.model}")
+        ass_file.write_text(model)
+        return (srt_file, ass_file)
+
+
+def _build_service(threads, model):
+    return _ProcessService(threads, model)
+
+
+def test_core_slices_share_the_cores():
+    slices = core_slices(2, threads=1)
+
+    assert len(slices) == 2
+    if hasattr(os, "sched_getaffinity") and len(os.sched_getaffinity(0)) > 1:
+        assert slices[0] != slices[1]
+
+
+def test_pool_transcribes_in_worker_processes(tmp_path, caplog):
+    pool = TranscriptionPool(
+        _build_service, logger, processes=2, threads_per_process=1, model="tiny"
+    )
+
+    async def transcribe_all():
+        return await asyncio.gather(
+            *(
+                pool.atranscribe(
+                    tmp_path / f"{i}.mp3",
+                    tmp_path / f"{i}.srt",
+                    tmp_path / f"{i}.ass",
+                    "tiny",
+                    {},
+                )
+                for i in range(4)
+            )
+        )
+
+    try:
+        results = asyncio.run(transcribe_all())
+    finally:
+        pool.close()
+
+    assert [srt for srt, _ in results] == [tmp_path / f"{i}.srt" for i in range(4)]
+    workers = {Path(srt).read_text() for srt, _ in results}
+    assert all(w.endswith(" 1 tiny") for w in workers)
+    assert str(os.getpid()) not in {w.split()[0] for w in workers}
+    logged = {r.getMessage() for r in caplog.records if r.name == "whisper_tiktok"}
+    assert logged == {f"Transcribing {i}.mp3" for i in range(4)}
@@ -0,0 +1,55 @@
+import io
+import json
+
+import pytest
+
+from whisper_tiktok.utils.video_input import (
+    Shard,
+    VideoInputError,
+    iter_json_array,
+    read_videos,
+)
+
+VIDEOS = [
+    {"series": "Crazy facts", "part": str(i), "text": "x" * (i * 7), "n": i}
+    for i in range(1, 41)
+]
+
+
+def test_json_array_is_parsed_incrementally():
+    text = json.dumps(VIDEOS, indent=2)
+
+    assert list(iter_json_array(io.StringIO(text), chunk_size=5)) == VIDEOS
+    assert list(iter_json_array(io.StringIO(" [ ] "))) == []
+
+
+@pytest.mark.parametrize("text", ["[{}", "[{} {}]", "[1]", "{}", "[{}] []"])
+def test_malformed_json_array_is_rejected(text):
+    with pytest.raises(VideoInputError):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+def test_json_lines_and_arrays_are_read_alike(tmp_path):
+    array = tmp_path / "video.json"
+    array.write_text(json.dumps(VIDEOS), encoding="utf-8")
+    lines = tmp_path / "video.jsonl"
+    lines.write_text(
+        "\n".join(json.dumps(video) for video in VIDEOS) + "\n\n", encoding="utf-8"
+    )
+
+    assert list(read_videos(array)) == VIDEOS
+    assert list(read_videos(lines)) == VIDEOS
+
+
+def test_shards_split_the_videos(tmp_path):
+    path = tmp_path / "video.jsonl"
+    path.write_text("\n".join(json.dumps(video) for video in VIDEOS), encoding="utf-8")
+
+    slices = [list(read_videos(path, Shard(i, 3))) for i in (1, 2, 3)]
+
+    assert sorted(v["n"] for part in slices for v in part) == list(range(1, 41))
+    assert all(slices)
+    assert Shard.parse("2/3") == Shard(2, 3)
+    for value in ("0/3", "4/3", "a/b", "3"):
+        with pytest.raises(VideoInputError):
+            Shard.parse(value)
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+
+import pytest
+
+from whisper_tiktok.processors.video_processor import (
+    VideoProcessor,
+    build_dependency_graph,
+    dependency_levels,
+)
+from whisper_tiktok.strategies.processing_strategy import (
+    ProcessingContext,
+    ProcessingStrategy,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+
+class _Step(ProcessingStrategy):
+    def __init__(self, name, requires=frozenset(), provides=None, log=None):
+        self.name = name
+        self.requires = None if requires is None else frozenset(requires)
+        self.provides = frozenset({name} if provides is None else provides)
+        self.log = log if log is not None else []
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        self.log.append(("start", self.name))
+        await asyncio.sleep(0.01)
+        self.log.append(("end", self.name))
+        for key in self.provides:
+            context.artifacts[key] = self.name
+        return context
+
+
+def test_dependency_levels_group_independent_steps():
+    steps = [
+        _Step("background"),
+        _Step("audio"),
+        _Step("subtitles", {"audio"}),
+        _Step("video", {"background", "audio", "subtitles"}),
+    ]
+
+    levels = dependency_levels(steps)
+
+    assert [[s.name for s in level] for level in levels] == [
+        ["background", "audio"],
+        ["subtitles"],
+        ["video"],
+    ]
+
+
+def test_undeclared_requirements_act_as_barrier():
+    steps = [_Step("a"), _Step("legacy", requires=None, provides=()), _Step("b")]
+
+    assert build_dependency_graph(steps) == [set(), {0}, {1}]
+
+
+def test_missing_artifact_is_rejected():
+    with pytest.raises(ValueError, match="audio"):
+        build_dependency_graph([_Step("subtitles", {"audio"})])
+
+    assert build_dependency_graph([_Step("subtitles", {"audio"})], {"audio"}) == [set()]
+
+
+def test_process_runs_independent_steps_concurrently(tmp_path):
+    log: list = []
+    processor = VideoProcessor(
+        uuid="video",
+        video_data={},
+        config={"workspace_path": tmp_path},
+        strategies=[
+            _Step("background", log=log),
+            _Step("audio", log=log),
+            _Step("video", {"background", "audio"}, log=log),
+        ],
+        logger=logger,
+    )
+
+    asyncio.run(processor.process())
+
+    assert log[:2] == [("start", "background"), ("start", "audio")]
+    assert log[-2:] == [("start", "video"), ("end", "video")]
+
+
+class _FileStep(ProcessingStrategy):
+    def __init__(self, name, requires=frozenset(), config_keys=frozenset(), runs=None):
+        self.name = name
+        self.requires = frozenset(requires)
+        self.provides = frozenset({name})
+        self.config_keys = frozenset(config_keys)
+        self.runs = runs if runs is not None else []
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        self.runs.append(self.name)
+        output = context.media_path / f"{self.name}.txt"
+        output.write_text(str(len(self.runs)))
+        context.artifacts[self.name] = output
+        return context
+
+
+def test_incremental_run_skips_up_to_date_steps(tmp_path):
+    runs: list = []
+
+    def process(config):
+        processor = VideoProcessor(
+            uuid="video",
+            video_data={"text": "hello"},
+            config={"workspace_path": tmp_path, **config},
+            strategies=[
+                _FileStep("audio", config_keys={"voice"}, runs=runs),
+                _FileStep("background", runs=runs),
+                _FileStep("video", {"audio", "background"}, runs=runs),
+            ],
+            logger=logger,
+            incremental=True,
+        )
+        asyncio.run(processor.process())
+
+    process({"voice": "a"})
+    assert sorted(runs) == ["audio", "background", "video"]
+
+    runs.clear()
+    process({"voice": "a", "workers": 4})
+    assert runs == []
+
+    # A changed setting invalidates its step and everything downstream
+    process({"voice": "b"})
+    assert runs == ["audio", "video"]
+
+    # So does a missing output
+    runs.clear()
+    (tmp_path / "media" / "video" / "video.txt").unlink()
+    process({"voice": "b"})
+    assert runs == ["video"]
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from whisper_tiktok.repositories.voice_catalog import (
+    VoiceCatalog,
+    VoiceCatalogCache,
+    VoiceCatalogError,
+)
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+VOICES = [
+    {"ShortName": "en-US-AriaNeural", "Locale": "en-US", "Gender": "Female"},
+    {"ShortName": "en-GB-RyanNeural", "Locale": "en-GB", "Gender": "Male"},
+    {"ShortName": "en-US-GuyNeural", "Locale": "en-US", "Gender": "Male"},
+    {"ShortName": "it-IT-DiegoNeural", "Locale": "it-IT", "Gender": "Male"},
+]
+
+
+def test_catalog_lookups_match_scans():
+    catalog = VoiceCatalog(VOICES)
+
+    assert [v["ShortName"] for v in catalog.find(Locale="en-US")] == [
+        "en-US-AriaNeural",
+        "en-US-GuyNeural",
+    ]
+    assert [v["ShortName"] for v in catalog.find(Language="en", Gender="Male")] == [
+        "en-GB-RyanNeural",
+        "en-US-GuyNeural",
+    ]
+    assert catalog.find(Locale="fr-FR") == []
+    assert len(catalog.find()) == len(VOICES)
+    assert catalog.get("it-IT-DiegoNeural")["Language"] == "it"
+
+
+def test_cache_fetches_once_per_ttl_and_works_offline(tmp_path):
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        return VOICES
+
+    path = tmp_path / "voices.json.gz"
+    cache = VoiceCatalogCache(path, logger, fetch=fetch)
+    asyncio.run(cache.get())
+    catalog = asyncio.run(VoiceCatalogCache(path, logger, fetch=fetch).get())
+
+    assert len(calls) == 1
+    assert len(catalog) == len(VOICES)
+
+    async def offline():
+        raise OSError("no network")
+
+    # An expired catalog is still used when the refresh fails
+    expired = VoiceCatalog(VOICES, fetched_at=time.time() - 365 * 86400)
+    expired.save(path)
+    catalog = asyncio.run(VoiceCatalogCache(path, logger, fetch=offline).get())
+    assert catalog.get("en-US-GuyNeural") is not None
+
+    path.unlink()
+    with pytest.raises(VoiceCatalogError):
+        asyncio.run(VoiceCatalogCache(path, logger, fetch=offline).get())
@@ -0,0 +1,38 @@
+import logging
+
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+from whisper_tiktok.services.word_subtitle_service import WordSubtitleService
+
+logger = logging.getLogger("whisper_tiktok.tests")
+
+WORDS = [
+    WordBoundary("Hello", 0.1, 0.5),
+    WordBoundary("world.", 0.6, 1.0),
+    WordBoundary("Bye", 1.1, 1.4),
+    WordBoundary("now", 2.5, 2.9),
+]
+
+
+def test_subtitles_are_written_from_word_boundaries(tmp_path):
+    service = WordSubtitleService(logger)
+    options = {"Fontname": "Roboto", "Fontsize": 60, "highlight_color": "ffffff"}
+
+    assert [[w.text for w in line] for line in service.group(WORDS)] == [
+        ["Hello", "world."],
+        ["Bye"],
+        ["now"],
+    ]
+
+    srt_file, ass_file = service.write(
+        WORDS, tmp_path / "job.srt", tmp_path / "job.ass", options
+    )
+
+    srt = srt_file.read_text(encoding="utf-8").split("\n\n")
+    assert len(srt) == 5
+    assert srt[1] == ("2\n00:00:00,500 --> 00:00:00,600\nHello world.")
+    ass = ass_file.read_text(encoding="utf-8")
+    assert "Style: Default,Roboto,60,&Hffffff," in ass
+    assert (
+        "Dialogue: 0,0:00:00.10,0:00:00.50,Default,,0,0,0,,"
+        "{\\1cffffff&}Hello{\\r} world."
+    ) in ass.splitlines()
@@ -1,13 +1,37 @@
+import functools
 import logging
 from pathlib import Path
 
 from dependency_injector import containers, providers
 
 from whisper_tiktok.execution.command_executor import CommandExecutor
+from whisper_tiktok.execution.transcription_batcher import TranscriptionBatcher
+from whisper_tiktok.execution.transcription_pool import TranscriptionPool
+from whisper_tiktok.repositories.background_cache import BackgroundCache
+from whisper_tiktok.repositories.background_proxy_cache import BackgroundProxyCache
+from whisper_tiktok.repositories.keyframe_index import KeyframeIndex
+from whisper_tiktok.services.cached_tts_service import CachedTTSService
 from whisper_tiktok.services.ffmpeg_service import FFmpegService
-from whisper_tiktok.services.transcription_service import TranscriptionService
+from whisper_tiktok.services.media_probe import MediaProber
+from whisper_tiktok.services.model_registry import WhisperModelRegistry
+from whisper_tiktok.services.render_calibration import RenderCalibrator
+from whisper_tiktok.services.render_profile import (
+    load_output_variants,
+    load_render_profile,
+)
+from whisper_tiktok.services.segment_picker import SegmentPicker
+from whisper_tiktok.services.silence_trimmer import SilenceTrimmer
+from whisper_tiktok.services.transcription_service import (
+    TranscriptionService,
+    load_whisper_model,
+    release_whisper_model,
+    worker_transcription_service,
+)
 from whisper_tiktok.services.tts_service import TTSService
 from whisper_tiktok.services.video_downloader import VideoDownloaderService
+from whisper_tiktok.services.word_subtitle_service import WordSubtitleService
+from whisper_tiktok.utils.event_bus import EventBus
+from whisper_tiktok.utils.metrics import MetricsRegistry
 
 
 class Container(containers.DeclarativeContainer):
@@ -33,11 +57,43 @@ class Container(containers.DeclarativeContainer):
     # Service providers
     logger = providers.Singleton(lambda: logging.getLogger("whisper_tiktok"))
 
-    command_executor = providers.Factory(CommandExecutor, logger=logger)
+    metrics = providers.Singleton(MetricsRegistry)
+
+    command_executor = providers.Factory(
+        CommandExecutor, logger=logger, metrics=metrics
+    )
+
+    progress_bus = providers.Singleton(EventBus, logger=logger)
+
+    render_calibration_file = providers.Callable(
+        lambda workspace: workspace / "cache" / "render_calibration.json",
+        workspace_path,
+    )
+
+    render_profile = providers.Singleton(
+        load_render_profile,
+        name=config.render_profile,
+        calibration_file=render_calibration_file,
+    )
+
+    output_variants = providers.Singleton(load_output_variants, config.variants)
+
+    render_calibrator = providers.Factory(
+        RenderCalibrator, executor=command_executor, logger=logger
+    )
+
+    media_prober = providers.Singleton(
+        MediaProber, executor=command_executor, logger=logger
+    )
 
     ffmpeg_service = providers.Factory(
-        FFmpegService, executor=command_executor, logger=logger
-    )  # Changed
+        FFmpegService,
+        executor=command_executor,
+        logger=logger,
+        progress_bus=progress_bus,
+        render_profile=render_profile,
+        prober=media_prober,
+    )
 
     video_downloader = providers.Factory(
         VideoDownloaderService,
@@ -45,8 +101,103 @@ class Container(containers.DeclarativeContainer):
         logger=logger,
     )
 
-    tts_service = providers.Factory(TTSService, logger=logger)
+    background_cache = providers.Singleton(
+        BackgroundCache,
+        cache_dir=providers.Callable(
+            lambda workspace: workspace / "background", workspace_path
+        ),
+        downloader=video_downloader,
+        logger=logger,
+        max_size_mb=config.background_cache_mb,
+    )
+
+    background_proxy_cache = providers.Singleton(
+        BackgroundProxyCache,
+        cache_dir=providers.Callable(
+            lambda workspace: workspace / "cache" / "proxy", workspace_path
+        ),
+        ffmpeg_service=ffmpeg_service,
+        logger=logger,
+        max_size_mb=config.background_cache_mb,
+    )
+
+    silence_trimmer = providers.Factory(
+        SilenceTrimmer,
+        executor=command_executor,
+        logger=logger,
+        threshold_db=config.silence_threshold_db,
+        max_pause=config.max_pause,
+    )
+
+    keyframe_index = providers.Singleton(
+        KeyframeIndex, ffmpeg_service=ffmpeg_service, logger=logger
+    )
+
+    segment_picker = providers.Singleton(
+        SegmentPicker,
+        keyframe_index=keyframe_index,
+        logger=logger,
+        mode=config.background_seek,
+        seed=config.seed,
+    )
+
+    tts_backend = providers.Factory(TTSService, logger=logger)
+
+    tts_service = providers.Singleton(
+        CachedTTSService,
+        backend=tts_backend,
+        cache_dir=providers.Callable(
+            lambda workspace: workspace / "cache" / "tts", workspace_path
+        ),
+        logger=logger,
+        max_size_mb=config.tts_cache_mb,
+    )
+
+    quantized_model_dir = providers.Callable(
+        lambda workspace: workspace / "cache" / "whisper", workspace_path
+    )
+
+    model_registry = providers.Singleton(
+        WhisperModelRegistry,
+        loader=providers.Callable(
+            functools.partial,
+            load_whisper_model,
+            quantized_cache_dir=quantized_model_dir,
+        ),
+        logger=logger,
+        memory_budget_mb=config.model_memory_mb,
+        on_evict=release_whisper_model,
+    )
+
+    transcription_service = providers.Factory(
+        TranscriptionService,
+        logger=logger,
+        model_registry=model_registry,
+        batch_size=config.transcription_batch_size,
+        precision=config.whisper_precision,
+    )
+
+    transcription_pool = providers.Singleton(
+        TranscriptionPool,
+        factory=providers.Callable(
+            functools.partial,
+            worker_transcription_service,
+            precision=config.whisper_precision,
+            quantized_cache_dir=quantized_model_dir,
+        ),
+        logger=logger,
+        processes=config.transcription_processes,
+        threads_per_process=config.transcription_threads,
+        model=config.model,
+    )
+
+    transcription_batcher = providers.Singleton(
+        TranscriptionBatcher,
+        service=transcription_service,
+        logger=logger,
+        batch_size=config.transcription_batch_size,
+    )
 
-    transcription_service = providers.Factory(TranscriptionService, logger=logger)
+    word_subtitle_service = providers.Factory(WordSubtitleService, logger=logger)
 
     # Additional service providers can be added here
@@ -0,0 +1,306 @@
+"""Concurrent batch scheduling of video processors."""
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from logging import Logger
+from typing import TYPE_CHECKING
+
+from whisper_tiktok.processors.video_processor import ProcessingResult, VideoProcessor
+from whisper_tiktok.strategies.processing_strategy import (
+    ProcessingContext,
+    ProcessingStrategy,
+)
+from whisper_tiktok.utils.async_utils import first_exception
+
+if TYPE_CHECKING:
+    from whisper_tiktok.factories.video_factory import VideoCreatorFactory
+
+
+DEFAULT_STAGE_LIMITS: dict[str, int] = {
+    "download": 1,
+    "proxy": 1,
+    "tts": 4,
+    "trim": 4,
+    "transcription": 1,
+    "subtitles": 4,
+    "composition": 2,
+    "upload": 1,
+}
+
+
+class FailurePolicy(str, Enum):
+    """What to do when a video fails inside the batch.
+
+    Attributes:
+        ABORT: Cancel every in-flight video and re-raise the error.
+        SKIP: Record the failure and keep processing the remaining videos.
+    """
+
+    ABORT = "abort"
+    SKIP = "skip"
+
+
+@dataclass
+class BatchFailure:
+    """A video that could not be processed."""
+
+    index: int
+    video: dict
+    stage: str
+    error: BaseException
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch run."""
+
+    results: list[ProcessingResult] = field(default_factory=list)
+    failures: list[BatchFailure] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        """Number of videos processed successfully."""
+        return len(self.results)
+
+    @property
+    def failed(self) -> int:
+        """Number of videos that failed."""
+        return len(self.failures)
+
+
+@dataclass
+class _BatchJob:
+    """A video travelling through the stage queues."""
+
+    index: int
+    video: dict
+    processor: VideoProcessor
+    context: ProcessingContext
+    levels: list[list[ProcessingStrategy]]
+
+
+class BatchScheduler:
+    """Runs many video processors concurrently as a staged pipeline.
+
+    The pipeline is split into steps following the strategy dependency graph
+    (strategies that do not depend on each other share a step). Every stage
+    (download, tts, transcription, composition, ...) is limited to
+    ``stage_limits`` concurrent videos. Steps are connected by bounded queues,
+    so a slow stage applies backpressure upstream and only a bounded number
+    of videos is in flight at any time.
+
+    Args:
+        factory: Factory used to build a processor for each video.
+        config: Configuration dictionary passed to every processor.
+        logger: Logger instance for logging.
+        stage_limits: Maximum number of concurrent videos per stage. Stages not
+            listed fall back to ``DEFAULT_STAGE_LIMITS`` and then to 1.
+        queue_size: Capacity of the queue in front of each stage.
+        failure_policy: Behaviour when a video fails.
+        max_retries: Number of times a failing stage is retried for a video
+            before the failure policy is applied.
+    """
+
+    def __init__(
+        self,
+        factory: "VideoCreatorFactory",
+        config: dict,
+        logger: Logger,
+        stage_limits: dict[str, int] | None = None,
+        queue_size: int = 4,
+        failure_policy: FailurePolicy = FailurePolicy.ABORT,
+        max_retries: int = 0,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+
+        self.factory = factory
+        self.config = config
+        self.logger = logger
+        self.stage_limits = {**DEFAULT_STAGE_LIMITS, **(stage_limits or {})}
+        self.queue_size = queue_size
+        self.failure_policy = FailurePolicy(failure_policy)
+        self.max_retries = max_retries
+
+    def _limit(self, stage: str) -> int:
+        return max(1, int(self.stage_limits.get(stage, 1)))
+
+    async def run(self, videos: Iterable[dict]) -> BatchReport:
+        """Process all videos and return a report.
+
+        Args:
+            videos: Video data dictionaries, consumed lazily.
+
+        Returns:
+            BatchReport with the successful results and the failures.
+
+        Raises:
+            Exception: The first video error when the failure policy is ABORT.
+        """
+        report = BatchReport()
+        jobs = self._jobs(videos)
+
+        first_job = next(jobs, None)
+        if first_job is None:
+            self.logger.info("No videos to process")
+            return report
+
+        # Pipeline steps are the levels of the strategy dependency graph:
+        # independent strategies (e.g. download and tts) share a step and run
+        # concurrently, each one bounded by its own stage semaphore.
+        steps = [[strategy.stage for strategy in level] for level in first_job.levels]
+        stage_slots = {
+            stage: asyncio.Semaphore(self._limit(stage))
+            for step in steps
+            for stage in step
+        }
+        workers = [max(self._limit(stage) for stage in step) for step in steps]
+        queues: list[asyncio.Queue[_BatchJob | None]] = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in steps
+        ]
+
+        async def produce() -> None:
+            await queues[0].put(first_job)
+            for job in jobs:
+                await queues[0].put(job)
+            for _ in range(workers[0]):
+                await queues[0].put(None)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for position in range(len(steps)):
+                    last = position + 1 == len(steps)
+                    group.create_task(
+                        self._run_step(
+                            position,
+                            "+".join(dict.fromkeys(steps[position])),
+                            workers[position],
+                            queues[position],
+                            None if last else queues[position + 1],
+                            0 if last else workers[position + 1],
+                            stage_slots,
+                            report,
+                        )
+                    )
+        except ExceptionGroup as group_error:
+            raise first_exception(group_error) from None
+
+        self.logger.info(
+            f"Batch finished: {report.succeeded} succeeded, {report.failed} failed"
+        )
+        return report
+
+    def _jobs(self, videos: Iterable[dict]):
+        processors = self.factory.create_processors(videos, self.config)
+        for index, processor in enumerate(processors, 1):
+            video = processor.video_data
+            self.logger.info(
+                f"Queued video {index}: {video.get('series', 'Unknown')} ({processor.uuid})"
+            )
+            yield _BatchJob(
+                index=index,
+                video=video,
+                processor=processor,
+                context=processor.create_context(),
+                levels=processor.pipeline_levels(),
+            )
+
+    async def _run_step(
+        self,
+        position: int,
+        name: str,
+        workers: int,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        next_workers: int,
+        stage_slots: dict[str, asyncio.Semaphore],
+        report: BatchReport,
+    ) -> None:
+        """Run the workers of a step, then signal the next step to stop."""
+        async with asyncio.TaskGroup() as group:
+            for _ in range(workers):
+                group.create_task(
+                    self._worker(position, name, inbox, outbox, stage_slots, report)
+                )
+
+        if outbox is not None:
+            for _ in range(next_workers):
+                await outbox.put(None)
+
+    async def _worker(
+        self,
+        position: int,
+        name: str,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        stage_slots: dict[str, asyncio.Semaphore],
+        report: BatchReport,
+    ) -> None:
+        while True:
+            job = await inbox.get()
+            if job is None:
+                return
+
+            if not await self._run_job_step(position, name, job, stage_slots, report):
+                continue
+
+            if outbox is not None:
+                await outbox.put(job)
+            else:
+                result = job.processor.build_result(job.context)
+                report.results.append(result)
+                self.logger.info(f"✓ Video created: {result.output_path}")
+
+    async def _run_job_step(
+        self,
+        position: int,
+        name: str,
+        job: _BatchJob,
+        stage_slots: dict[str, asyncio.Semaphore],
+        report: BatchReport,
+    ) -> bool:
+        """Run one pipeline step for a job, applying retries and the failure policy.
+
+        Returns:
+            True if the job can move on to the next step.
+        """
+        attempt = 0
+        while True:
+            # On retries, skip the strategies whose artifacts are already there
+            pending = [
+                strategy
+                for strategy in job.levels[position]
+                if not strategy.provides
+                or not strategy.provides <= job.context.artifacts.keys()
+            ]
+            try:
+                job.context = await job.processor.run_strategies(
+                    job.context, pending, stage_slots
+                )
+                return True
+            except Exception as exc:
+                attempt += 1
+                if attempt <= self.max_retries:
+                    self.logger.warning(
+                        f"Stage {name} failed for video {job.index} "
+                        f"(attempt {attempt}/{self.max_retries + 1}): {exc}"
+                    )
+                    continue
+
+                self.logger.exception(
+                    f"✗ Failed to process video {job.index}: "
+                    f"{job.video.get('series', 'Unknown')} at stage {name}"
+                )
+                if self.failure_policy is FailurePolicy.ABORT:
+                    raise
+                report.failures.append(
+                    BatchFailure(
+                        index=job.index, video=job.video, stage=name, error=exc
+                    )
+                )
+                return False
@@ -1,8 +1,18 @@
-import subprocess
+import asyncio
+import re
+import shlex
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
 
+from whisper_tiktok.utils.metrics import MetricsRegistry
+
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+_READ_SIZE = 64 * 1024
+
 
 class CommandExecutionError(Exception):
     """Custom exception for command execution errors."""
@@ -27,47 +37,147 @@ class ExecutionResult:
 
 
 class CommandExecutor:
-    """Executes external commands with error handling.
+    """Executes external commands asynchronously with error handling.
+
+    Commands run through ``asyncio.create_subprocess_exec``, so the event loop
+    keeps serving other coroutines while the child process works. When the
+    timeout expires or the awaiting task is cancelled, the child process is
+    killed.
+
+    Standard error is read line by line into a ring buffer, so only the last
+    ``stderr_lines`` lines are kept however long the command runs. Standard
+    output is either streamed line by line to a callback or kept as written.
 
     Args:
         logger: Logger instance for logging.
+        stderr_lines: Number of trailing stderr lines kept in the result.
+        metrics: Optional registry recording the duration and outcome of every
+            command, labelled by program name.
 
     """
 
-    def __init__(self, logger: Logger):
+    def __init__(
+        self,
+        logger: Logger,
+        stderr_lines: int = 200,
+        metrics: MetricsRegistry | None = None,
+    ):
         self.logger = logger
-
-    def execute(
-        self, command: str, cwd: Path | None = None, timeout: int | None = None
+        self.stderr_lines = stderr_lines
+        self.metrics = metrics
+
+    async def execute(
+        self,
+        command: Sequence[str | Path],
+        cwd: Path | None = None,
+        timeout: float | None = None,
+        on_stdout_line: Callable[[str], None] | None = None,
     ) -> ExecutionResult:
         """Execute command and return result.
 
         Args:
-            command: Command to execute.
+            command: Program and arguments to execute (no shell is involved).
             cwd: Working directory for command execution.
             timeout: Timeout in seconds for command execution.
+            on_stdout_line: Optional callback receiving each stdout line as soon
+                as it is written. Streamed output is not kept in the result.
 
         Returns:
-            ExecutionResult containing return code, stdout, and stderr.
+            ExecutionResult containing return code, stdout, and the tail of
+            stderr.
         """
+        argv = [str(arg) for arg in command]
+        printable = shlex.join(argv)
+        started = time.perf_counter()
 
-        self.logger.debug(f"Executing: {command}")
+        self.logger.debug(f"Executing: {printable}")
         try:
-            with subprocess.Popen(
-                command,
+            process = await asyncio.create_subprocess_exec(
+                *argv,
                 cwd=cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            ) as process:
-                stdout, stderr = process.communicate(timeout=timeout)
-                result = ExecutionResult(
-                    returncode=process.returncode, stdout=stdout, stderr=stderr
-                )
-            return result
-        except subprocess.TimeoutExpired as exc:
-            self.logger.error(f"Command timed out: {command}")
-            raise CommandTimeoutError(f"Command timed out after {timeout}s") from exc
-        except Exception as exc:
-            self.logger.exception(f"Command execution failed: {command}")
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as exc:
+            self.logger.exception(f"Command execution failed: {printable}")
+            self._record(argv, started, "error")
             raise CommandExecutionError(str(exc)) from exc
+
+        stdout = b""
+        stderr: deque[str] = deque(maxlen=self.stderr_lines)
+
+        async def read_stdout() -> None:
+            nonlocal stdout
+            if on_stdout_line is not None:
+                await self._read_lines(process.stdout, on_stdout_line)
+            else:
+                # JSON of ffprobe or yt-dlp must come back byte for byte
+                stdout = await process.stdout.read()
+
+        async def run() -> None:
+            await asyncio.gather(
+                read_stdout(), self._read_lines(process.stderr, stderr.append)
+            )
+            await process.wait()
+
+        try:
+            await asyncio.wait_for(run(), timeout)
+        except TimeoutError as exc:
+            await self._kill(process)
+            self.logger.error(f"Command timed out: {printable}")
+            self._record(argv, started, "timeout")
+            raise CommandTimeoutError(f"Command timed out after {timeout}s") from exc
+        except asyncio.CancelledError:
+            await self._kill(process)
+            self.logger.warning(f"Command cancelled: {printable}")
+            self._record(argv, started, "cancelled")
+            raise
+
+        self._record(argv, started, "success" if process.returncode == 0 else "failure")
+        return ExecutionResult(
+            returncode=process.returncode,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr="\n".join(stderr),
+        )
+
+    def _record(self, argv: list[str], started: float, status: str) -> None:
+        if self.metrics is None:
+            return
+        program = Path(argv[0]).stem
+        self.metrics.histogram(
+            "whisper_tiktok_command_duration_seconds",
+            "Wall time of external commands",
+        ).observe(time.perf_counter() - started, program=program)
+        self.metrics.counter(
+            "whisper_tiktok_commands_total", "External commands by outcome"
+        ).inc(program=program, status=status)
+
+    @staticmethod
+    async def _read_lines(
+        stream: asyncio.StreamReader, handle: Callable[[str], None]
+    ) -> None:
+        """Read a stream incrementally and pass every complete line to handle.
+
+        Carriage returns count as line breaks, since tools such as ffmpeg and
+        yt-dlp redraw their status line with them.
+        """
+        pending = b""
+        while chunk := await stream.read(_READ_SIZE):
+            *lines, pending = _LINE_BREAK.split(pending + chunk)
+            for line in lines:
+                if line:
+                    handle(line.decode("utf-8", errors="replace"))
+            # Never buffer more than one read worth of an unterminated line
+            pending = pending[-_READ_SIZE:]
+        if pending:
+            handle(pending.decode("utf-8", errors="replace"))
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        """Kill a child process and reap it."""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await asyncio.shield(process.wait())
@@ -0,0 +1,206 @@
+"""Processing of videos claimed from a shared job queue."""
+
+import asyncio
+import os
+import socket
+import sqlite3
+import time
+from logging import Logger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from whisper_tiktok.execution.batch_scheduler import (
+    DEFAULT_STAGE_LIMITS,
+    BatchFailure,
+    BatchReport,
+)
+from whisper_tiktok.repositories.job_queue import JobQueue, LeaseLost, QueuedJob
+from whisper_tiktok.utils.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from whisper_tiktok.factories.video_factory import VideoCreatorFactory
+
+
+def default_worker_id() -> str:
+    """Name of this process in the queue, unique across hosts."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class QueueWorker:
+    """Claims jobs from a ``JobQueue`` and processes them until it is drained.
+
+    Up to ``concurrency`` jobs run at the same time, sharing the per-stage
+    concurrency limits. Every job gets its own workspace under ``jobs_path``,
+    so workers on different hosts never write to the same media or output
+    folders. Leases are renewed while a job runs; a job whose lease is lost
+    is cancelled, since another worker has claimed it.
+
+    Args:
+        queue: Job queue shared by the workers.
+        factory: Factory used to build a processor for each job.
+        config: Configuration dictionary passed to every processor.
+        logger: Logger instance for logging.
+        worker_id: Name of this worker in the queue.
+        jobs_path: Directory holding the workspaces of the jobs.
+        stage_limits: Maximum number of concurrent jobs per stage.
+        concurrency: Number of jobs processed at the same time.
+        max_jobs: Stop after claiming this many jobs.
+        poll_interval: Delay between claims while other workers hold the
+            remaining jobs.
+        metrics: Registry receiving the job outcomes.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        factory: "VideoCreatorFactory",
+        config: dict,
+        logger: Logger,
+        worker_id: str,
+        jobs_path: Path,
+        stage_limits: dict[str, int] | None = None,
+        concurrency: int = 1,
+        max_jobs: int | None = None,
+        poll_interval: float = 5.0,
+        metrics: MetricsRegistry | None = None,
+    ):
+        self.queue = queue
+        self.factory = factory
+        self.config = config
+        self.logger = logger
+        self.worker_id = worker_id
+        self.jobs_path = jobs_path
+        self.stage_limits = {**DEFAULT_STAGE_LIMITS, **(stage_limits or {})}
+        self.concurrency = max(1, concurrency)
+        self.max_jobs = max_jobs
+        self.poll_interval = poll_interval
+        self.metrics = metrics
+        self._reserved = 0
+        self._claimed = 0
+
+    async def run(self) -> BatchReport:
+        """Process jobs until the queue is drained or ``max_jobs`` is reached.
+
+        Returns:
+            BatchReport with the completed jobs and the failed attempts.
+        """
+        report = BatchReport()
+        stage_slots = {
+            stage: asyncio.Semaphore(max(1, int(limit)))
+            for stage, limit in self.stage_limits.items()
+        }
+        started = time.monotonic()
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(self.concurrency):
+                group.create_task(self._loop(stage_slots, report))
+
+        elapsed = time.monotonic() - started
+        rate = report.succeeded * 3600 / elapsed if elapsed else 0.0
+        self.logger.info(
+            f"Worker {self.worker_id} finished: {report.succeeded} done, "
+            f"{report.failed} failed in {elapsed:.0f}s ({rate:.1f} videos/hour)"
+        )
+        return report
+
+    async def _claim(self) -> tuple[int, QueuedJob] | None:
+        """Claim the next job and return it with its 1-based claim number."""
+        while self.max_jobs is None or self._reserved < self.max_jobs:
+            # Reserve the slot first, concurrent loops would overshoot max_jobs
+            self._reserved += 1
+            job = await asyncio.to_thread(self.queue.claim, self.worker_id)
+            if job is not None:
+                self._claimed += 1
+                return self._claimed, job
+            self._reserved -= 1
+
+            counts = await asyncio.to_thread(self.queue.counts)
+            if not counts["queued"] and not counts["leased"]:
+                return None
+            # Other workers hold the remaining jobs, their leases may expire
+            await asyncio.sleep(self.poll_interval)
+        return None
+
+    async def _loop(
+        self, stage_slots: dict[str, asyncio.Semaphore], report: BatchReport
+    ) -> None:
+        while (claimed := await self._claim()) is not None:
+            index, job = claimed
+            await self._process(index, job, stage_slots, report)
+
+    async def _process(
+        self,
+        index: int,
+        job: QueuedJob,
+        stage_slots: dict[str, asyncio.Semaphore],
+        report: BatchReport,
+    ) -> None:
+        self.logger.info(f"Claimed job {job.id} (attempt {job.attempts})")
+        lease = None
+        try:
+            # A malformed entry or workspace fails this job, not the worker
+            config = {**self.config, "workspace_path": self.jobs_path / job.id}
+            # Queue ids are unique, the job never needs a suffix
+            processor = self.factory.create_processor(job.video, config, job.id)
+            context = processor.create_context()
+
+            work = asyncio.create_task(
+                processor.run_strategies(context, processor.strategies, stage_slots)
+            )
+            lease = asyncio.create_task(self._keep_lease(job, work))
+            await work
+            result = processor.build_result(context)
+            await asyncio.to_thread(
+                self.queue.complete, job.id, self.worker_id, str(result.output_path)
+            )
+        except LeaseLost:
+            self.logger.warning(f"Abandoned job {job.id}: its lease was lost")
+            self._count("lost")
+            return
+        except asyncio.CancelledError:
+            # Cancelled by _keep_lease rather than by a shutdown of the worker
+            if lease is not None and lease.done() and not lease.cancelled():
+                self.logger.warning(f"Abandoned job {job.id}: its lease was lost")
+                self._count("lost")
+                return
+            raise
+        except Exception as exc:
+            self.logger.exception(f"✗ Job {job.id} failed")
+            retry = await asyncio.to_thread(
+                self.queue.fail, job.id, self.worker_id, repr(exc)
+            )
+            report.failures.append(
+                BatchFailure(index=index, video=job.video, stage="pipeline", error=exc)
+            )
+            self._count("retried" if retry else "failed")
+            return
+        finally:
+            if lease is not None:
+                lease.cancel()
+
+        report.results.append(result)
+        self._count("done")
+        self.logger.info(f"✓ Video created: {result.output_path}")
+
+    async def _keep_lease(self, job: QueuedJob, work: asyncio.Task) -> bool:
+        """Renew the lease of a job, cancelling it once the lease is lost."""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                renewed = await asyncio.to_thread(
+                    self.queue.heartbeat, job.id, self.worker_id
+                )
+            except sqlite3.Error as e:
+                # The lease is still valid for a while, try again later
+                self.logger.warning(f"Could not renew the lease of job {job.id}: {e}")
+                continue
+            if not renewed:
+                work.cancel()
+                return False
+
+    def _count(self, status: str) -> None:
+        if self.metrics is None:
+            return
+        self.metrics.counter(
+            "whisper_tiktok_queue_jobs_total", "Queue jobs processed by outcome"
+        ).inc(worker=self.worker_id, status=status)
@@ -0,0 +1,137 @@
+"""Collects transcription requests from concurrent videos into batches."""
+
+import asyncio
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.interfaces.transcription_service import (
+    ITranscriptionService,
+    TranscriptionJob,
+)
+
+
+@dataclass
+class _PendingJob:
+    job: TranscriptionJob
+    future: asyncio.Future
+
+
+class TranscriptionBatcher:
+    """Groups transcription requests and runs them through transcribe_batch.
+
+    Requests are collected until ``batch_size`` of them are waiting for the same
+    model, or until ``max_wait`` seconds passed since the first one arrived. The
+    batch is then transcribed in a worker thread so the event loop stays free.
+    When a batch fails, its clips are transcribed one by one, so a bad clip
+    only fails its own request.
+
+    Args:
+        service: Transcription service processing the batches.
+        logger: Logger instance for logging.
+        batch_size: Maximum number of clips per batch.
+        max_wait: Maximum time, in seconds, a request waits for companions.
+    """
+
+    def __init__(
+        self,
+        service: ITranscriptionService,
+        logger: Logger,
+        batch_size: int = 8,
+        max_wait: float | None = 2.0,
+    ):
+        self.service = service
+        self.logger = logger
+        self.batch_size = max(1, batch_size or 1)
+        self.max_wait = 2.0 if max_wait is None else max_wait
+        self._pending: dict[str, list[_PendingJob]] = {}
+        self._options: dict[str, dict] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Future] = set()
+
+    async def transcribe(
+        self, job: TranscriptionJob, model: str, options: dict
+    ) -> tuple[Path, Path]:
+        """Queue a clip for transcription and wait for its subtitle files."""
+        loop = asyncio.get_running_loop()
+        pending = _PendingJob(job=job, future=loop.create_future())
+
+        batch = self._pending.setdefault(model, [])
+        batch.append(pending)
+        self._options.setdefault(model, options)
+
+        if len(batch) >= self.batch_size:
+            self._flush(model)
+        elif model not in self._timers:
+            self._timers[model] = loop.call_later(self.max_wait, self._flush, model)
+
+        return await pending.future
+
+    def _flush(self, model: str) -> None:
+        timer = self._timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(model, [])
+        options = self._options.pop(model, {})
+        if batch:
+            task = asyncio.ensure_future(self._run(batch, model, options))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: list[_PendingJob], model: str, options: dict) -> None:
+        self.logger.info(f"Transcribing a batch of {len(batch)} clip(s)")
+        try:
+            results = await asyncio.to_thread(
+                self.service.transcribe_batch,
+                [pending.job for pending in batch],
+                model,
+                options,
+            )
+        except Exception as exc:
+            if len(batch) == 1:
+                self._settle(batch[0], exception=exc)
+                return
+            # One unreadable clip fails the whole batch, find it by running
+            # the clips one by one so the others still succeed
+            self.logger.warning(
+                f"Batch of {len(batch)} clip(s) failed ({exc!r}), "
+                "transcribing them one by one"
+            )
+            for pending in batch:
+                await self._run_single(pending, model, options)
+            return
+
+        for pending, result in zip(batch, results):
+            self._settle(pending, result=result)
+
+    async def _run_single(
+        self, pending: _PendingJob, model: str, options: dict
+    ) -> None:
+        job = pending.job
+        try:
+            result = await asyncio.to_thread(
+                self.service.transcribe,
+                job.audio_file,
+                job.srt_file,
+                job.ass_file,
+                model,
+                options,
+            )
+        except Exception as exc:
+            self._settle(pending, exception=exc)
+        else:
+            self._settle(pending, result=result)
+
+    @staticmethod
+    def _settle(
+        pending: _PendingJob,
+        result: tuple[Path, Path] | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        if pending.future.done():
+            return
+        if exception is not None:
+            pending.future.set_exception(exception)
+        else:
+            pending.future.set_result(result)
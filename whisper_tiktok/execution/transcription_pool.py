@@ -0,0 +1,229 @@
+"""Transcription in long-lived worker processes."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+from whisper_tiktok.interfaces.transcription_service import (
+    ITranscriptionService,
+    TranscriptionJob,
+)
+
+# Service of the current worker process, built by _init_worker
+_service: ITranscriptionService | None = None
+
+
+def core_slices(processes: int, threads: int | None = None) -> list[list[int]]:
+    """Split the cores available to this process between worker processes.
+
+    Args:
+        processes: Number of worker processes.
+        threads: Cores per process, an equal share of the cores by default.
+
+    Returns:
+        The cores of every process, empty lists when affinity is unsupported.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return [[] for _ in range(processes)]
+    cores = sorted(os.sched_getaffinity(0))
+    size = threads or max(1, len(cores) // processes)
+    return [
+        [cores[(index * size + offset) % len(cores)] for offset in range(size)]
+        for index in range(processes)
+    ]
+
+
+class _Dispatcher(logging.Handler):
+    """Hands the records of the worker processes to the loggers of this one."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(
+    factory: Callable[[int | None, str | None], ITranscriptionService],
+    slices: "multiprocessing.Queue[list[int]]",
+    threads: int | None,
+    model: str | None,
+    log_queue: "multiprocessing.Queue[logging.LogRecord]",
+    log_level: int,
+) -> None:
+    global _service
+    # Spawned workers start without logging configuration, their records and
+    # warnings are sent to the parent, which handles them like its own
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(log_level)
+    logging.captureWarnings(True)
+    cores = slices.get()
+    if cores:
+        os.sched_setaffinity(0, cores)
+    _service = factory(threads or len(cores) or None, model)
+
+
+def _call(method: str, *args):
+    return getattr(_service, method)(*args)
+
+
+class TranscriptionPool(ITranscriptionService):
+    """Transcription service running the inference in worker processes.
+
+    Each of the ``processes`` workers builds its own service with ``factory``
+    when it starts, loading ``model`` once, and is pinned to its own slice of
+    cores with as many torch threads. Transcriptions of concurrent videos then
+    run in parallel without competing with the event loop of the pipeline.
+    The processes start on the first transcription. Their log records and
+    warnings are forwarded to the loggers of the parent process.
+
+    Args:
+        factory: Picklable callable building the service of a worker from its
+            number of threads and the model to preload.
+        logger: Logger instance for logging.
+        processes: Number of worker processes.
+        threads_per_process: Cores and torch threads of each worker, an equal
+            share of the cores by default.
+        model: Whisper model every worker loads at start.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int | None, str | None], ITranscriptionService],
+        logger: Logger,
+        processes: int = 2,
+        threads_per_process: int | None = None,
+        model: str | None = None,
+    ):
+        self.factory = factory
+        self.logger = logger
+        self.processes = max(1, processes or 1)
+        self.threads_per_process = threads_per_process
+        self.model = model
+        self._executor: ProcessPoolExecutor | None = None
+        self._log_listener: QueueListener | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # torch is not fork-safe, workers start from a fresh interpreter
+                context = multiprocessing.get_context("spawn")
+                slices = context.Queue()
+                for cores in core_slices(self.processes, self.threads_per_process):
+                    slices.put(cores)
+                log_queue = context.Queue()
+                self._log_listener = QueueListener(log_queue, _Dispatcher())
+                self._log_listener.start()
+                self.logger.info(
+                    f"Starting {self.processes} transcription worker processes"
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(
+                        self.factory,
+                        slices,
+                        self.threads_per_process,
+                        self.model,
+                        log_queue,
+                        self.logger.getEffectiveLevel(),
+                    ),
+                )
+            return self._executor
+
+    def _submit(self, method: str, *args) -> Future:
+        return self._pool().submit(_call, method, *args)
+
+    def transcribe(
+        self,
+        audio_file: Path,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+    ) -> tuple[Path, Path]:
+        return self._submit(
+            "transcribe", audio_file, srt_file, ass_file, model, options
+        ).result()
+
+    def align(
+        self,
+        audio_file: Path,
+        text: str,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+        language: str | None = None,
+        min_probability: float = 0.5,
+    ) -> tuple[Path, Path]:
+        return self._submit(
+            "align",
+            audio_file,
+            text,
+            srt_file,
+            ass_file,
+            model,
+            options,
+            language,
+            min_probability,
+        ).result()
+
+    def transcribe_batch(
+        self, jobs: list[TranscriptionJob], model: str, options: dict
+    ) -> list[tuple[Path, Path]]:
+        return self._submit("transcribe_batch", jobs, model, options).result()
+
+    async def atranscribe(
+        self,
+        audio_file: Path,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+    ) -> tuple[Path, Path]:
+        return await asyncio.wrap_future(
+            self._submit("transcribe", audio_file, srt_file, ass_file, model, options)
+        )
+
+    async def aalign(
+        self,
+        audio_file: Path,
+        text: str,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+        language: str | None = None,
+        min_probability: float = 0.5,
+    ) -> tuple[Path, Path]:
+        return await asyncio.wrap_future(
+            self._submit(
+                "align",
+                audio_file,
+                text,
+                srt_file,
+                ass_file,
+                model,
+                options,
+                language,
+                min_probability,
+            )
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes once their current jobs are done."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._log_listener is not None:
+                self._log_listener.stop()
+                self._log_listener = None
@@ -1,26 +1,109 @@
+import hashlib
+import json
 import uuid
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from enum import Enum
 
 from whisper_tiktok.container import Container
 from whisper_tiktok.processors.video_processor import VideoProcessor
 from whisper_tiktok.strategies.processing_strategy import (
+    BackgroundProxyStrategy,
     DownloadBackgroundStrategy,
     ProcessingStrategy,
+    SilenceTrimStrategy,
     TikTokUploadStrategy,
     TranscriptionStrategy,
     TTSGenerationStrategy,
+    TTSSubtitleStrategy,
     VideoCompositionStrategy,
 )
 
 
+class SubtitleMode(str, Enum):
+    """Where subtitle word timings come from."""
+
+    WHISPER = "whisper"
+    TTS = "tts"
+    ALIGN = "align"
+
+
+# Settings producing a different video from the same entry, each rendering of
+# an entry gets its own job. Profiles are told apart by name, so a new
+# calibration re-renders the existing jobs instead of starting new ones.
+JOB_CONFIG_KEYS = ("render_profile",)
+
+
+def job_id(video_data: dict, config: dict) -> str:
+    """Derive a stable job id from a video entry and the settings of the batch.
+
+    Args:
+        video_data: Video entry from video.json.
+        config: Batch configuration.
+
+    Returns:
+        The first 16 hex digits of a SHA-256 of the entry and settings.
+    """
+    payload = json.dumps(
+        {
+            "video": video_data,
+            "config": {key: config.get(key) for key in JOB_CONFIG_KEYS},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
 class VideoCreatorFactory:
-    """Factory for creating video processor instances."""
+    """Factory for creating video processor instances.
+
+    Incremental batches, the default, name each job after a hash of its video
+    entry, so rerunning a batch finds the manifest and artifacts of the
+    previous run. Otherwise every job gets a random id.
+    """
 
     def __init__(self, container: Container):
         self.container = container
 
-    def create_processor(self, video_data: dict, config: dict) -> VideoProcessor:
-        """Create a configured video processor."""
-        uuid_str = str(uuid.uuid4())
+    def create_processors(
+        self, videos: Iterable[dict], config: dict
+    ) -> Iterator[VideoProcessor]:
+        """Create the processors of a batch, in order.
+
+        Identical entries of the batch get separate jobs, the repeats being
+        numbered from 2.
+        """
+        issued: Counter[str] = Counter()
+        for video_data in videos:
+            uuid_str = None
+            if config.get("incremental", True):
+                uuid_str = job_id(video_data, config)
+                issued[uuid_str] += 1
+                if issued[uuid_str] > 1:
+                    uuid_str = f"{uuid_str}-{issued[uuid_str]}"
+            yield self.create_processor(video_data, config, uuid_str)
+
+    def create_processor(
+        self, video_data: dict, config: dict, uuid_str: str | None = None
+    ) -> VideoProcessor:
+        """Create a configured video processor.
+
+        Args:
+            video_data: Video entry from video.json.
+            config: Configuration of the job.
+            uuid_str: Id of the job, derived from the entry when ``None``.
+        """
+        # The calibrated profile changes whenever calibrate runs again, steps
+        # are fingerprinted with the resolved settings rather than its name
+        config = {
+            **config,
+            "render_settings": self.container.render_profile().to_dict(),
+        }
+        incremental = config.get("incremental", True)
+        if uuid_str is None:
+            uuid_str = job_id(video_data, config) if incremental else str(uuid.uuid4())
 
         return VideoProcessor(
             uuid=uuid_str,
@@ -28,25 +111,73 @@ class VideoCreatorFactory:
             config=config,
             strategies=self._build_strategies(config),
             logger=self.container.logger(),
+            metrics=self.container.metrics(),
+            incremental=incremental,
         )
 
     def _build_strategies(self, config: dict) -> list[ProcessingStrategy]:
         """Build processing pipeline based on config."""
+        subtitle_mode = SubtitleMode(config.get("subtitle_mode", SubtitleMode.WHISPER))
+        if subtitle_mode is SubtitleMode.TTS:
+            subtitle_strategy = TTSSubtitleStrategy(
+                self.container.word_subtitle_service(), self.container.logger()
+            )
+        elif config.get("transcription_processes"):
+            # Worker processes run one clip each, batching does not apply
+            subtitle_strategy = TranscriptionStrategy(
+                self.container.transcription_pool(),
+                self.container.logger(),
+                align=subtitle_mode is SubtitleMode.ALIGN,
+            )
+        else:
+            subtitle_strategy = TranscriptionStrategy(
+                self.container.transcription_service(),
+                self.container.logger(),
+                batcher=(
+                    self.container.transcription_batcher()
+                    if (config.get("transcription_batch_size") or 1) > 1
+                    else None
+                ),
+                align=subtitle_mode is SubtitleMode.ALIGN,
+            )
+
         strategies = [
             DownloadBackgroundStrategy(
-                self.container.video_downloader(), self.container.logger()
+                self.container.background_cache(), self.container.logger()
             ),
             TTSGenerationStrategy(
-                self.container.tts_service(), self.container.logger()
-            ),
-            TranscriptionStrategy(
-                self.container.transcription_service(), self.container.logger()
+                self.container.tts_service(),
+                self.container.logger(),
+                word_boundaries=subtitle_mode is SubtitleMode.TTS,
             ),
+            subtitle_strategy,
             VideoCompositionStrategy(
-                self.container.ffmpeg_service(), self.container.logger()
+                self.container.ffmpeg_service(),
+                self.container.logger(),
+                use_proxy=bool(config.get("background_proxy")),
+                segment_picker=self.container.segment_picker(),
+                variants=self.container.output_variants(),
             ),
         ]
 
+        if config.get("trim_silence"):
+            strategies.insert(
+                2,
+                SilenceTrimStrategy(
+                    self.container.silence_trimmer(),
+                    self.container.logger(),
+                    word_boundaries=subtitle_mode is SubtitleMode.TTS,
+                ),
+            )
+
+        if config.get("background_proxy"):
+            strategies.insert(
+                1,
+                BackgroundProxyStrategy(
+                    self.container.background_proxy_cache(), self.container.logger()
+                ),
+            )
+
         if config.get("upload_tiktok"):
             strategies.append(
                 TikTokUploadStrategy(self.container.uploader(), self.container.logger())
@@ -1,7 +1,18 @@
+import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class TranscriptionJob:
+    """Audio file to transcribe and the subtitle files to write."""
+
+    audio_file: Path
+    srt_file: Path
+    ass_file: Path
+
+
 class ITranscriptionService(ABC):
     """Interface for transcription services."""
 
@@ -15,3 +26,75 @@ class ITranscriptionService(ABC):
         options: dict,
     ) -> tuple[Path, Path]:
         """Transcribe audio and generate SRT/ASS files."""
+
+    def align(
+        self,
+        audio_file: Path,
+        text: str,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+        language: str | None = None,
+        min_probability: float = 0.5,
+    ) -> tuple[Path, Path]:
+        """Align a known script to the audio and generate SRT/ASS files.
+
+        Backends without forced alignment keep this default, which transcribes
+        the audio instead.
+        """
+        return self.transcribe(audio_file, srt_file, ass_file, model, options)
+
+    def transcribe_batch(
+        self, jobs: list[TranscriptionJob], model: str, options: dict
+    ) -> list[tuple[Path, Path]]:
+        """Transcribe several audio files and generate their SRT/ASS files.
+
+        Backends able to process several clips in one pass override this; the
+        default transcribes the files one by one.
+        """
+        return [
+            self.transcribe(job.audio_file, job.srt_file, job.ass_file, model, options)
+            for job in jobs
+        ]
+
+    async def atranscribe(
+        self,
+        audio_file: Path,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+    ) -> tuple[Path, Path]:
+        """Transcribe without blocking the event loop.
+
+        The default runs ``transcribe`` in a thread; backends running the
+        inference elsewhere, e.g. in worker processes, override this.
+        """
+        return await asyncio.to_thread(
+            self.transcribe, audio_file, srt_file, ass_file, model, options
+        )
+
+    async def aalign(
+        self,
+        audio_file: Path,
+        text: str,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+        language: str | None = None,
+        min_probability: float = 0.5,
+    ) -> tuple[Path, Path]:
+        """Align without blocking the event loop, see ``atranscribe``."""
+        return await asyncio.to_thread(
+            self.align,
+            audio_file,
+            text,
+            srt_file,
+            ass_file,
+            model,
+            options,
+            language=language,
+            min_probability=min_probability,
+        )
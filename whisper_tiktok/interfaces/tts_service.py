@@ -1,10 +1,46 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class WordBoundary:
+    """A word of synthesized speech and its position in the audio, in seconds."""
+
+    text: str
+    start: float
+    end: float
+
+
 class ITTSService(ABC):
     """Interface for text-to-speech services."""
 
     @abstractmethod
-    async def synthesize(self, text: str, output_file: Path, voice: str) -> None:
+    async def synthesize(
+        self,
+        text: str,
+        output_file: Path,
+        voice: str,
+        rate: str = "+0%",
+        volume: str = "+0%",
+        pitch: str = "+0Hz",
+    ) -> None:
         """Synthesize speech from text."""
+
+    async def synthesize_with_boundaries(
+        self,
+        text: str,
+        output_file: Path,
+        voice: str,
+        rate: str = "+0%",
+        volume: str = "+0%",
+        pitch: str = "+0Hz",
+    ) -> list[WordBoundary]:
+        """Synthesize speech from text and report when every word is spoken.
+
+        Engines that do not expose word timings keep this default, which raises
+        ``NotImplementedError``.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not report word boundaries"
+        )
@@ -6,5 +6,5 @@ class IVideoDownloader(ABC):
     """Interface for video downloading services."""
 
     @abstractmethod
-    def download(self, url: str, output_dir: Path) -> Path:
+    async def download(self, url: str, output_dir: Path) -> Path:
         """Download video from URL to output directory."""
@@ -1,21 +1,40 @@
 """Main module for the Whisper TikTok application."""
 
 import asyncio
-import json
 import logging
 import platform
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Optional
 
 import typer
+from dependency_injector import providers
 from rich.console import Console
+from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn
 from rich.table import Table
 
 from whisper_tiktok.config.logger_config import setup_logger
 from whisper_tiktok.container import Container
-from whisper_tiktok.factories.video_factory import VideoCreatorFactory
+from whisper_tiktok.execution.batch_scheduler import (
+    BatchReport,
+    BatchScheduler,
+    FailurePolicy,
+)
+from whisper_tiktok.execution.queue_worker import QueueWorker, default_worker_id
+from whisper_tiktok.factories.video_factory import SubtitleMode, VideoCreatorFactory
+from whisper_tiktok.repositories.job_queue import JobQueue
+from whisper_tiktok.services.ffmpeg_progress import FFmpegProgress
+from whisper_tiktok.services.render_calibration import CalibrationError
+from whisper_tiktok.services.render_profile import (
+    RenderProfileError,
+    load_output_variants,
+    load_render_profile,
+)
+from whisper_tiktok.services.segment_picker import BackgroundSeek
+from whisper_tiktok.services.transcription_service import WhisperPrecision
 from whisper_tiktok.utils.color_utils import rgb_to_bgr
+from whisper_tiktok.utils.video_input import Shard, VideoInputError, read_videos
 from whisper_tiktok.voice_manager import VoicesManager
 
 # Create Typer app
@@ -46,21 +65,25 @@ def list_voices(
         "-g",
         help="Filter by gender (Male/Female)",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Fetch the voice list again instead of using the local catalog",
+    ),
 ):
     """List available TTS voices."""
 
     async def _list_voices():
         voices_manager = VoicesManager()
-        voices_obj = await voices_manager.create()
-
-        # Get all voices
-        voices = voices_obj.voices
+        voices_obj = await voices_manager.create(refresh=refresh)
 
-        # Apply filters
+        # Filter through the catalog indexes, "en" selects every English locale
+        filters = {}
         if language:
-            voices = [v for v in voices if v.get("Locale", "").startswith(language)]
+            filters["Locale" if "-" in language else "Language"] = language
         if gender:
-            voices = [v for v in voices if v.get("Gender", "") == gender]
+            filters["Gender"] = gender
+        voices = voices_obj.find(**filters)
 
         # Display in a table
         table = Table(title="Available TTS Voices")
@@ -93,6 +116,40 @@ def create(
         "-m",
         help="Whisper model size [tiny|base|small|medium|large|turbo]",
     ),
+    subtitle_mode: SubtitleMode = typer.Option(
+        SubtitleMode.WHISPER,
+        "--subtitles",
+        help="Time subtitles by transcribing with Whisper, by aligning the script "
+        "with Whisper, or from the TTS word boundaries, which skips Whisper entirely",
+        case_sensitive=False,
+    ),
+    alignment_threshold: float = typer.Option(
+        0.5,
+        "--alignment-threshold",
+        help="Mean word probability below which an alignment falls back to "
+        "transcription",
+        min=0.0,
+        max=1.0,
+    ),
+    trim_silence: bool = typer.Option(
+        False,
+        "--trim-silence/--no-trim-silence",
+        help="Cut the silence at both ends of the narration and shorten its "
+        "pauses before transcription, making the videos shorter",
+    ),
+    max_pause: float = typer.Option(
+        0.3,
+        "--max-pause",
+        help="Longest pause kept in a trimmed narration, in seconds",
+        min=0.0,
+    ),
+    silence_threshold: float = typer.Option(
+        -35.0,
+        "--silence-threshold",
+        help="Level, in dB below the loudest part of the narration, under which "
+        "audio counts as silence when trimming",
+        max=0.0,
+    ),
     background_url: str = typer.Option(
         "https://www.youtube.com/watch?v=intRX7BRA90",
         "--background-url",
@@ -157,16 +214,161 @@ def create(
         "--clean",
         help="Clean media and output folders before processing",
     ),
+    input_file: Optional[Path] = typer.Option(
+        None,
+        "--input",
+        "-i",
+        help="Video list, a JSON array or JSON Lines (.jsonl) file read as the "
+        "pipeline runs (default: ./video.json)",
+    ),
+    shard: Optional[str] = typer.Option(
+        None,
+        "--shard",
+        help="Only process slice i of N of the video list, e.g. 2/4, to split one "
+        "file across machines",
+    ),
+    incremental: bool = typer.Option(
+        True,
+        "--incremental/--no-incremental",
+        help="Reuse the outputs of a previous run of the same videos, only running "
+        "the stages whose inputs changed",
+    ),
+    tts_workers: int = typer.Option(
+        4,
+        "--tts-workers",
+        help="Maximum number of videos synthesizing speech at the same time",
+        min=1,
+    ),
+    transcription_workers: int = typer.Option(
+        1,
+        "--transcription-workers",
+        help="Maximum number of videos being transcribed at the same time",
+        min=1,
+    ),
+    transcription_batch_size: int = typer.Option(
+        1,
+        "--transcription-batch-size",
+        help="Number of clips from different videos decoded together by Whisper",
+        min=1,
+    ),
+    transcription_processes: int = typer.Option(
+        0,
+        "--transcription-processes",
+        help="Run Whisper in this many worker processes, each loading the model "
+        "once and pinned to its own cores (0: in the main process)",
+        min=0,
+    ),
+    transcription_threads: Optional[int] = typer.Option(
+        None,
+        "--transcription-threads",
+        help="Cores and torch threads per transcription process (default: an "
+        "equal share of the cores)",
+        min=1,
+    ),
+    precision: WhisperPrecision = typer.Option(
+        WhisperPrecision.FP32,
+        "--precision",
+        help="Weight precision of Whisper: int8 quantizes the linear layers for "
+        "faster CPU inference (cached under ./cache/whisper), fp16 needs a GPU",
+        case_sensitive=False,
+    ),
+    composition_workers: int = typer.Option(
+        2,
+        "--composition-workers",
+        help="Maximum number of videos being rendered at the same time",
+        min=1,
+    ),
+    background_cache_mb: Optional[int] = typer.Option(
+        None,
+        "--background-cache-mb",
+        help="Size limit of the background video cache (least recently used are deleted)",
+        min=0,
+    ),
+    background_seek: BackgroundSeek = typer.Option(
+        BackgroundSeek.RANDOM,
+        "--background-seek",
+        help="Where each video starts in the background: at the beginning, at a "
+        "random keyframe, or at the keyframe following the previous video",
+        case_sensitive=False,
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Seed of the random background offsets",
+    ),
+    metrics_dir: Optional[Path] = typer.Option(
+        None,
+        "--metrics-dir",
+        help="Directory receiving the Prometheus textfile and JSON metrics of the "
+        "run (default: ./metrics)",
+    ),
+    render_profile: str = typer.Option(
+        "standard",
+        "--profile",
+        help="Render profile [draft|standard|final|calibrated], calibrated uses "
+        "the result of the 'calibrate' command",
+    ),
+    variants: Optional[list[str]] = typer.Option(
+        None,
+        "--variant",
+        help="Also render the video for another platform [shorts|reels|feed] in "
+        "the same ffmpeg process, can be repeated",
+    ),
+    background_proxy: bool = typer.Option(
+        False,
+        "--background-proxy",
+        help="Transcode each background once into a cropped, scaled and blurred "
+        "vertical proxy shared by all videos",
+    ),
+    tts_cache_mb: Optional[int] = typer.Option(
+        1024,
+        "--tts-cache-mb",
+        help="Size limit of the synthesized speech cache (least recently used are deleted)",
+        min=0,
+    ),
+    model_memory_mb: Optional[int] = typer.Option(
+        None,
+        "--model-memory-mb",
+        help="Memory budget for cached Whisper models (least recently used are evicted)",
+        min=0,
+    ),
+    queue_size: int = typer.Option(
+        4,
+        "--queue-size",
+        help="Number of videos buffered between two pipeline stages",
+        min=1,
+    ),
+    on_error: FailurePolicy = typer.Option(
+        FailurePolicy.SKIP,
+        "--on-error",
+        help="Abort the whole batch or skip the failing video",
+        case_sensitive=False,
+    ),
+    retries: int = typer.Option(
+        0,
+        "--retries",
+        help="Retries of a failing stage before the --on-error policy applies",
+        min=0,
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
         help="Enable verbose logging",
     ),
+    # Set by the worker command
+    queue_path: Optional[Path] = typer.Option(None, "--queue", hidden=True),
+    worker_id: Optional[str] = typer.Option(None, "--worker-id", hidden=True),
+    lease_seconds: float = typer.Option(300, "--lease-seconds", hidden=True),
+    worker_concurrency: int = typer.Option(1, "--concurrency", hidden=True),
+    max_jobs: Optional[int] = typer.Option(None, "--max-jobs", hidden=True),
 ):
     """Create videos from text content."""
 
-    # Setup logging
+    # Setup logging, workers sharing a workspace log to separate files
     log_dir = Path.cwd() / "logs"
+    if queue_path:
+        worker_id = worker_id or default_worker_id()
+        log_dir = log_dir / worker_id
     log_level = "DEBUG" if verbose else "INFO"
     logger = setup_logger(log_dir, log_level)
 
@@ -183,6 +385,24 @@ def create(
             logger.error("Invalid model. Choose from: %s", ", ".join(valid_models))
             raise typer.Exit(code=1)
 
+        # Validate shard
+        if shard:
+            try:
+                Shard.parse(shard)
+            except VideoInputError as e:
+                logger.error("%s", e)
+                raise typer.Exit(code=1) from e
+
+        # Validate render profile and output variants
+        try:
+            load_render_profile(
+                render_profile, Path.cwd() / "cache" / "render_calibration.json"
+            )
+            load_output_variants(variants)
+        except RenderProfileError as e:
+            logger.error("%s", e)
+            raise typer.Exit(code=1) from e
+
         # Handle random voice selection
         if random_voice:
             if not gender or not language:
@@ -242,10 +462,20 @@ def create(
         console.print("\n[bold green]🎬 Starting video creation pipeline…[/bold green]")
         console.print(f"  [cyan]Model:[/cyan] {model}")
         console.print(f"  [cyan]Voice:[/cyan] {tts_voice}")
-        console.print(f"  [cyan]Language:[/cyan] {language}\n")
+        console.print(f"  [cyan]Language:[/cyan] {language}")
+        console.print(f"  [cyan]Profile:[/cyan] {render_profile}\n")
 
         # Setup DI container
         container = Container()
+        if queue_path:
+            # Caches and metrics of workers on a shared workspace are kept
+            # apart, only the jobs and the calibration are shared
+            container.workspace_path.override(
+                providers.Object(Path.cwd() / "workers" / worker_id)
+            )
+            container.render_calibration_file.override(
+                providers.Object(Path.cwd() / "cache" / "render_calibration.json")
+            )
         config_dict = {
             "model": model,
             "background_url": background_url,
@@ -261,6 +491,38 @@ def create(
             "Blur": "21",
             "MarginL": "0",
             "MarginR": "0",
+            "tts_workers": tts_workers,
+            "subtitle_mode": subtitle_mode.value,
+            "alignment_threshold": alignment_threshold,
+            "trim_silence": trim_silence,
+            "max_pause": max_pause,
+            "silence_threshold_db": silence_threshold,
+            "transcription_workers": transcription_workers,
+            "transcription_batch_size": transcription_batch_size,
+            "transcription_processes": transcription_processes,
+            "transcription_threads": transcription_threads,
+            "whisper_precision": precision.value,
+            "composition_workers": composition_workers,
+            "queue_size": queue_size,
+            "model_memory_mb": model_memory_mb,
+            "background_cache_mb": background_cache_mb,
+            "background_proxy": background_proxy,
+            "background_seek": background_seek.value,
+            "seed": seed,
+            "render_profile": render_profile,
+            "variants": variants or [],
+            "metrics_dir": metrics_dir,
+            "tts_cache_mb": tts_cache_mb,
+            "on_error": on_error.value,
+            "incremental": incremental,
+            "input_file": input_file,
+            "shard": shard,
+            "queue_path": queue_path,
+            "worker_id": worker_id,
+            "lease_seconds": lease_seconds,
+            "worker_concurrency": worker_concurrency,
+            "max_jobs": max_jobs,
+            "retries": retries,
         }
         container.config.from_dict(config_dict)
 
@@ -268,15 +530,55 @@ def create(
         app_instance = Application(container, logger)
 
         try:
-            await app_instance.run()
-            console.print(
-                "\n[bold green]✅ Pipeline completed successfully![/bold green]"
-            )
+            with Progress(
+                TextColumn("[cyan]Rendering {task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TextColumn("{task.fields[speed]}"),
+                console=console,
+                transient=True,
+            ) as render_progress:
+                render_tasks = {}
+
+                def show_progress(progress: FFmpegProgress) -> None:
+                    task = render_tasks.get(progress.output)
+                    if task is None:
+                        task = render_progress.add_task(
+                            progress.output.stem, total=100, speed=""
+                        )
+                        render_tasks[progress.output] = task
+                    render_progress.update(
+                        task,
+                        completed=progress.percent or 0,
+                        speed=f"{progress.speed}x" if progress.speed else "",
+                        visible=not progress.finished,
+                    )
+
+                unsubscribe = container.progress_bus().subscribe(show_progress)
+                try:
+                    report = await app_instance.run()
+                finally:
+                    unsubscribe()
         except Exception as e:
             logger.exception("Pipeline failed")
             console.print(f"\n[bold red]❌ Pipeline failed: {e}[/bold red]")
             raise typer.Exit(code=1) from e
 
+        if report.failed:
+            console.print(
+                f"\n[bold yellow]⚠️ Pipeline completed with {report.failed} failed "
+                f"video(s) out of {report.succeeded + report.failed}[/bold yellow]"
+            )
+            for failure in report.failures:
+                console.print(
+                    f"  [red]✗[/red] #{failure.index} "
+                    f"{failure.video.get('series', 'Unknown')} "
+                    f"({failure.stage}): {failure.error}"
+                )
+            raise typer.Exit(code=1)
+
+        console.print("\n[bold green]✅ Pipeline completed successfully![/bold green]")
+
     # Run the async function
     asyncio.run(_create())
 
@@ -284,7 +586,7 @@ def create(
 class Application:
     """Main application class responsible for orchestrating the video creation pipeline.
     This class loads video data from a JSON file, builds configuration from a container,
-    and processes each video asynchronously using a factory-created processor.
+    and processes the videos concurrently through a BatchScheduler.
 
     Attributes:
         container (Container): Dependency injection container.
@@ -298,24 +600,46 @@ class Application:
         self.container = container
         self.logger = logger
         self.factory = VideoCreatorFactory(container)
+        self.container.progress_bus().subscribe(self._log_progress)
+
+    def _log_progress(self, progress: FFmpegProgress) -> None:
+        """Log ffmpeg progress events.
+
+        Args:
+            progress (FFmpegProgress): Progress report of a running encode.
+        """
+        if progress.finished:
+            self.logger.info(f"Rendered {progress.output.name}")
+            return
+        percent = f"{progress.percent:.0f}%" if progress.percent is not None else "?"
+        self.logger.debug(
+            f"Rendering {progress.output.name}: {percent} frame={progress.frame} "
+            f"fps={progress.fps:g} time={progress.out_time:.1f}s speed={progress.speed}x"
+        )
+
+    def _load_video_data(self, config: dict) -> Iterator[dict]:
+        """Stream video data from the input file, video.json by default.
+
+        Args:
+            config (dict): Configuration dictionary.
 
-    def _load_video_data(self) -> list[dict]:
-        """Load video data from video.json file.
         Returns:
-            List of video data dictionaries.
+            Iterator over the video data dictionaries, read as the pipeline
+            consumes them.
         """
-        video_json_path = Path.cwd() / "video.json"
+        video_json_path = Path(config.get("input_file") or Path.cwd() / "video.json")
+        shard = Shard.parse(config["shard"]) if config.get("shard") else None
 
         try:
-            data: list[dict] = json.loads(video_json_path.read_text(encoding="utf-8"))
-            self.logger.info(f"Loaded {len(data)} videos from video.json")
-            return data
+            videos = read_videos(video_json_path, shard)
         except FileNotFoundError:
-            self.logger.error(f"video.json not found at {video_json_path}")
-            raise
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in video.json: {e}")
+            self.logger.error(f"{video_json_path.name} not found at {video_json_path}")
             raise
+        self.logger.info(
+            f"Reading videos from {video_json_path}"
+            + (f" (shard {shard})" if shard else "")
+        )
+        return videos
 
     def _build_config(self) -> dict:
         """Build configuration from container.
@@ -325,55 +649,350 @@ class Application:
         """
         return dict(self.container.config())
 
-    async def run(self) -> None:
+    @staticmethod
+    def _stage_limits(config: dict) -> dict[str, int]:
+        """Concurrency limits of the pipeline stages from configuration."""
+        return {
+            "tts": config.get("tts_workers", 4),
+            # Batching and worker processes need enough videos waiting at the
+            # transcription stage
+            "transcription": max(
+                config.get("transcription_workers", 1),
+                config.get("transcription_batch_size", 1),
+                config.get("transcription_processes") or 1,
+            ),
+            "composition": config.get("composition_workers", 2),
+        }
+
+    def _build_worker(self, config: dict) -> QueueWorker:
+        """Build the worker of a shared job queue from configuration.
+
+        The workspaces of the jobs are created next to the queue database.
+
+        Args:
+            config (dict): Configuration dictionary.
+
+        Returns:
+            Configured QueueWorker.
+        """
+        queue_path = Path(config["queue_path"])
+        queue = JobQueue(
+            queue_path, self.logger, lease_seconds=config.get("lease_seconds") or 300
+        )
+        return QueueWorker(
+            queue=queue,
+            factory=self.factory,
+            config=config,
+            logger=self.logger,
+            worker_id=config.get("worker_id") or default_worker_id(),
+            jobs_path=queue_path.parent / "jobs",
+            stage_limits=self._stage_limits(config),
+            concurrency=config.get("worker_concurrency") or 1,
+            max_jobs=config.get("max_jobs"),
+            metrics=self.container.metrics(),
+        )
+
+    def _build_scheduler(self, config: dict) -> BatchScheduler:
+        """Build the batch scheduler from configuration.
+
+        Args:
+            config (dict): Configuration dictionary.
+
+        Returns:
+            Configured BatchScheduler.
+        """
+        return BatchScheduler(
+            factory=self.factory,
+            config=config,
+            logger=self.logger,
+            stage_limits=self._stage_limits(config),
+            queue_size=config.get("queue_size", 4),
+            failure_policy=FailurePolicy(config.get("on_error", FailurePolicy.SKIP)),
+            max_retries=config.get("retries", 0),
+        )
+
+    async def run(self) -> BatchReport:
         """Run the video creation pipeline.
 
         Returns:
-            None
+            BatchReport with the created videos and the failed ones.
         """
 
-        # Load video data
-        video_data = self._load_video_data()
         config = self._build_config()
+        if config.get("queue_path"):
+            # Process the videos claimed from the shared job queue
+            batch = self._build_worker(config).run()
+        else:
+            # Process the videos of the input file concurrently
+            video_data = self._load_video_data(config)
+            batch = self._build_scheduler(config).run(video_data)
 
-        # Process each video
-        for idx, video in enumerate(video_data, 1):
+        try:
+            try:
+                report = await batch
+            except VideoInputError as e:
+                self.logger.error(f"Invalid video list: {e}")
+                raise
+            videos = self.container.metrics().counter(
+                "whisper_tiktok_videos_total", "Videos processed by outcome"
+            )
+            videos.inc(report.succeeded, status="success")
+            videos.inc(report.failed, status="failure")
+        finally:
+            if config.get("transcription_processes"):
+                self.container.transcription_pool().close()
+            self._export_metrics(config)
+
+        self.logger.info(f"Background cache: {self.container.background_cache().stats}")
+        if config.get("background_proxy"):
             self.logger.info(
-                f"Processing video {idx}/{len(video_data)}: {video.get('series', 'Unknown')}"
+                f"Background proxy cache: {self.container.background_proxy_cache().stats}"
             )
-            await self._process_video(video, config)
+        self.logger.info(f"TTS cache: {self.container.tts_service().stats}")
+        self.logger.info(
+            f"Whisper model cache: {self.container.model_registry().stats}"
+        )
+        return report
 
-    async def _process_video(self, video: dict, config: dict) -> None:
-        """Process a single video.
+    def _export_metrics(self, config: dict) -> None:
+        """Write the metrics of the run as a Prometheus textfile and JSON.
 
         Args:
-            video (dict): Video data dictionary.
             config (dict): Configuration dictionary.
-
-        Returns:
-            None
         """
+        metrics_dir = Path(
+            config.get("metrics_dir") or self.container.workspace_path() / "metrics"
+        )
+        metrics = self.container.metrics()
+        metrics.write_textfile(metrics_dir / "whisper_tiktok.prom")
+        metrics.write_json(metrics_dir / "whisper_tiktok_metrics.json")
+        self.logger.info(f"Metrics written to {metrics_dir}")
 
-        processor = self.factory.create_processor(video, config)
 
-        try:
-            result = await processor.process()
-            self.logger.info(f"✓ Video created: {result.output_path}")
-        except Exception:
-            self.logger.exception(
-                f"✗ Failed to process video: {video.get('series', 'Unknown')}"
+@app.command()
+def calibrate(
+    base: str = typer.Option(
+        "standard",
+        "--base",
+        help="Profile whose resolution, encoder and CRF are calibrated",
+    ),
+    min_ssim: float = typer.Option(
+        0.95,
+        "--min-ssim",
+        help="Minimum SSIM against the lossless sample",
+        min=0.0,
+        max=1.0,
+    ),
+    max_bitrate_kbps: Optional[float] = typer.Option(
+        None,
+        "--max-bitrate",
+        help="Maximum video bitrate in kb/s",
+        min=0.0,
+    ),
+    duration: float = typer.Option(
+        5.0,
+        "--duration",
+        help="Length of the sample clip in seconds",
+        min=1.0,
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        help="Enable verbose logging",
+    ),
+):
+    """Find the fastest encoder preset meeting a quality target on this machine.
+
+    The result is stored in cache/render_calibration.json and used by
+    'create --profile calibrated'.
+    """
+    log_dir = Path.cwd() / "logs"
+    logger = setup_logger(log_dir, "DEBUG" if verbose else "INFO")
+
+    container = Container()
+    try:
+        base_profile = load_render_profile(base)
+    except RenderProfileError as e:
+        logger.error("%s", e)
+        raise typer.Exit(code=1) from e
+
+    calibrator = container.render_calibrator(duration=duration)
+    try:
+        result = asyncio.run(
+            calibrator.calibrate(
+                base_profile, min_ssim=min_ssim, max_bitrate_kbps=max_bitrate_kbps
             )
-            raise
+        )
+    except CalibrationError as e:
+        console.print(f"[bold red]❌ Calibration failed: {e}[/bold red]")
+        raise typer.Exit(code=1) from e
+
+    table = Table(title=f"Encoder presets ({base_profile.width}x{base_profile.height})")
+    table.add_column("Preset", style="cyan")
+    table.add_column("Encode (s)", justify="right")
+    table.add_column("Bitrate (kb/s)", justify="right")
+    table.add_column("SSIM", justify="right")
+    for m in result.measurements:
+        style = "bold green" if m.preset == result.profile.preset else None
+        table.add_row(
+            m.preset,
+            f"{m.encode_seconds:.2f}",
+            f"{m.bitrate_kbps:.0f}",
+            f"{m.ssim:.4f}",
+            style=style,
+        )
+    console.print(table)
+
+    calibration_file = container.render_calibration_file()
+    result.save(calibration_file)
+    console.print(
+        f"[bold green]✅ Selected preset {result.profile.preset}[/bold green], "
+        f"saved to {calibration_file}"
+    )
+
+
+@app.command()
+def enqueue(
+    input_file: Path = typer.Option(
+        Path("video.json"),
+        "--input",
+        "-i",
+        help="Video list, a JSON array or JSON Lines (.jsonl) file",
+    ),
+    queue: Path = typer.Option(
+        Path("queue.sqlite"),
+        "--queue",
+        help="Job queue database, on storage shared by the workers",
+    ),
+    shard: Optional[str] = typer.Option(
+        None,
+        "--shard",
+        help="Only enqueue slice i of N of the video list, e.g. 2/4",
+    ),
+):
+    """Add the videos of a video list to a job queue."""
+    logger = setup_logger(Path.cwd() / "logs", "INFO")
+    try:
+        videos = read_videos(input_file, Shard.parse(shard) if shard else None)
+        added = JobQueue(queue, logger).enqueue(videos)
+    except (FileNotFoundError, VideoInputError) as e:
+        console.print(f"[bold red]❌ Cannot enqueue {input_file}: {e}[/bold red]")
+        raise typer.Exit(code=1) from e
+
+    console.print(
+        f"[bold green]✅ Enqueued {added} new video(s)[/bold green] in {queue}"
+    )
+
+
+@app.command(
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True}
+)
+def worker(
+    ctx: typer.Context,
+    queue: Path = typer.Option(
+        Path("queue.sqlite"),
+        "--queue",
+        help="Job queue database, on storage shared by the workers",
+    ),
+    worker_id: Optional[str] = typer.Option(
+        None,
+        "--worker-id",
+        help="Name of this worker in the queue (default: <hostname>-<pid>)",
+    ),
+    lease_seconds: float = typer.Option(
+        300,
+        "--lease-seconds",
+        help="Time after which the job of a silent worker is claimed again",
+        min=10,
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        help="Number of jobs processed at the same time",
+        min=1,
+    ),
+    max_jobs: Optional[int] = typer.Option(
+        None,
+        "--max-jobs",
+        help="Stop after this many jobs (default: when the queue is drained)",
+        min=1,
+    ),
+):
+    """Process videos claimed from a job queue until it is drained.
+
+    Every other option is passed to 'create', e.g.
+    'whisper-tiktok worker --queue /shared/queue.sqlite --model small --profile draft'.
+    Each job is written to jobs/<job id>/ next to the queue.
+    """
+    if not queue.exists():
+        console.print(f"[bold red]❌ Job queue {queue} not found[/bold red]")
+        raise typer.Exit(code=1)
+
+    args = [
+        *ctx.args,
+        "--queue",
+        str(queue),
+        "--worker-id",
+        worker_id or default_worker_id(),
+        "--lease-seconds",
+        str(lease_seconds),
+        "--concurrency",
+        str(concurrency),
+    ]
+    if max_jobs is not None:
+        args += ["--max-jobs", str(max_jobs)]
+
+    create_command = typer.main.get_command(app).get_command(ctx, "create")
+    with create_command.make_context("create", args, parent=ctx) as create_ctx:
+        create_command.invoke(create_ctx)
+
+
+@app.command()
+def queue_stats(
+    queue: Path = typer.Option(
+        Path("queue.sqlite"),
+        "--queue",
+        help="Job queue database",
+    ),
+):
+    """Show the progress of a job queue and the throughput of its workers."""
+    if not queue.exists():
+        console.print(f"[bold red]❌ Job queue {queue} not found[/bold red]")
+        raise typer.Exit(code=1)
+
+    job_queue = JobQueue(queue, logging.getLogger("whisper_tiktok"))
+    counts = job_queue.counts()
+    console.print(
+        "  ".join(f"[cyan]{status}:[/cyan] {count}" for status, count in counts.items())
+    )
+
+    throughput = job_queue.throughput()
+    table = Table(title="Workers")
+    table.add_column("Worker", style="cyan")
+    table.add_column("Done", justify="right")
+    table.add_column("Mean job (s)", justify="right")
+    table.add_column("Videos/hour", justify="right")
+    for row in throughput:
+        table.add_row(
+            row.worker,
+            str(row.done),
+            f"{row.busy_seconds / row.done:.1f}",
+            f"{row.videos_per_hour:.1f}",
+        )
+    console.print(table)
 
 
 def _setup_event_loop():
     """Setup event loop for Windows if needed.
 
+    The selector event loop cannot spawn subprocesses on Windows, so the
+    proactor loop is required by the asynchronous command executor.
+
     Returns:
         None
     """
     if platform.system() == "Windows":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 
 if __name__ == "__main__":
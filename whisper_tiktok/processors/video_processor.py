@@ -1,11 +1,107 @@
+import asyncio
+import time
+from collections.abc import Collection
 from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
 
+from whisper_tiktok.repositories.job_manifest import JobManifest, fingerprint
 from whisper_tiktok.strategies.processing_strategy import (
     ProcessingContext,
     ProcessingStrategy,
 )
+from whisper_tiktok.utils.async_utils import first_exception
+from whisper_tiktok.utils.metrics import SIZE_BUCKETS, MetricsRegistry
+
+# Settings that change how the pipeline runs but not what it produces
+RUNTIME_CONFIG_KEYS = frozenset(
+    {
+        "workspace_path",
+        "incremental",
+        "input_file",
+        "shard",
+        "queue_path",
+        "worker_id",
+        "lease_seconds",
+        "worker_concurrency",
+        "max_jobs",
+        "tts_workers",
+        "transcription_workers",
+        "transcription_batch_size",
+        "transcription_processes",
+        "transcription_threads",
+        "composition_workers",
+        "queue_size",
+        "model_memory_mb",
+        "background_cache_mb",
+        "tts_cache_mb",
+        "metrics_dir",
+        "on_error",
+        "retries",
+    }
+)
+
+
+def build_dependency_graph(
+    strategies: list[ProcessingStrategy], available: Collection[str] = ()
+) -> list[set[int]]:
+    """Compute the dependencies of each strategy from its declared artifacts.
+
+    A strategy depends on every earlier strategy that provides one of the
+    artifacts it requires. Strategies with undeclared requirements act as
+    barriers and depend on, and are depended on by, all their neighbours.
+
+    Args:
+        strategies: Strategies in their declared pipeline order.
+        available: Artifact keys already present in the context.
+
+    Returns:
+        For each strategy, the indices of the strategies it must wait for.
+
+    Raises:
+        ValueError: If a required artifact is neither available nor provided
+            by an earlier strategy.
+    """
+    graph: list[set[int]] = []
+    for index, strategy in enumerate(strategies):
+        if strategy.requires is None:
+            graph.append(set(range(index)))
+            continue
+
+        deps = set()
+        produced: set[str] = set(available)
+        for earlier, other in enumerate(strategies[:index]):
+            if other.requires is None or other.provides & strategy.requires:
+                deps.add(earlier)
+            produced |= other.provides
+
+        missing = strategy.requires - produced
+        if missing and not any(strategies[d].requires is None for d in deps):
+            raise ValueError(
+                f"{strategy.__class__.__name__} requires artifacts that no earlier "
+                f"strategy provides: {', '.join(sorted(missing))}"
+            )
+        graph.append(deps)
+    return graph
+
+
+def dependency_levels(
+    strategies: list[ProcessingStrategy], available: Collection[str] = ()
+) -> list[list[ProcessingStrategy]]:
+    """Group strategies by depth in the dependency graph.
+
+    Strategies in the same level do not depend on each other and can run
+    concurrently once every previous level has completed.
+    """
+    graph = build_dependency_graph(strategies, available)
+    depth: list[int] = []
+    for deps in graph:
+        depth.append(1 + max((depth[d] for d in deps), default=-1))
+
+    levels: list[list[ProcessingStrategy]] = [[] for _ in set(depth)]
+    for strategy, level in zip(strategies, depth):
+        levels[level].append(strategy)
+    return levels
 
 
 @dataclass
@@ -17,8 +113,36 @@ class ProcessingResult:
     success: bool = True
 
 
+def input_fingerprint(strategy: ProcessingStrategy, context: ProcessingContext) -> str:
+    """Fingerprint the video entry, settings and artifacts a strategy reads."""
+    if strategy.config_keys is None:
+        keys = context.config.keys() - RUNTIME_CONFIG_KEYS
+    else:
+        keys = strategy.config_keys
+    if strategy.requires is None:
+        artifacts = context.artifacts
+    else:
+        artifacts = {key: context.artifacts.get(key) for key in strategy.requires}
+    return fingerprint(
+        {
+            "strategy": strategy.__class__.__name__,
+            "video": context.video_data,
+            "settings": {key: context.config.get(key) for key in sorted(keys)},
+        },
+        artifacts,
+    )
+
+
 class VideoProcessor:
-    """Main orchestrator for video processing pipeline."""
+    """Main orchestrator for video processing pipeline.
+
+    With ``incremental`` enabled, the artifacts of every completed strategy are
+    recorded in a manifest in the media folder of the video, along with the
+    fingerprint of their inputs. When the video is processed again, strategies
+    whose inputs are unchanged and whose output files still exist are skipped,
+    so an interrupted batch resumes where it stopped and only the stages
+    invalidated by a change are executed again.
+    """
 
     def __init__(
         self,
@@ -27,17 +151,24 @@ class VideoProcessor:
         config: dict,
         strategies: list[ProcessingStrategy],
         logger: Logger,
+        metrics: MetricsRegistry | None = None,
+        incremental: bool = False,
     ):
         self.uuid = uuid
         self.video_data = video_data
         self.config = config
         self.strategies = strategies
         self.logger = logger
+        self.metrics = metrics
+        self.incremental = incremental
+        self.manifest: JobManifest | None = None
 
-    async def process(self) -> ProcessingResult:
-        """Execute the processing pipeline."""
+    def pipeline_levels(self) -> list[list[ProcessingStrategy]]:
+        """Return the strategies grouped by dependency level."""
+        return dependency_levels(self.strategies)
 
-        # Initialize context
+    def create_context(self) -> ProcessingContext:
+        """Create the media/output folders and the initial processing context."""
         media_path = Path(self.config.get("workspace_path", ".")) / "media" / self.uuid
         output_path = (
             Path(self.config.get("workspace_path", ".")) / "output" / self.uuid
@@ -45,8 +176,10 @@ class VideoProcessor:
 
         media_path.mkdir(parents=True, exist_ok=True)
         output_path.mkdir(parents=True, exist_ok=True)
+        if self.incremental:
+            self.manifest = JobManifest(media_path / "manifest.json", self.logger)
 
-        context = ProcessingContext(
+        return ProcessingContext(
             video_data=self.video_data,
             uuid=self.uuid,
             media_path=media_path,
@@ -54,19 +187,153 @@ class VideoProcessor:
             config=self.config,
         )
 
-        # Execute each strategy
+    async def run_strategies(
+        self,
+        context: ProcessingContext,
+        strategies: list[ProcessingStrategy],
+        stage_slots: dict[str, asyncio.Semaphore] | None = None,
+    ) -> ProcessingContext:
+        """Execute the given strategies on the context as a dependency graph.
+
+        Each strategy starts as soon as the strategies providing its required
+        artifacts have completed, so independent steps run concurrently.
+
+        Args:
+            context: Processing context shared by all strategies.
+            strategies: Strategies to run, in pipeline order.
+            stage_slots: Optional semaphores limiting concurrency per stage.
+
+        Returns:
+            The updated processing context.
+        """
+        graph = build_dependency_graph(strategies, context.artifacts.keys())
+        tasks: list[asyncio.Task] = []
+
+        async def run(index: int) -> None:
+            if graph[index]:
+                await asyncio.gather(*(tasks[dep] for dep in graph[index]))
+
+            strategy = strategies[index]
+            slot = (stage_slots or {}).get(strategy.stage)
+            if slot is not None:
+                async with slot:
+                    await self._execute(strategy, context)
+            else:
+                await self._execute(strategy, context)
+
         try:
-            for strategy in self.strategies:
-                self.logger.info(f"Executing strategy: {strategy.__class__.__name__}")
-                context = await strategy.execute(context)
+            async with asyncio.TaskGroup() as group:
+                for index in range(len(strategies)):
+                    tasks.append(group.create_task(run(index)))
+        except ExceptionGroup as group_error:
+            raise first_exception(group_error) from None
+
+        return context
 
-            output_file = context.output_path / f"{self.uuid}.mp4"
+    async def _execute(
+        self, strategy: ProcessingStrategy, context: ProcessingContext
+    ) -> None:
+        name = strategy.__class__.__name__
+        # Steps are identified by what they produce, a class may appear twice
+        step = f"{name}:{','.join(sorted(strategy.provides))}"
+        inputs = None
+        if self.manifest is not None:
+            inputs = input_fingerprint(strategy, context)
+            outputs = self.manifest.lookup(step, inputs)
+            if outputs is not None:
+                context.artifacts.update(outputs)
+                self.logger.info(f"Skipping strategy {name}: outputs are up to date")
+                self._record_skip(strategy)
+                return
 
-            return ProcessingResult(
-                uuid=self.uuid,
-                output_path=output_file,
-                success=True,
+        self.logger.info(f"Executing strategy: {name}")
+        started = time.perf_counter()
+        status = "failure"
+        try:
+            result = await strategy.execute(context)
+            if result is not context:
+                context.artifacts.update(result.artifacts)
+            status = "success"
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            self._record(strategy, time.perf_counter() - started, status)
+
+        if self.manifest is not None:
+            self.manifest.record(
+                step,
+                inputs,
+                {
+                    key: context.artifacts[key]
+                    for key in sorted(strategy.provides)
+                    if key in context.artifacts
+                },
             )
+        if self.metrics is not None:
+            self._record_payloads(strategy, context)
+
+    def _record(
+        self, strategy: ProcessingStrategy, seconds: float, status: str
+    ) -> None:
+        if self.metrics is None:
+            return
+        labels = {"stage": strategy.stage, "strategy": strategy.__class__.__name__}
+        self.metrics.histogram(
+            "whisper_tiktok_strategy_duration_seconds",
+            "Wall time of pipeline strategies",
+        ).observe(seconds, **labels)
+        self.metrics.counter(
+            "whisper_tiktok_strategy_runs_total", "Pipeline strategy runs by outcome"
+        ).inc(status=status, **labels)
+
+    def _record_skip(self, strategy: ProcessingStrategy) -> None:
+        if self.metrics is None:
+            return
+        self.metrics.counter(
+            "whisper_tiktok_strategy_runs_total", "Pipeline strategy runs by outcome"
+        ).inc(
+            status="skipped",
+            stage=strategy.stage,
+            strategy=strategy.__class__.__name__,
+        )
+
+    def _record_payloads(
+        self, strategy: ProcessingStrategy, context: ProcessingContext
+    ) -> None:
+        """Record the size of the files and the audio a strategy produced."""
+        for key in sorted(strategy.provides):
+            value = context.artifacts.get(key)
+            if isinstance(value, Path) and value.is_file():
+                self.metrics.histogram(
+                    "whisper_tiktok_artifact_bytes",
+                    "Size of the files produced by the pipeline",
+                    buckets=SIZE_BUCKETS,
+                ).observe(value.stat().st_size, artifact=key)
+            elif key == "audio_duration":
+                self.metrics.histogram(
+                    "whisper_tiktok_audio_seconds",
+                    "Duration of the narration of composed videos",
+                ).observe(value)
+
+    def build_result(self, context: ProcessingContext) -> ProcessingResult:
+        """Build the processing result from a completed context."""
+        return ProcessingResult(
+            uuid=self.uuid,
+            output_path=context.output_path / f"{self.uuid}.mp4",
+            success=True,
+        )
+
+    async def process(self) -> ProcessingResult:
+        """Execute the processing pipeline."""
+
+        # Initialize context
+        context = self.create_context()
+
+        # Execute each strategy
+        try:
+            context = await self.run_strategies(context, self.strategies)
+            return self.build_result(context)
         except Exception:
             self.logger.exception(f"Processing failed for video {self.uuid}")
             raise
@@ -0,0 +1,109 @@
+import asyncio
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.interfaces.video_downloader import IVideoDownloader
+from whisper_tiktok.repositories.cache_index import CacheIndex, CacheStats, file_sha256
+from whisper_tiktok.repositories.keyframe_index import KeyframeIndex
+
+
+@dataclass(frozen=True)
+class BackgroundVideo:
+    """A background video stored in the cache."""
+
+    url: str
+    id: str
+    path: Path
+    size: int
+    sha256: str
+
+
+class BackgroundCache:
+    """Persistent cache of downloaded background videos, indexed by URL.
+
+    The manifest records the resolved video id, path, size and checksum of each
+    URL, so repeated requests never invoke the downloader. Concurrent requests
+    for the same URL share a single download. The keyframe index written next
+    to a video is registered as its sidecar and evicted with it.
+
+    Args:
+        cache_dir: Directory where background videos are stored.
+        downloader: Downloader used on cache misses.
+        logger: Logger instance for logging.
+        max_size_mb: Size limit of the cache in MiB, least recently used videos
+            are deleted beyond it. ``None`` or 0 means unlimited.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        downloader: IVideoDownloader,
+        logger: Logger,
+        max_size_mb: int | None = None,
+    ):
+        self.cache_dir = cache_dir
+        self.downloader = downloader
+        self.logger = logger
+        self.index = CacheIndex(
+            cache_dir, logger, max_bytes=(max_size_mb or 0) * 1024 * 1024
+        )
+        self.stats = CacheStats()
+        self._inflight: dict[str, asyncio.Future[BackgroundVideo]] = {}
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return url.strip()
+
+    def _to_video(self, url: str, entry: dict) -> BackgroundVideo:
+        return BackgroundVideo(
+            url=url,
+            id=entry["id"],
+            path=self.index.path_of(entry),
+            size=entry["size"],
+            sha256=entry["sha256"],
+        )
+
+    def lookup(self, url: str) -> BackgroundVideo | None:
+        """Return the cached video for a URL without downloading it."""
+        entry = self.index.get(self._key(url))
+        return self._to_video(url, entry) if entry is not None else None
+
+    async def get(self, url: str) -> BackgroundVideo:
+        """Return the background video for a URL, downloading it on a miss.
+
+        Args:
+            url: URL of the background video.
+
+        Returns:
+            The cached background video.
+        """
+        key = self._key(url)
+        cached = self.lookup(key)
+        if cached is not None:
+            self.stats.hits += 1
+            self.logger.debug(f"Background cache hit for {url}: {cached.path}")
+            return cached
+
+        self.stats.misses += 1
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._download(key))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared download from the cancellation of a single waiter
+        return await asyncio.shield(inflight)
+
+    async def _download(self, url: str) -> BackgroundVideo:
+        self.logger.info(f"Background cache miss, downloading {url}")
+        path = await self.downloader.download(url, self.cache_dir)
+        checksum = await asyncio.to_thread(file_sha256, path)
+        entry = self.index.put(
+            url,
+            path,
+            id=path.stem,
+            sha256=checksum,
+            url=url,
+            sidecars=[KeyframeIndex.sidecar_of(path).name],
+        )
+        return self._to_video(url, entry)
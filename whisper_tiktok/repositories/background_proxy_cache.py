@@ -0,0 +1,96 @@
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.repositories.cache_index import CacheIndex, CacheStats
+from whisper_tiktok.repositories.keyframe_index import KeyframeIndex
+from whisper_tiktok.services.ffmpeg_service import FFmpegService
+
+
+class BackgroundProxyCache:
+    """Persistent cache of vertical background proxies.
+
+    Proxies are keyed by the checksum of the source background and the
+    parameters of the background filter, so every background is transcoded
+    once for the whole batch and again only when the filter changes.
+
+    Args:
+        cache_dir: Directory where proxies are stored.
+        ffmpeg_service: Service building the proxies.
+        logger: Logger instance for logging.
+        max_size_mb: Size limit of the cache in MiB, least recently used
+            proxies are deleted beyond it. ``None`` or 0 means unlimited.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ffmpeg_service: FFmpegService,
+        logger: Logger,
+        max_size_mb: int | None = None,
+    ):
+        self.cache_dir = cache_dir
+        self.ffmpeg_service = ffmpeg_service
+        self.logger = logger
+        self.index = CacheIndex(
+            cache_dir, logger, max_bytes=(max_size_mb or 0) * 1024 * 1024
+        )
+        self.stats = CacheStats()
+        self._inflight: dict[str, asyncio.Future[Path]] = {}
+
+    def cache_key(self, background_sha256: str) -> str:
+        """Return the cache key of the proxy of a background."""
+        payload = json.dumps(
+            [background_sha256, asdict(self.ffmpeg_service.background_filter)],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, background: Path, background_sha256: str) -> Path:
+        """Return the proxy of a background, building it on a miss.
+
+        Args:
+            background: Source background video.
+            background_sha256: Checksum of the source background.
+
+        Returns:
+            Path of the cached proxy.
+        """
+        key = self.cache_key(background_sha256)
+        entry = self.index.get(key)
+        if entry is not None:
+            self.stats.hits += 1
+            self.logger.debug(f"Background proxy cache hit for {background.name}")
+            return self.index.path_of(entry)
+
+        self.stats.misses += 1
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._build(key, background))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared transcode from the cancellation of a single waiter
+        return await asyncio.shield(inflight)
+
+    async def _build(self, key: str, background: Path) -> Path:
+        self.logger.info(f"Building vertical proxy of {background.name}")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        proxy = self.cache_dir / f"{key}.mp4"
+        partial = self.cache_dir / f"{key}.{os.getpid()}.part.mp4"
+        try:
+            await self.ffmpeg_service.build_proxy(background, partial)
+            os.replace(partial, proxy)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        self.index.put(
+            key,
+            proxy,
+            source=background.name,
+            sidecars=[KeyframeIndex.sidecar_of(proxy).name],
+        )
+        return proxy
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"hits={self.hits} misses={self.misses} hit_rate={self.hit_rate:.0%}"
+
+
+class CacheIndex:
+    """JSON manifest of the files stored in an on-disk cache.
+
+    Every entry is a JSON object holding at least the cached ``path`` (relative
+    to the cache directory), its ``size`` in bytes and a ``last_used``
+    timestamp. An optional ``sidecars`` list names companion files (relative to
+    the cache directory) deleted together with the cached file. The manifest is
+    rewritten atomically after every change, and entries are evicted least
+    recently used first once the total size exceeds ``max_bytes``.
+
+    Args:
+        cache_dir: Directory holding the cached files and the manifest.
+        logger: Logger instance for logging.
+        max_bytes: Size limit of the cache. ``None`` or 0 disables eviction.
+        manifest_name: File name of the manifest inside ``cache_dir``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        logger: Logger,
+        max_bytes: int | None = None,
+        manifest_name: str = "manifest.json",
+    ):
+        self.cache_dir = cache_dir
+        self.logger = logger
+        self.max_bytes = max_bytes or 0
+        self.manifest_path = cache_dir / manifest_name
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            self.logger.warning(
+                f"Ignoring unreadable cache manifest {self.manifest_path}: {e}"
+            )
+            return {}
+
+    def _save(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._entries, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached files, in bytes."""
+        return sum(entry.get("size", 0) for entry in self._entries.values())
+
+    def path_of(self, entry: dict) -> Path:
+        """Absolute path of a cached entry."""
+        return self.cache_dir / entry["path"]
+
+    def get(self, key: str) -> dict | None:
+        """Return a valid entry and mark it as recently used.
+
+        Entries whose file is missing or whose size changed are dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            path = self.path_of(entry)
+            if not path.is_file() or path.stat().st_size != entry.get("size"):
+                self.logger.debug(f"Dropping stale cache entry {key}")
+                del self._entries[key]
+                self._save()
+                return None
+
+            entry["last_used"] = time.time()
+            self._save()
+            return dict(entry)
+
+    def put(self, key: str, path: Path, **metadata) -> dict:
+        """Register a file already stored inside the cache directory.
+
+        Args:
+            key: Cache key.
+            path: Location of the cached file.
+            **metadata: Extra JSON-serialisable fields stored with the entry.
+
+        Returns:
+            The stored entry.
+        """
+        with self._lock:
+            entry = {
+                **metadata,
+                "path": Path(os.path.relpath(path, self.cache_dir)).as_posix(),
+                "size": path.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._entries[key] = entry
+            self._evict(keep=key)
+            self._save()
+            return dict(entry)
+
+    def remove(self, key: str) -> bool:
+        """Delete an entry and its file."""
+        with self._lock:
+            removed = self._remove(key)
+            if removed:
+                self._save()
+            return removed
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        path = self.path_of(entry)
+        # Several keys may share a file (e.g. the same video behind two URLs)
+        if any(other.get("path") == entry["path"] for other in self._entries.values()):
+            return True
+        path.unlink(missing_ok=True)
+        for sidecar in entry.get("sidecars", []):
+            (self.cache_dir / sidecar).unlink(missing_ok=True)
+        return True
+
+    def _evict(self, keep: str) -> None:
+        if not self.max_bytes:
+            return
+        candidates = sorted(
+            (k for k in self._entries if k != keep),
+            key=lambda k: self._entries[k].get("last_used", 0),
+        )
+        for key in candidates:
+            if self.total_bytes <= self.max_bytes:
+                break
+            self.logger.info(f"Evicting cached file {self._entries[key]['path']}")
+            self._remove(key)
@@ -0,0 +1,180 @@
+import dataclasses
+import hashlib
+import json
+import os
+from logging import Logger
+from pathlib import Path
+from typing import Any
+
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+from whisper_tiktok.services.silence_trimmer import SpeechMap
+
+
+def _describe(value: Any) -> Any:
+    """JSON-compatible description of an artifact, files by size and mtime."""
+    if isinstance(value, Path):
+        try:
+            stat = value.stat()
+        except FileNotFoundError:
+            return {"path": value.as_posix(), "missing": True}
+        return {
+            "path": value.as_posix(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _describe(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _describe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_describe(v) for v in value]
+    return value
+
+
+def fingerprint(config: dict, artifacts: dict) -> str:
+    """Fingerprint the inputs of a pipeline step.
+
+    Args:
+        config: Configuration values the step depends on.
+        artifacts: Artifacts the step reads. Files are identified by their
+            size and modification time.
+
+    Returns:
+        A hex digest that changes whenever one of the inputs changes.
+    """
+    payload = json.dumps(
+        {"config": config, "artifacts": _describe(artifacts)},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _tag(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+# Dataclasses stored in manifests. Manifests live in job workspaces shared by
+# the queue workers, so other tags are rejected rather than imported.
+ARTIFACT_TYPES: dict[str, type] = {_tag(cls): cls for cls in (WordBoundary, SpeechMap)}
+
+
+def encode_artifact(value: Any) -> Any:
+    """Encode an artifact as JSON-compatible data, see ``decode_artifact``."""
+    if isinstance(value, Path):
+        return {"__path__": value.as_posix()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__dataclass__": _tag(type(value)),
+            "fields": {
+                f.name: encode_artifact(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, dict):
+        return {"__dict__": {str(k): encode_artifact(v) for k, v in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return [encode_artifact(v) for v in value]
+    return value
+
+
+def decode_artifact(data: Any) -> Any:
+    """Rebuild an artifact encoded by ``encode_artifact``.
+
+    Raises:
+        ValueError: If the data holds a dataclass missing from
+            ``ARTIFACT_TYPES``.
+    """
+    if isinstance(data, list):
+        return [decode_artifact(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    if "__path__" in data:
+        return Path(data["__path__"])
+    if "__dataclass__" in data:
+        cls = ARTIFACT_TYPES.get(data["__dataclass__"])
+        if cls is None:
+            raise ValueError(f"Unknown artifact type {data['__dataclass__']!r}")
+        return cls(**{k: decode_artifact(v) for k, v in data["fields"].items()})
+    return {k: decode_artifact(v) for k, v in data["__dict__"].items()}
+
+
+def _paths(value: Any):
+    if isinstance(value, Path):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _paths(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _paths(v)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for f in dataclasses.fields(value):
+            yield from _paths(getattr(value, f.name))
+
+
+class JobManifest:
+    """Record of the completed steps of a job, used to resume and rebuild it.
+
+    For every step, the manifest stores the fingerprint of its inputs and the
+    artifacts it produced. A step can be skipped on a later run when its
+    inputs still have the same fingerprint and every file it produced still
+    exists. The manifest is rewritten atomically after every step.
+
+    Args:
+        path: Location of the manifest file.
+        logger: Logger instance for logging.
+    """
+
+    def __init__(self, path: Path, logger: Logger):
+        self.path = path
+        self.logger = logger
+        self._steps: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))["steps"]
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+            self.logger.warning(f"Ignoring unreadable job manifest {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"steps": self._steps}, indent=2), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, step: str, inputs: str) -> dict | None:
+        """Return the artifacts of a step if they are still up to date.
+
+        Args:
+            step: Name of the step.
+            inputs: Fingerprint of the current inputs of the step.
+
+        Returns:
+            The artifacts the step produced, or ``None`` when it must run.
+        """
+        entry = self._steps.get(step)
+        if entry is None or entry.get("inputs") != inputs:
+            return None
+        try:
+            artifacts = decode_artifact(entry["artifacts"])
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable manifest entry {step}: {e}")
+            return None
+        if not all(path.exists() for path in _paths(artifacts)):
+            return None
+        return artifacts
+
+    def record(self, step: str, inputs: str, artifacts: dict) -> None:
+        """Store the artifacts produced by a step from the given inputs."""
+        self._steps[step] = {
+            "inputs": inputs,
+            "artifacts": encode_artifact(artifacts),
+        }
+        self._save()
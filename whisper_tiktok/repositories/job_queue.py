@@ -0,0 +1,251 @@
+import contextlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.utils.video_input import stable_hash
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    video TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    output TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, lease_expires);
+"""
+
+
+class LeaseLost(Exception):
+    """Raised when a worker no longer holds the lease of its job."""
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """A job claimed from the queue.
+
+    Attributes:
+        id: Job id, derived from the content of the video entry.
+        video: Video entry.
+        attempts: Number of times the job was claimed, this claim included.
+    """
+
+    id: str
+    video: dict
+    attempts: int
+
+
+@dataclass(frozen=True)
+class WorkerThroughput:
+    """Completed jobs of a worker.
+
+    Attributes:
+        worker: Worker id.
+        done: Number of completed jobs.
+        busy_seconds: Total processing time of the completed jobs.
+        span_seconds: Time from the first claim to the last completion.
+    """
+
+    worker: str
+    done: int
+    busy_seconds: float
+    span_seconds: float
+
+    @property
+    def videos_per_hour(self) -> float:
+        """Completed jobs per hour of wall time."""
+        return self.done * 3600 / self.span_seconds if self.span_seconds else 0.0
+
+
+class JobQueue:
+    """Queue of video jobs shared by workers on several hosts.
+
+    The queue is a SQLite database, typically on storage shared by the
+    workers. A worker claims a job with a lease that it must renew with
+    ``heartbeat`` while the job runs. Jobs whose lease expired, because their
+    worker crashed or lost the storage, are claimed again by other workers.
+    Leases compare wall clock times, so the clocks of the hosts must be
+    synchronized.
+
+    Args:
+        path: Location of the database.
+        logger: Logger instance for logging.
+        lease_seconds: Duration of a lease without heartbeat.
+        max_attempts: Number of claims after which a failing job is given up.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        logger: Logger,
+        lease_seconds: float = 300,
+        max_attempts: int = 3,
+    ):
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        self.path = path
+        self.logger = logger
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Exclusive write transaction, serializing workers across hosts."""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+
+    @staticmethod
+    def job_id(video: dict) -> str:
+        """Id of the job of a video entry, identical on every host."""
+        return f"{stable_hash(video):016x}"
+
+    def enqueue(self, videos: Iterable[dict]) -> int:
+        """Add video entries to the queue.
+
+        Entries already in the queue, whatever their status, are ignored, so
+        enqueueing the same file twice is harmless.
+
+        Returns:
+            The number of entries added.
+        """
+        now = time.time()
+        added = 0
+        with self._transaction() as db:
+            for video in videos:
+                cursor = db.execute(
+                    "INSERT OR IGNORE INTO jobs (id, video, enqueued_at) "
+                    "VALUES (?, ?, ?)",
+                    (self.job_id(video), json.dumps(video, ensure_ascii=False), now),
+                )
+                added += cursor.rowcount
+        return added
+
+    def claim(self, worker: str) -> QueuedJob | None:
+        """Lease the oldest available job to a worker.
+
+        Jobs whose lease expired are available again, unless they already
+        used all their attempts, in which case they are marked as failed.
+
+        Returns:
+            The claimed job, or ``None`` when no job is available.
+        """
+        now = time.time()
+        with self._transaction() as db:
+            expired = db.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' "
+                "ELSE 'queued' END, error = 'lease expired', worker = NULL "
+                "WHERE status = 'leased' AND lease_expires < ?",
+                (self.max_attempts, now),
+            ).rowcount
+            if expired:
+                self.logger.warning(f"Re-queued {expired} job(s) with expired leases")
+
+            row = db.execute(
+                "SELECT id, video, attempts FROM jobs WHERE status = 'queued' "
+                "ORDER BY enqueued_at, rowid LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET status = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1, started_at = ? WHERE id = ?",
+                (worker, now + self.lease_seconds, now, row[0]),
+            )
+        return QueuedJob(id=row[0], video=json.loads(row[1]), attempts=row[2] + 1)
+
+    def heartbeat(self, job_id: str, worker: str) -> bool:
+        """Renew the lease of a job.
+
+        Returns:
+            False if the worker lost the lease, the job must then be abandoned.
+        """
+        with self._transaction() as db:
+            return bool(
+                db.execute(
+                    "UPDATE jobs SET lease_expires = ? "
+                    "WHERE id = ? AND worker = ? AND status = 'leased'",
+                    (time.time() + self.lease_seconds, job_id, worker),
+                ).rowcount
+            )
+
+    def complete(self, job_id: str, worker: str, output: str) -> None:
+        """Mark a leased job as done.
+
+        Raises:
+            LeaseLost: If the worker no longer holds the lease.
+        """
+        with self._transaction() as db:
+            updated = db.execute(
+                "UPDATE jobs SET status = 'done', output = ?, finished_at = ?, "
+                "lease_expires = NULL, error = NULL "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (output, time.time(), job_id, worker),
+            ).rowcount
+        if not updated:
+            raise LeaseLost(f"Job {job_id} is no longer leased to {worker}")
+
+    def fail(self, job_id: str, worker: str, error: str) -> bool:
+        """Release a leased job after a failure.
+
+        The job is queued again until it used all its attempts.
+
+        Returns:
+            True if the job will be retried.
+        """
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' "
+                "ELSE 'queued' END, error = ?, worker = NULL, lease_expires = NULL, "
+                "finished_at = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+                (self.max_attempts, error, time.time(), job_id, worker),
+            )
+            row = db.execute(
+                "SELECT status FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row is not None and row[0] == "queued"
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per status (queued, leased, done, failed)."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        return {"queued": 0, "leased": 0, "done": 0, "failed": 0, **dict(rows)}
+
+    def throughput(self) -> list[WorkerThroughput]:
+        """Completed jobs and throughput of every worker."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT worker, COUNT(*), SUM(finished_at - started_at), "
+                "MAX(finished_at) - MIN(started_at) FROM jobs "
+                "WHERE status = 'done' GROUP BY worker ORDER BY worker"
+            ).fetchall()
+        return [WorkerThroughput(*row) for row in rows]
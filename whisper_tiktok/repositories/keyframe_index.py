@@ -0,0 +1,105 @@
+import asyncio
+import json
+import os
+from dataclasses import asdict, dataclass
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.services.ffmpeg_service import FFmpegService
+
+
+@dataclass(frozen=True)
+class Keyframes:
+    """Keyframe timestamps of a video, in seconds.
+
+    Attributes:
+        times: Sorted keyframe timestamps.
+        duration: Timestamp of the last video packet.
+        size: Size of the probed file, in bytes.
+        mtime_ns: Modification time of the probed file.
+    """
+
+    times: list[float]
+    duration: float
+    size: int
+    mtime_ns: int
+
+    def starts_fitting(self, length: float) -> list[float]:
+        """Keyframes from which ``length`` seconds of video are available."""
+        return [t for t in self.times if t + length <= self.duration]
+
+
+class KeyframeIndex:
+    """Keyframe timestamps of videos, stored next to them.
+
+    Each video is probed once. The result is written to a
+    ``<video>.keyframes.json`` sidecar and reused while the size and
+    modification time of the video are unchanged.
+
+    Args:
+        ffmpeg_service: Service probing the videos.
+        logger: Logger instance for logging.
+    """
+
+    SUFFIX = ".keyframes.json"
+
+    def __init__(self, ffmpeg_service: FFmpegService, logger: Logger):
+        self.ffmpeg_service = ffmpeg_service
+        self.logger = logger
+        self._inflight: dict[Path, asyncio.Future[Keyframes]] = {}
+
+    @classmethod
+    def sidecar_of(cls, video: Path) -> Path:
+        """Path of the sidecar holding the keyframes of a video."""
+        return video.with_name(video.name + cls.SUFFIX)
+
+    def lookup(self, video: Path) -> Keyframes | None:
+        """Return the stored keyframes of a video if they are up to date."""
+        try:
+            keyframes = Keyframes(
+                **json.loads(self.sidecar_of(video).read_text(encoding="utf-8"))
+            )
+            stat = video.stat()
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable keyframe index of {video}: {e}")
+            return None
+
+        if (keyframes.size, keyframes.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            return None
+        return keyframes
+
+    async def get(self, video: Path) -> Keyframes:
+        """Return the keyframes of a video, probing it when needed.
+
+        Args:
+            video: Video file.
+
+        Returns:
+            The keyframes of the video.
+        """
+        keyframes = self.lookup(video)
+        if keyframes is not None:
+            return keyframes
+
+        inflight = self._inflight.get(video)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._probe(video))
+            self._inflight[video] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(video, None))
+        return await asyncio.shield(inflight)
+
+    async def _probe(self, video: Path) -> Keyframes:
+        self.logger.info(f"Indexing keyframes of {video.name}")
+        stat = video.stat()
+        times, duration = await self.ffmpeg_service.probe_keyframes(video)
+        keyframes = Keyframes(
+            times=times, duration=duration, size=stat.st_size, mtime_ns=stat.st_mtime_ns
+        )
+
+        sidecar = self.sidecar_of(video)
+        tmp_path = sidecar.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(keyframes)), encoding="utf-8")
+        os.replace(tmp_path, sidecar)
+        return keyframes
@@ -0,0 +1,173 @@
+import gzip
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from logging import Logger
+from pathlib import Path
+
+# Attributes looked up through an index instead of a scan of every voice
+INDEXED_ATTRIBUTES = ("ShortName", "Locale", "Language", "Gender")
+
+# The voices of edge-tts rarely change, refresh the catalog once a week
+DEFAULT_TTL_HOURS = 24 * 7
+
+
+class VoiceCatalogError(Exception):
+    """Raised when no voice catalog can be fetched or loaded."""
+
+
+class VoiceCatalog:
+    """Voices of edge-tts, indexed by their most common lookup attributes.
+
+    The catalog is a drop-in replacement for ``edge_tts.VoicesManager``: it
+    exposes the same ``voices`` list and ``find`` method.
+
+    Args:
+        voices: Voices as returned by ``edge_tts.list_voices``.
+        fetched_at: Time the voices were fetched, in seconds since the epoch.
+    """
+
+    def __init__(self, voices: list[dict], fetched_at: float | None = None):
+        self.voices = [
+            {**voice, "Language": voice["Locale"].split("-")[0]} for voice in voices
+        ]
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self._index: dict[str, dict[str, list[int]]] = {
+            attribute: {} for attribute in INDEXED_ATTRIBUTES
+        }
+        for position, voice in enumerate(self.voices):
+            for attribute in INDEXED_ATTRIBUTES:
+                value = voice.get(attribute)
+                if value is not None:
+                    self._index[attribute].setdefault(value, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.voices)
+
+    def find(self, **attributes) -> list[dict]:
+        """Find the voices matching every given attribute.
+
+        Indexed attributes narrow the candidates down before the remaining
+        attributes are compared.
+
+        Returns:
+            The matching voices, in catalog order.
+        """
+        candidates: set[int] | None = None
+        for attribute in INDEXED_ATTRIBUTES:
+            if attribute in attributes:
+                hits = set(self._index[attribute].get(attributes[attribute], ()))
+                candidates = hits if candidates is None else candidates & hits
+        positions = range(len(self.voices)) if candidates is None else candidates
+
+        return [
+            self.voices[position]
+            for position in sorted(positions)
+            if attributes.items() <= self.voices[position].items()
+        ]
+
+    def get(self, short_name: str) -> dict | None:
+        """Return the voice with the given short name, if any."""
+        positions = self._index["ShortName"].get(short_name)
+        return self.voices[positions[0]] if positions else None
+
+    def to_dict(self) -> dict:
+        """Serialize the catalog as JSON-compatible data."""
+        return {"fetched_at": self.fetched_at, "voices": self.voices}
+
+    def save(self, path: Path) -> None:
+        """Write the catalog atomically as gzip-compressed JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        payload = json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        tmp_path.write_bytes(gzip.compress(payload.encode("utf-8")))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "VoiceCatalog":
+        """Read a catalog written by ``save``."""
+        data = json.loads(gzip.decompress(path.read_bytes()))
+        return cls(data["voices"], fetched_at=data["fetched_at"])
+
+
+async def _list_voices() -> list[dict]:
+    # edge-tts pulls in aiohttp, only import it when the catalog is refreshed
+    import edge_tts
+
+    return await edge_tts.list_voices()
+
+
+class VoiceCatalogCache:
+    """Voice catalog stored on disk and refreshed after a time to live.
+
+    A catalog younger than ``ttl_hours`` is used without any network request.
+    When the refresh of an expired catalog fails, the expired catalog is used,
+    so voices can be looked up offline.
+
+    Args:
+        path: Location of the gzip-compressed catalog.
+        logger: Logger instance for logging.
+        ttl_hours: Age after which the catalog is fetched again.
+        fetch: Coroutine function returning the voices, ``edge_tts.list_voices``
+            by default.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        logger: Logger,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        fetch: Callable[[], Awaitable[list[dict]]] | None = None,
+    ):
+        self.path = path
+        self.logger = logger
+        self.ttl_hours = ttl_hours
+        self.fetch = fetch or _list_voices
+        self._catalog: VoiceCatalog | None = None
+
+    def _load(self) -> VoiceCatalog | None:
+        try:
+            return VoiceCatalog.load(self.path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable voice catalog {self.path}: {e}")
+            return None
+
+    def _expired(self, catalog: VoiceCatalog) -> bool:
+        return time.time() - catalog.fetched_at > self.ttl_hours * 3600
+
+    async def get(self, refresh: bool = False) -> VoiceCatalog:
+        """Return the voice catalog, fetching it when missing or expired.
+
+        Args:
+            refresh: Fetch the catalog even if the stored one is still fresh.
+
+        Returns:
+            The voice catalog.
+
+        Raises:
+            VoiceCatalogError: If the catalog can neither be fetched nor loaded.
+        """
+        catalog = self._catalog or self._load()
+        if catalog is not None and not refresh and not self._expired(catalog):
+            self._catalog = catalog
+            return catalog
+
+        try:
+            voices = await self.fetch()
+        except Exception as e:
+            if catalog is None:
+                raise VoiceCatalogError(f"Could not fetch the voice list: {e}") from e
+            self.logger.warning(
+                f"Could not refresh the voice list ({e}), using the catalog "
+                f"fetched {(time.time() - catalog.fetched_at) / 3600:.0f}h ago"
+            )
+            self._catalog = catalog
+            return catalog
+
+        self._catalog = VoiceCatalog(voices)
+        self._catalog.save(self.path)
+        self.logger.debug(f"Stored {len(self._catalog)} voices in {self.path}")
+        return self._catalog
@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import unicodedata
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.interfaces.tts_service import ITTSService, WordBoundary
+from whisper_tiktok.repositories.cache_index import CacheIndex, CacheStats
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so that equivalent scripts share a cache entry."""
+    text = unicodedata.normalize("NFC", text)
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def link_or_copy(source: Path, destination: Path) -> None:
+    """Hard-link a file to its destination, copying it when linking fails."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class CachedTTSService(ITTSService):
+    """TTS service backed by a persistent on-disk audio cache.
+
+    Audio is keyed by a hash of the normalized text, the voice and the prosody
+    options. Cache hits are hard-linked (or copied) to the requested output file
+    without calling the wrapped service. When the wrapped service reports word
+    boundaries they are stored next to the audio in a ``.words.json`` sidecar.
+
+    Args:
+        backend: TTS service used on cache misses.
+        cache_dir: Directory where synthesized audio is stored.
+        logger: Logger instance for logging.
+        max_size_mb: Size limit of the cache in MiB, least recently used audio
+            is deleted beyond it. ``None`` or 0 means unlimited.
+    """
+
+    def __init__(
+        self,
+        backend: ITTSService,
+        cache_dir: Path,
+        logger: Logger,
+        max_size_mb: int | None = None,
+    ):
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self.logger = logger
+        self.index = CacheIndex(
+            cache_dir, logger, max_bytes=(max_size_mb or 0) * 1024 * 1024
+        )
+        self.stats = CacheStats()
+        self._inflight: dict[str, asyncio.Future[Path]] = {}
+
+    @staticmethod
+    def cache_key(text: str, voice: str, rate: str, volume: str, pitch: str) -> str:
+        """Return the cache key of a synthesis request."""
+        payload = json.dumps(
+            [normalize_text(text), voice, rate, volume, pitch], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _words_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.words.json"
+
+    async def synthesize(
+        self,
+        text: str,
+        output_file: Path,
+        voice: str = "en-US-ChristopherNeural",
+        rate: str = "+0%",
+        volume: str = "+0%",
+        pitch: str = "+0Hz",
+    ) -> None:
+        key = self.cache_key(text, voice, rate, volume, pitch)
+        cached = await self._fetch(key, text, voice, rate, volume, pitch, words=False)
+        link_or_copy(cached, output_file)
+
+    async def synthesize_with_boundaries(
+        self,
+        text: str,
+        output_file: Path,
+        voice: str = "en-US-ChristopherNeural",
+        rate: str = "+0%",
+        volume: str = "+0%",
+        pitch: str = "+0Hz",
+    ) -> list[WordBoundary]:
+        key = self.cache_key(text, voice, rate, volume, pitch)
+        cached = await self._fetch(key, text, voice, rate, volume, pitch, words=True)
+        link_or_copy(cached, output_file)
+        try:
+            payload = json.loads(self._words_path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise NotImplementedError(
+                f"{type(self.backend).__name__} does not report word boundaries"
+            ) from e
+        return [WordBoundary(word, start, end) for word, start, end in payload]
+
+    async def _fetch(
+        self,
+        key: str,
+        text: str,
+        voice: str,
+        rate: str,
+        volume: str,
+        pitch: str,
+        words: bool,
+    ) -> Path:
+        entry = self.index.get(key)
+        # Entries cached before word boundaries were recorded lack the sidecar
+        if entry is not None and (not words or self._words_path(key).is_file()):
+            self.stats.hits += 1
+            self.logger.debug(f"TTS cache hit for {key[:12]}")
+            return self.index.path_of(entry)
+
+        self.stats.misses += 1
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._synthesize(key, text, voice, rate, volume, pitch)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def _synthesize(
+        self, key: str, text: str, voice: str, rate: str, volume: str, pitch: str
+    ) -> Path:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cached = self.cache_dir / f"{key}.mp3"
+        partial = self.cache_dir / f"{key}.{os.getpid()}.part.mp3"
+        try:
+            # Word timings come for free with the audio, keep them when available
+            try:
+                words = await self.backend.synthesize_with_boundaries(
+                    text, partial, voice, rate=rate, volume=volume, pitch=pitch
+                )
+            except NotImplementedError:
+                words = None
+                await self.backend.synthesize(
+                    text, partial, voice, rate=rate, volume=volume, pitch=pitch
+                )
+            os.replace(partial, cached)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        sidecars = []
+        if words is not None:
+            words_path = self._words_path(key)
+            partial_words = words_path.with_suffix(f".{os.getpid()}.tmp")
+            partial_words.write_text(
+                json.dumps([[w.text, w.start, w.end] for w in words]),
+                encoding="utf-8",
+            )
+            os.replace(partial_words, words_path)
+            sidecars.append(words_path.name)
+
+        self.index.put(
+            key,
+            cached,
+            voice=voice,
+            rate=rate,
+            volume=volume,
+            pitch=pitch,
+            sidecars=sidecars,
+        )
+        return cached
@@ -0,0 +1,92 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class FFmpegProgress:
+    """Progress report of a running ffmpeg encode.
+
+    Attributes:
+        output: File being written by ffmpeg.
+        frame: Number of frames encoded so far.
+        fps: Current encoding speed in frames per second.
+        out_time: Media time encoded so far, in seconds.
+        speed: Encoding speed relative to real time, if known.
+        total_duration: Expected media duration, in seconds, if known.
+        finished: True for the last report of the encode.
+    """
+
+    output: Path
+    frame: int
+    fps: float
+    out_time: float
+    speed: float | None
+    total_duration: float | None = None
+    finished: bool = False
+
+    @property
+    def percent(self) -> float | None:
+        """Completion percentage, when the total duration is known."""
+        if self.finished:
+            return 100.0
+        if not self.total_duration:
+            return None
+        return min(100.0, 100.0 * self.out_time / self.total_duration)
+
+
+def _to_float(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value.rstrip("x"))
+    except ValueError:
+        return None
+
+
+class FFmpegProgressParser:
+    """Incremental parser of ffmpeg ``-progress`` key=value output.
+
+    ffmpeg writes one ``key=value`` per line and terminates each report with a
+    ``progress=continue`` or ``progress=end`` line. Every complete report is
+    turned into an FFmpegProgress and passed to ``on_progress``.
+
+    Args:
+        output: File being written by ffmpeg.
+        on_progress: Callback receiving each parsed report.
+        total_duration: Expected media duration, in seconds.
+    """
+
+    def __init__(
+        self,
+        output: Path,
+        on_progress: Callable[[FFmpegProgress], None],
+        total_duration: float | None = None,
+    ):
+        self.output = output
+        self.on_progress = on_progress
+        self.total_duration = total_duration
+        self._fields: dict[str, str] = {}
+
+    def feed(self, line: str) -> None:
+        """Consume one line of ffmpeg progress output."""
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return
+        if key != "progress":
+            self._fields[key] = value
+            return
+
+        fields, self._fields = self._fields, {}
+        out_time_us = _to_float(fields.get("out_time_us") or fields.get("out_time_ms"))
+        self.on_progress(
+            FFmpegProgress(
+                output=self.output,
+                frame=int(_to_float(fields.get("frame")) or 0),
+                fps=_to_float(fields.get("fps")) or 0.0,
+                out_time=max(0.0, (out_time_us or 0.0) / 1_000_000),
+                speed=_to_float(fields.get("speed")),
+                total_duration=self.total_duration,
+                finished=value == "end",
+            )
+        )
@@ -1,10 +1,18 @@
-import json
 import os
+from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
 from typing import NamedTuple
 
 from whisper_tiktok.execution.command_executor import CommandExecutor, ExecutionResult
+from whisper_tiktok.services.ffmpeg_progress import FFmpegProgress, FFmpegProgressParser
+from whisper_tiktok.services.media_probe import MediaProber, ProbeResult, parse_ffprobe
+from whisper_tiktok.services.render_profile import (
+    RENDER_PROFILES,
+    OutputVariant,
+    RenderProfile,
+)
+from whisper_tiktok.utils.event_bus import EventBus
 
 
 class FFmpegError(Exception):
@@ -48,73 +56,420 @@ class MediaInfo(NamedTuple):
         milliseconds = int((time_in_seconds - int(time_in_seconds)) * 1000)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
 
+    @staticmethod
+    def parse_time(time_str: str) -> float:
+        """
+        Converts a "hh:mm:ss.mmm" string back to seconds.
+
+        Args:
+            time_str (str): The time in the format "hh:mm:ss.mmm".
+
+        Returns:
+            float: The time in seconds.
+        """
+        seconds = 0.0
+        for part in time_str.split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
+
     @property
     def duration(self) -> float:
-        """Extracts the duration of the audio stream from the FFprobe JSON output."""
-        d = json.loads(self.json)
+        """Extracts the duration of the audio stream from the FFprobe JSON output.
+
+        The JSON is parsed once, later accesses reuse the parsed result.
+        """
+        return parse_ffprobe(self.json).audio_duration
 
-        streams = d.get("streams", [])
-        audio_stream = None
-        for stream in streams:
-            if stream["codec_type"] == "audio":
-                audio_stream = stream
-                break
 
-        if audio_stream is None:
-            raise ValueError("No audio stream found")
+@dataclass(frozen=True)
+class BackgroundFilter:
+    """Crop, scale and blur applied to turn a background into a vertical video.
 
-        return float(audio_stream["duration"])
+    Attributes:
+        width (int): Output width in pixels.
+        height (int): Output height in pixels.
+        blur_sigma (float): Sigma of the gaussian blur, 0 disables it.
+        scaler (str): Scaling algorithm of the ffmpeg scale filter.
+    """
+
+    width: int = 1080
+    height: int = 1920
+    blur_sigma: float = 2
+    scaler: str = "lanczos"
+
+    @property
+    def chain(self) -> str:
+        """The ffmpeg filter chain applying the transformation."""
+        filters = [
+            f"crop=ih/{self.height}*{self.width}:ih",
+            f"scale=w={self.width}:h={self.height}:flags={self.scaler}",
+        ]
+        if self.blur_sigma:
+            filters.append(f"gblur=sigma={self.blur_sigma:g}")
+        return ",".join(filters)
 
 
 class FFmpegService:
-    """Service for FFmpeg operations."""
+    """Service for FFmpeg operations.
+
+    Args:
+        executor: Executor running the ffmpeg/ffprobe processes.
+        logger: Logger instance for logging.
+        progress_bus: Optional bus receiving FFmpegProgress events while videos
+            are being composed.
+        background_filter: Transformation applied to background videos.
+            Defaults to the resolution and scaler of the render profile.
+        render_profile: Resolution and encoder settings of the rendered
+            videos. Defaults to the standard profile.
+        prober: Memoized media prober, shared between services to share its
+            results. Defaults to a prober of its own.
+    """
 
-    def __init__(self, executor: CommandExecutor, logger: Logger):
+    def __init__(
+        self,
+        executor: CommandExecutor,
+        logger: Logger,
+        progress_bus: EventBus[FFmpegProgress] | None = None,
+        background_filter: BackgroundFilter | None = None,
+        render_profile: RenderProfile | None = None,
+        prober: MediaProber | None = None,
+    ):
         self.executor = executor
         self.logger = logger
+        self.progress_bus = progress_bus
+        self.prober = prober or MediaProber(executor, logger)
+        self.render_profile = render_profile or RENDER_PROFILES["standard"]
+        self.background_filter = background_filter or BackgroundFilter(
+            width=self.render_profile.width,
+            height=self.render_profile.height,
+            scaler=self.render_profile.scaler,
+        )
+
+    def _build_video_filters(self, subtitles: Path, prefiltered: bool = False) -> str:
+        subtitles_filter = f"ass={subtitles.as_posix()}"
+        if prefiltered:
+            return subtitles_filter
+        return f"{self.background_filter.chain},{subtitles_filter}"
 
-    def _build_video_filters(self, subtitles: Path) -> str:
-        return rf"crop=ih/16*9:ih,scale=w=1080:h=1920:flags=lanczos,gblur=sigma=2,ass={subtitles.as_posix()}"
+    @staticmethod
+    def _subtitle_margin(subtitles: Path, share: float) -> int:
+        """Convert a share of the video height to an ASS vertical margin.
+
+        Margins are expressed in the script resolution of the subtitles, not
+        in pixels of the video.
+        """
+        play_res_y = 288  # Assumed by libass when the script does not set it
+        with subtitles.open(encoding="utf-8-sig") as f:
+            for line in f:
+                if line.startswith("PlayResY:"):
+                    play_res_y = int(line.partition(":")[2])
+                    break
+                if line.strip() == "[V4+ Styles]":
+                    break
+        return round(play_res_y * share)
+
+    def _build_variants_graph(
+        self, subtitles: Path, variants: list[OutputVariant], prefiltered: bool
+    ) -> str:
+        """Filter graph decoding the background once for every output.
+
+        The background is transformed once, then split into the main video,
+        labelled ``out0``, and one branch per variant, labelled ``out1``...
+        Variants of another size are scaled and cropped from the main one.
+        """
+        branches = len(variants) + 1
+        chain = "" if prefiltered else f"{self.background_filter.chain},"
+        labels = "".join(f"[v{i}]" for i in range(branches))
+        graph = [
+            f"[0:v]{chain}split={branches}{labels}",
+            f"[v0]ass={subtitles.as_posix()}[out0]",
+        ]
+        size = (self.background_filter.width, self.background_filter.height)
+        for index, variant in enumerate(variants, 1):
+            filters = []
+            if (variant.width, variant.height) != size:
+                filters += [
+                    f"scale=w={variant.width}:h={variant.height}"
+                    f":force_original_aspect_ratio=increase"
+                    f":flags={self.render_profile.scaler}",
+                    f"crop={variant.width}:{variant.height}",
+                ]
+            if variant.safe_margin is None:
+                filters.append(f"ass={subtitles.as_posix()}")
+            else:
+                margin = self._subtitle_margin(subtitles, variant.safe_margin)
+                filters.append(
+                    f"subtitles=filename={subtitles.as_posix()}"
+                    f":force_style='MarginV={margin}'"
+                )
+            graph.append(f"[v{index}]{','.join(filters)}[out{index}]")
+        return ";".join(graph)
+
+    def _encoder_args(self, variant: OutputVariant | None = None) -> list[str]:
+        profile = self.render_profile
+        args = ["-c:v", profile.video_codec, "-preset", profile.preset]
+        if variant is not None and variant.video_bitrate:
+            bitrate = variant.video_bitrate
+            args += ["-b:v", bitrate, "-maxrate", bitrate, "-bufsize", bitrate]
+        else:
+            args += ["-crf", str(profile.crf)]
+        audio_bitrate = (variant and variant.audio_bitrate) or profile.audio_bitrate
+        return [*args, "-c:a", "aac", "-ac", "2", "-b:a", audio_bitrate]
+
+    def _build_variants_command(
+        self,
+        background: Path,
+        audio: Path,
+        output: Path,
+        start_time: float,
+        duration: str,
+        graph: str,
+        variants: list[OutputVariant],
+    ) -> list[str]:
+        command = [
+            "ffmpeg",
+            "-y",
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            "-ss",
+            f"{start_time:.3f}",
+            "-t",
+            duration,
+            "-i",
+            background.as_posix(),
+            "-i",
+            audio.as_posix(),
+            "-filter_complex",
+            graph,
+        ]
+        outputs = [(output, None), *((v.output_path(output), v) for v in variants)]
+        for index, (path, variant) in enumerate(outputs):
+            # The narration is decoded once and encoded for every output
+            command += [
+                "-map",
+                f"[out{index}]",
+                "-map",
+                "1:a",
+                *self._encoder_args(variant),
+                "-threads",
+                str(os.cpu_count()),
+                path.as_posix(),
+            ]
+        return command
 
     def _build_ffmpeg_command(
         self,
         background: Path,
         audio: Path,
         output: Path,
-        start_time: int,
+        start_time: float,
         duration: str,
         filters: str,
-    ) -> str:
-        return rf"ffmpeg -ss {start_time} -t {duration} -i {background.as_posix()} -i {audio.as_posix()} -map 0:v -map 1:a -filter:v {filters} -c:v libx264 -crf 23 -c:a aac -ac 2 -b:a 192K {output.as_posix()} -y -threads {os.cpu_count()}"
+    ) -> list[str]:
+        return [
+            "ffmpeg",
+            "-ss",
+            f"{start_time:.3f}",
+            "-t",
+            duration,
+            "-i",
+            background.as_posix(),
+            "-i",
+            audio.as_posix(),
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+            "-filter:v",
+            filters,
+            *self._encoder_args(),
+            output.as_posix(),
+            "-y",
+            "-threads",
+            str(os.cpu_count()),
+            "-progress",
+            "pipe:1",
+            "-nostats",
+        ]
 
-    def compose_video(
+    async def compose_video(
         self,
         background: Path,
         audio: Path,
         subtitles: Path,
         output: Path,
-        start_time: int,
+        start_time: float,
         duration: str,
+        timeout: float | None = None,
+        prefiltered: bool = False,
+        variants: list[OutputVariant] | None = None,
     ) -> Path:
-        """Compose final video with background, audio, and subtitles."""
+        """Compose final video with background, audio, and subtitles.
 
-        # Build filter complex
-        filters = self._build_video_filters(subtitles)
+        With ``variants``, the renditions for other platforms are encoded by
+        the same ffmpeg process, next to ``output`` (see
+        ``OutputVariant.output_path``), so the background is decoded and
+        transformed only once.
 
-        command = self._build_ffmpeg_command(
-            background, audio, output, start_time, duration, filters
+        Args:
+            background: Background video.
+            audio: Narration audio.
+            subtitles: ASS subtitles burned into the video.
+            output: Path of the composed video.
+            start_time: Offset of the background, in seconds.
+            duration: Duration of the video, as "hh:mm:ss.mmm".
+            timeout: Timeout in seconds for the ffmpeg process.
+            prefiltered: Whether the background is a proxy built by
+                ``build_proxy``, in which case only the subtitles are burned in.
+            variants: Renditions encoded along with the video.
+
+        Returns:
+            Path of the composed video.
+        """
+
+        if variants:
+            graph = self._build_variants_graph(subtitles, variants, prefiltered)
+            command = self._build_variants_command(
+                background, audio, output, start_time, duration, graph, variants
+            )
+        else:
+            # Build filter complex
+            filters = self._build_video_filters(subtitles, prefiltered=prefiltered)
+            command = self._build_ffmpeg_command(
+                background, audio, output, start_time, duration, filters
+            )
+        parser = FFmpegProgressParser(
+            output, self._publish_progress, MediaInfo.parse_time(duration)
+        )
+        result = await self.executor.execute(
+            command, timeout=timeout, on_stdout_line=parser.feed
         )
-        result = self.executor.execute(command)
 
         if result.returncode != 0:
             raise FFmpegError(f"Failed to compose video: {result.stderr}")
 
         return output
 
-    def get_media_info(self, file_path: Path) -> MediaInfo:
+    async def build_proxy(
+        self, background: Path, output: Path, timeout: float | None = None
+    ) -> Path:
+        """Transcode a background once into a cropped, scaled and blurred proxy.
+
+        The proxy has no audio and is encoded at high quality, so composing on
+        top of it only costs the subtitle burn-in and the final encode.
+
+        Args:
+            background: Source background video.
+            output: Path of the proxy video.
+            timeout: Timeout in seconds for the ffmpeg process.
+
+        Returns:
+            Path of the proxy video.
+        """
+        command = [
+            "ffmpeg",
+            "-i",
+            background.as_posix(),
+            "-an",
+            "-filter:v",
+            self.background_filter.chain,
+            "-c:v",
+            "libx264",
+            "-crf",
+            "18",
+            "-preset",
+            "veryfast",
+            "-movflags",
+            "+faststart",
+            output.as_posix(),
+            "-y",
+            "-threads",
+            str(os.cpu_count()),
+            "-progress",
+            "pipe:1",
+            "-nostats",
+        ]
+        parser = FFmpegProgressParser(output, self._publish_progress)
+        result = await self.executor.execute(
+            command, timeout=timeout, on_stdout_line=parser.feed
+        )
+
+        if result.returncode != 0:
+            raise FFmpegError(f"Failed to build background proxy: {result.stderr}")
+
+        return output
+
+    def _publish_progress(self, progress: FFmpegProgress) -> None:
+        if self.progress_bus is not None:
+            self.progress_bus.publish(progress)
+
+    async def probe_keyframes(self, file_path: Path) -> tuple[list[float], float]:
+        """List the keyframe timestamps of the first video stream.
+
+        Only packet headers are read, the video is not decoded.
+
+        Args:
+            file_path: Video to probe.
+
+        Returns:
+            The sorted keyframe timestamps and the timestamp of the last packet,
+            both in seconds.
+        """
+        keyframes: list[float] = []
+        last_pts = 0.0
+
+        def parse(line: str) -> None:
+            nonlocal last_pts
+            pts, _, flags = line.partition(",")
+            try:
+                timestamp = float(pts)
+            except ValueError:
+                return
+            last_pts = max(last_pts, timestamp)
+            if "K" in flags:
+                keyframes.append(timestamp)
+
+        command = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts_time,flags",
+            "-of",
+            "csv=p=0",
+            file_path.as_posix(),
+        ]
+        result = await self.executor.execute(command, on_stdout_line=parse)
+
+        if result.returncode != 0:
+            raise FFmpegError(f"Failed to probe keyframes: {result.stderr}")
+
+        return sorted(keyframes), last_pts
+
+    async def probe(self, file_path: Path) -> ProbeResult:
+        """Get the format and streams of a media file.
+
+        MP3, WAV and MP4 headers are read in-process and results are memoized
+        by path, size and modification time, see ``MediaProber``.
+        """
+        return await self.prober.probe(file_path)
+
+    async def get_media_info(self, file_path: Path) -> MediaInfo:
         """Get media information using ffprobe."""
-        command = f"ffprobe -v quiet -print_format json -show_format -show_streams {file_path.as_posix()}"
-        result = self.executor.execute(command)
+        command = [
+            "ffprobe",
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            file_path.as_posix(),
+        ]
+        result = await self.executor.execute(command)
 
         if result.returncode != 0:
             raise FFmpegError(f"Failed to probe media: {result.stderr}")
@@ -0,0 +1,459 @@
+import asyncio
+import functools
+import json
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.execution.command_executor import CommandExecutor
+
+
+class MediaProbeError(ValueError):
+    """Raised when a media file cannot be probed or lacks the stream asked for."""
+
+
+@dataclass(frozen=True)
+class StreamInfo:
+    """A stream of a media file.
+
+    Attributes:
+        codec_type: "audio" or "video".
+        codec_name: Codec, named as by ffprobe, e.g. "mp3", "aac" or "h264".
+        duration: Duration of the stream in seconds, ``None`` when unknown.
+        width: Width in pixels of a video stream.
+        height: Height in pixels of a video stream.
+        sample_rate: Sample rate of an audio stream.
+        channels: Channel count of an audio stream.
+    """
+
+    codec_type: str
+    codec_name: str
+    duration: float | None = None
+    width: int | None = None
+    height: int | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Format and streams of a media file.
+
+    Attributes:
+        format_name: Container, e.g. "mp3", "mp4" or "wav".
+        duration: Duration of the file in seconds.
+        streams: Streams of the file, in order.
+    """
+
+    format_name: str
+    duration: float
+    streams: tuple[StreamInfo, ...]
+
+    @property
+    def audio(self) -> StreamInfo | None:
+        """The first audio stream."""
+        return next((s for s in self.streams if s.codec_type == "audio"), None)
+
+    @property
+    def video(self) -> StreamInfo | None:
+        """The first video stream."""
+        return next((s for s in self.streams if s.codec_type == "video"), None)
+
+    @property
+    def audio_duration(self) -> float:
+        """Duration of the first audio stream, in seconds.
+
+        Raises:
+            MediaProbeError: If the file has no audio stream.
+        """
+        if self.audio is None:
+            raise MediaProbeError("No audio stream found")
+        return self.audio.duration if self.audio.duration is not None else self.duration
+
+
+def _optional(value, cast):
+    return cast(value) if value not in (None, "N/A") else None
+
+
+@functools.lru_cache(maxsize=256)
+def parse_ffprobe(output: str) -> ProbeResult:
+    """Parse the JSON of ``ffprobe -show_format -show_streams``.
+
+    Results are cached by output, so repeated parses of one probe are free.
+    """
+    data = json.loads(output)
+    streams = tuple(
+        StreamInfo(
+            codec_type=stream.get("codec_type", ""),
+            codec_name=stream.get("codec_name", ""),
+            duration=_optional(stream.get("duration"), float),
+            width=_optional(stream.get("width"), int),
+            height=_optional(stream.get("height"), int),
+            sample_rate=_optional(stream.get("sample_rate"), int),
+            channels=_optional(stream.get("channels"), int),
+        )
+        for stream in data.get("streams", [])
+    )
+    file_format = data.get("format", {})
+    duration = _optional(file_format.get("duration"), float)
+    if duration is None:
+        duration = max((s.duration or 0.0 for s in streams), default=0.0)
+    return ProbeResult(file_format.get("format_name", ""), duration, streams)
+
+
+# MPEG audio, indexed by version bits: 0 MPEG 2.5, 2 MPEG 2, 3 MPEG 1
+_MPEG_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+# kbit/s by (MPEG 1, layer) for bitrate indexes 1 to 14
+_MPEG_BITRATES = {
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+@dataclass(frozen=True)
+class _MpegFrame:
+    mpeg1: bool
+    layer: int
+    sample_rate: int
+    channels: int
+    samples: int
+    length: int
+
+
+def _mpeg_frame(header: bytes) -> _MpegFrame | None:
+    """Decode an MPEG audio frame header, ``None`` when it is not one."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = 4 - ((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _MPEG_BITRATES[(mpeg1, layer)][bitrate_index - 1] * 1000
+    sample_rate = _MPEG_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x01
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if mpeg1 or layer == 2 else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    channels = 1 if header[3] >> 6 == 3 else 2
+    return _MpegFrame(mpeg1, layer, sample_rate, channels, samples, length)
+
+
+def probe_mp3(data: bytes) -> ProbeResult | None:
+    """Probe an MPEG audio file from its frame headers.
+
+    The frame count comes from the Xing/Info header written by encoders such
+    as LAME, otherwise every frame header is visited, which is exact for
+    variable bitrates and only reads 4 bytes per frame.
+    """
+    position = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = size << 7 | (byte & 0x7F)
+        position = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    # Find two consecutive frames, a single sync word can occur by chance
+    while position + 4 <= len(data):
+        first = _mpeg_frame(data[position : position + 4])
+        if first is not None:
+            following = position + first.length
+            if following + 4 > len(data) or _mpeg_frame(
+                data[following : following + 4]
+            ):
+                break
+        position = data.find(b"\xff", position + 1)
+        if position < 0:
+            return None
+    else:
+        return None
+
+    # The Xing/Info tag follows the side information of the first frame
+    if first.mpeg1:
+        side_info = 32 if first.channels == 2 else 17
+    else:
+        side_info = 17 if first.channels == 2 else 9
+    tag = position + 4 + side_info
+    frames = None
+    if data[tag : tag + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", data, tag + 4)
+        if flags & 0x01:
+            (frames,) = struct.unpack_from(">I", data, tag + 8)
+    if frames is None:
+        frames = 0
+        while position + 4 <= len(data):
+            frame = _mpeg_frame(data[position : position + 4])
+            if frame is None:
+                break
+            frames += 1
+            position += frame.length
+
+    duration = frames * first.samples / first.sample_rate
+    codec = f"mp{first.layer}"
+    stream = StreamInfo(
+        "audio",
+        codec,
+        duration,
+        sample_rate=first.sample_rate,
+        channels=first.channels,
+    )
+    return ProbeResult(codec, duration, (stream,))
+
+
+def probe_wav(data: bytes) -> ProbeResult | None:
+    """Probe a PCM WAV file from its RIFF chunks."""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    position = 12
+    fmt = None
+    while position + 8 <= len(data):
+        chunk = data[position : position + 4]
+        (size,) = struct.unpack_from("<I", data, position + 4)
+        if chunk == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", data, position + 8)
+        elif chunk == b"data" and fmt is not None:
+            audio_format, channels, sample_rate, byte_rate, _, bits = fmt
+            if audio_format != 1 or not byte_rate:
+                return None
+            duration = size / byte_rate
+            codec = "pcm_u8" if bits == 8 else f"pcm_s{bits}le"
+            stream = StreamInfo(
+                "audio",
+                codec,
+                duration,
+                sample_rate=sample_rate,
+                channels=channels,
+            )
+            return ProbeResult("wav", duration, (stream,))
+        position += 8 + size + (size & 1)
+    return None
+
+
+# Sample entry formats of MP4 tracks, named as by ffprobe
+_MP4_CODECS = {
+    b"avc1": "h264",
+    b"avc3": "h264",
+    b"hvc1": "hevc",
+    b"hev1": "hevc",
+    b"av01": "av1",
+    b"vp09": "vp9",
+    b"mp4a": "aac",
+    b"Opus": "opus",
+    b"ac-3": "ac3",
+}
+
+
+def _boxes(data: bytes, start: int = 0, end: int | None = None):
+    """Yield the (type, payload start, payload end) of consecutive boxes."""
+    end = len(data) if end is None else end
+    position = start
+    while position + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", data, position)
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", data, position + 8)
+            header = 16
+        elif size == 0:
+            size = end - position
+        if size < header:
+            return
+        yield kind, position + header, min(position + size, end)
+        position += size
+
+
+def _child(data: bytes, start: int, end: int, kind: bytes) -> tuple[int, int] | None:
+    for box, payload, box_end in _boxes(data, start, end):
+        if box == kind:
+            return payload, box_end
+    return None
+
+
+def _media_header(data: bytes, start: int) -> tuple[int, int]:
+    """Timescale and duration of a ``mvhd`` or ``mdhd`` box."""
+    if data[start] == 1:
+        return struct.unpack_from(">IQ", data, start + 20)
+    return struct.unpack_from(">II", data, start + 12)
+
+
+def _mp4_track(moov: bytes, start: int, end: int) -> StreamInfo | None:
+    mdia = _child(moov, start, end, b"mdia")
+    if mdia is None:
+        return None
+    hdlr = _child(moov, *mdia, b"hdlr")
+    mdhd = _child(moov, *mdia, b"mdhd")
+    if hdlr is None or mdhd is None:
+        return None
+    handler = moov[hdlr[0] + 8 : hdlr[0] + 12]
+    if handler not in (b"vide", b"soun"):
+        return None
+    timescale, length = _media_header(moov, mdhd[0])
+    duration = length / timescale if timescale else None
+
+    stsd = None
+    minf = _child(moov, *mdia, b"minf")
+    stbl = minf and _child(moov, *minf, b"stbl")
+    if stbl:
+        stsd = _child(moov, *stbl, b"stsd")
+    entry = None
+    if stsd is not None and stsd[0] + 16 <= stsd[1]:
+        entry = stsd[0] + 8  # version, flags and entry count
+    fourcc = moov[entry + 4 : entry + 8] if entry is not None else b""
+    codec = _MP4_CODECS.get(fourcc, fourcc.decode("latin-1").strip())
+
+    if handler == b"vide":
+        width = height = None
+        if entry is not None and entry + 36 <= stsd[1]:
+            width, height = struct.unpack_from(">HH", moov, entry + 32)
+        return StreamInfo("video", codec, duration, width=width, height=height)
+
+    channels = sample_rate = None
+    if entry is not None and entry + 36 <= stsd[1]:
+        channels = struct.unpack_from(">H", moov, entry + 24)[0]
+        sample_rate = struct.unpack_from(">I", moov, entry + 32)[0] >> 16
+    return StreamInfo(
+        "audio", codec, duration, sample_rate=sample_rate, channels=channels
+    )
+
+
+def probe_mp4(path: Path) -> ProbeResult | None:
+    """Probe an MP4/MOV file from its ``moov`` box.
+
+    Only the box headers are read until ``moov`` is found, the media data is
+    skipped. Fragmented files, whose ``moov`` has no duration, are not
+    handled.
+    """
+    with path.open("rb") as f:
+        head = f.read(8)
+        if len(head) < 8 or head[4:8] != b"ftyp":
+            return None
+        f.seek(0)
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            size, kind = struct.unpack(">I4s", header)
+            header_size = 8
+            if size == 1:
+                (size,) = struct.unpack(">Q", f.read(8))
+                header_size = 16
+            if kind == b"moov":
+                moov = f.read(size - header_size if size else -1)
+                break
+            if size < header_size:
+                return None
+            f.seek(size - header_size, 1)
+
+    mvhd = _child(moov, 0, len(moov), b"mvhd")
+    if mvhd is None:
+        return None
+    timescale, length = _media_header(moov, mvhd[0])
+    if not timescale or not length:
+        return None
+    streams = tuple(
+        track
+        for kind, start, end in _boxes(moov)
+        if kind == b"trak" and (track := _mp4_track(moov, start, end)) is not None
+    )
+    return ProbeResult("mp4", length / timescale, streams)
+
+
+# Native probes by file extension, other files go through ffprobe
+_NATIVE_PROBES = {
+    ".mp3": lambda path: probe_mp3(path.read_bytes()),
+    ".wav": lambda path: probe_wav(path.read_bytes()),
+    ".mp4": probe_mp4,
+    ".m4a": probe_mp4,
+    ".mov": probe_mp4,
+}
+
+
+def probe_native(path: Path) -> ProbeResult | None:
+    """Probe a file without ffprobe, ``None`` for unsupported files."""
+    probe = _NATIVE_PROBES.get(path.suffix.lower())
+    if probe is None:
+        return None
+    try:
+        return probe(path)
+    except (struct.error, IndexError, ValueError):
+        # Truncated or unusual headers, let ffprobe decide
+        return None
+
+
+class MediaProber:
+    """Probes media files, memoized by path, size and modification time.
+
+    MP3, WAV and MP4 headers are parsed in-process, only other containers,
+    or files whose headers cannot be parsed, start an ffprobe process.
+
+    Args:
+        executor: Executor running ffprobe.
+        logger: Logger instance for logging.
+        max_entries: Number of probe results kept in memory.
+    """
+
+    def __init__(
+        self, executor: CommandExecutor, logger: Logger, max_entries: int = 1024
+    ):
+        self.executor = executor
+        self.logger = logger
+        self.max_entries = max_entries
+        self._results: OrderedDict[tuple, ProbeResult] = OrderedDict()
+
+    async def probe(self, file_path: Path) -> ProbeResult:
+        """Probe a media file.
+
+        Raises:
+            MediaProbeError: If ffprobe fails on the file.
+            FileNotFoundError: If the file does not exist.
+        """
+        stat = file_path.stat()
+        key = (file_path.resolve().as_posix(), stat.st_size, stat.st_mtime_ns)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+
+        result = await asyncio.to_thread(probe_native, file_path)
+        if result is None:
+            self.logger.debug(f"Probing {file_path} with ffprobe")
+            result = parse_ffprobe(await self.run_ffprobe(file_path))
+
+        self._results[key] = result
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    async def run_ffprobe(self, file_path: Path) -> str:
+        """JSON output of ffprobe describing the format and streams of a file."""
+        command = [
+            "ffprobe",
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            file_path.as_posix(),
+        ]
+        result = await self.executor.execute(command)
+
+        if result.returncode != 0:
+            raise MediaProbeError(f"Failed to probe {file_path}: {result.stderr}")
+
+        return result.stdout
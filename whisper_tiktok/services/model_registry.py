@@ -0,0 +1,194 @@
+import contextlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging import Logger
+from typing import Any, NamedTuple
+
+
+class ModelKey(NamedTuple):
+    """Identifies a loaded model."""
+
+    name: str
+    device: str
+    precision: str
+
+
+@dataclass
+class ModelRegistryStats:
+    """Counters collected by the model registry."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    load_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions} "
+            f"hit_rate={self.hit_rate:.0%} load_time={self.load_seconds:.2f}s"
+        )
+
+
+@dataclass
+class _Entry:
+    model: Any
+    size_bytes: int
+
+
+def model_size_bytes(model: Any) -> int:
+    """Estimate the memory used by a torch module's parameters and buffers."""
+    size = 0
+    for attr in ("parameters", "buffers"):
+        tensors = getattr(model, attr, None)
+        if tensors is None:
+            continue
+        size += sum(t.numel() * t.element_size() for t in tensors())
+    # Dynamically quantized linear layers keep their int8 weights packed
+    for module in getattr(model, "modules", tuple)():
+        weight_bias = getattr(module, "_weight_bias", None)
+        if callable(weight_bias):
+            size += sum(
+                t.numel() * t.element_size() for t in weight_bias() if t is not None
+            )
+    return size
+
+
+class WhisperModelRegistry:
+    """Process-wide cache of loaded Whisper models.
+
+    Each (model name, device, precision) is loaded once and shared by every
+    transcription. When the total size of the loaded models exceeds the memory
+    budget, the least recently used models are evicted.
+
+    Whisper attaches kv-cache and alignment hooks to the modules of a model
+    on every decode, so a shared model must not run two inferences at once:
+    inference goes through ``use``, which serializes it per model.
+
+    Args:
+        loader: Callable loading a model from (name, device, precision).
+        logger: Logger instance for logging.
+        memory_budget_mb: Maximum memory used by the loaded models, in MiB.
+            ``None`` or 0 disables eviction.
+        on_evict: Optional callback invoked with the key of each evicted model,
+            once the registry dropped its reference, e.g. to release
+            accelerator memory.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str, str, str], Any],
+        logger: Logger,
+        memory_budget_mb: int | None = None,
+        on_evict: Callable[[ModelKey], None] | None = None,
+    ):
+        self.loader = loader
+        self.logger = logger
+        self.memory_budget = (memory_budget_mb or 0) * 1024 * 1024
+        self.on_evict = on_evict
+        self.stats = ModelRegistryStats()
+        self._models: OrderedDict[ModelKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inference_locks: dict[ModelKey, threading.RLock] = {}
+
+    @property
+    def memory_used(self) -> int:
+        """Total estimated size of the loaded models, in bytes."""
+        return sum(entry.size_bytes for entry in self._models.values())
+
+    def __contains__(self, key: ModelKey) -> bool:
+        return key in self._models
+
+    def get(self, name: str, device: str, precision: str = "fp32") -> Any:
+        """Return a loaded model, loading it on first use.
+
+        Args:
+            name: Whisper model name (tiny, base, ..., turbo).
+            device: Torch device the model runs on.
+            precision: Weight precision of the model.
+
+        Returns:
+            The loaded model.
+        """
+        key = ModelKey(name, device, precision)
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None:
+                self._models.move_to_end(key)
+                self.stats.hits += 1
+                return entry.model
+
+            self.stats.misses += 1
+            start = time.perf_counter()
+            model = self.loader(name, device, precision)
+            elapsed = time.perf_counter() - start
+            self.stats.load_seconds += elapsed
+
+            entry = _Entry(model=model, size_bytes=model_size_bytes(model))
+            self.logger.debug(
+                f"Loaded Whisper model {key} in {elapsed:.2f}s "
+                f"({entry.size_bytes / 1024**2:.0f} MiB)"
+            )
+            self._evict_for(entry.size_bytes)
+            self._models[key] = entry
+            return model
+
+    @contextlib.contextmanager
+    def use(self, name: str, device: str, precision: str = "fp32"):
+        """Hold a model for one inference, loading it on first use.
+
+        Inferences on the same model run one at a time, callers wait for the
+        model to be free. The lock is reentrant, so an inference may fall back
+        to another one on the same model.
+
+        Yields:
+            The loaded model.
+        """
+        key = ModelKey(name, device, precision)
+        with self._lock:
+            inference_lock = self._inference_locks.setdefault(key, threading.RLock())
+        with inference_lock:
+            yield self.get(name, device, precision)
+
+    def evict(self, key: ModelKey) -> bool:
+        """Drop a model from the registry.
+
+        Returns:
+            True if the model was loaded.
+        """
+        with self._lock:
+            return self._evict(key)
+
+    def clear(self) -> None:
+        """Drop every loaded model."""
+        with self._lock:
+            for key in list(self._models):
+                self._evict(key)
+
+    def _evict_for(self, incoming: int) -> None:
+        if not self.memory_budget:
+            return
+        while self._models and self.memory_used + incoming > self.memory_budget:
+            self._evict(next(iter(self._models)))
+        if incoming > self.memory_budget:
+            self.logger.warning(
+                f"Whisper model needs {incoming / 1024**2:.0f} MiB, more than the "
+                f"{self.memory_budget / 1024**2:.0f} MiB budget"
+            )
+
+    def _evict(self, key: ModelKey) -> bool:
+        if self._models.pop(key, None) is None:
+            return False
+        self.stats.evictions += 1
+        self.logger.debug(f"Evicted Whisper model {key}")
+        if self.on_evict is not None:
+            self.on_evict(key)
+        return True
@@ -0,0 +1,216 @@
+import json
+import os
+import platform
+import re
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.execution.command_executor import CommandExecutor
+from whisper_tiktok.services.render_profile import CALIBRATED_PROFILE, RenderProfile
+
+CANDIDATE_PRESETS = (
+    "ultrafast",
+    "superfast",
+    "veryfast",
+    "faster",
+    "fast",
+    "medium",
+    "slow",
+)
+
+_SSIM_ALL = re.compile(r"All:([\d.]+)")
+
+
+class CalibrationError(Exception):
+    """Custom exception for failed render calibrations."""
+
+
+@dataclass
+class PresetMeasurement:
+    """Encoding speed and quality of one encoder preset on the sample clip."""
+
+    preset: str
+    encode_seconds: float
+    bitrate_kbps: float
+    ssim: float
+
+
+@dataclass
+class CalibrationResult:
+    """Outcome of a calibration run.
+
+    Attributes:
+        profile: Fastest profile meeting the quality and bitrate targets.
+        measurements: Measurements of every candidate preset.
+        min_ssim: Minimum SSIM required against the lossless sample.
+        max_bitrate_kbps: Maximum video bitrate allowed, if any.
+        machine: Host the calibration ran on.
+    """
+
+    profile: RenderProfile
+    measurements: list[PresetMeasurement]
+    min_ssim: float
+    max_bitrate_kbps: float | None = None
+    machine: str = field(default_factory=platform.node)
+
+    def to_dict(self) -> dict:
+        """Serialize the result to a JSON-compatible dict."""
+        return {
+            "profile": self.profile.to_dict(),
+            "measurements": [asdict(m) for m in self.measurements],
+            "min_ssim": self.min_ssim,
+            "max_bitrate_kbps": self.max_bitrate_kbps,
+            "machine": self.machine,
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the result as JSON, atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+class RenderCalibrator:
+    """Picks the fastest encoder preset that meets a quality target.
+
+    A short synthetic clip is rendered losslessly at the resolution of the base
+    profile, then encoded with every candidate preset. Each encode is timed and
+    compared with the lossless clip through ffmpeg's SSIM filter.
+
+    Args:
+        executor: Executor running the ffmpeg processes.
+        logger: Logger instance for logging.
+        duration: Length of the sample clip, in seconds.
+    """
+
+    def __init__(
+        self, executor: CommandExecutor, logger: Logger, duration: float = 5.0
+    ):
+        self.executor = executor
+        self.logger = logger
+        self.duration = duration
+
+    async def calibrate(
+        self,
+        base: RenderProfile,
+        presets: tuple[str, ...] = CANDIDATE_PRESETS,
+        min_ssim: float = 0.95,
+        max_bitrate_kbps: float | None = None,
+    ) -> CalibrationResult:
+        """Measure the candidate presets and select the fastest acceptable one.
+
+        Args:
+            base: Profile providing the resolution, encoder and CRF.
+            presets: Candidate encoder presets.
+            min_ssim: Minimum SSIM of an acceptable encode.
+            max_bitrate_kbps: Maximum video bitrate of an acceptable encode.
+
+        Returns:
+            The calibration result, whose profile is named "calibrated".
+        """
+        with tempfile.TemporaryDirectory(prefix="whisper-tiktok-calibration-") as tmp:
+            workdir = Path(tmp)
+            reference = await self._render_reference(base, workdir / "reference.mkv")
+            measurements = [
+                await self._measure(base.with_preset(preset), reference, workdir)
+                for preset in presets
+            ]
+
+        acceptable = [
+            m
+            for m in measurements
+            if m.ssim >= min_ssim
+            and (max_bitrate_kbps is None or m.bitrate_kbps <= max_bitrate_kbps)
+        ]
+        if not acceptable:
+            raise CalibrationError(
+                f"No preset reached SSIM {min_ssim}"
+                + (f" under {max_bitrate_kbps} kb/s" if max_bitrate_kbps else "")
+            )
+
+        fastest = min(acceptable, key=lambda m: m.encode_seconds)
+        self.logger.info(f"Fastest acceptable preset: {fastest.preset}")
+        return CalibrationResult(
+            profile=base.with_preset(fastest.preset, name=CALIBRATED_PROFILE),
+            measurements=measurements,
+            min_ssim=min_ssim,
+            max_bitrate_kbps=max_bitrate_kbps,
+        )
+
+    async def _render_reference(self, profile: RenderProfile, output: Path) -> Path:
+        # Noise keeps the sample from being unrealistically easy to compress
+        source = (
+            f"testsrc2=size={profile.width}x{profile.height}:rate=30"
+            f":duration={self.duration},noise=alls=12:allf=t"
+        )
+        await self._ffmpeg(
+            ["-f", "lavfi", "-i", source, "-c:v", "ffv1", output.as_posix(), "-y"],
+            "render the calibration sample",
+        )
+        return output
+
+    async def _measure(
+        self, profile: RenderProfile, reference: Path, workdir: Path
+    ) -> PresetMeasurement:
+        encoded = workdir / f"{profile.preset}.mp4"
+        started = time.perf_counter()
+        await self._ffmpeg(
+            [
+                "-i",
+                reference.as_posix(),
+                "-c:v",
+                profile.video_codec,
+                "-preset",
+                profile.preset,
+                "-crf",
+                str(profile.crf),
+                "-pix_fmt",
+                "yuv420p",
+                encoded.as_posix(),
+                "-y",
+            ],
+            f"encode with preset {profile.preset}",
+        )
+        encode_seconds = time.perf_counter() - started
+
+        result = await self._ffmpeg(
+            [
+                "-i",
+                encoded.as_posix(),
+                "-i",
+                reference.as_posix(),
+                "-lavfi",
+                "ssim",
+                "-f",
+                "null",
+                "-",
+            ],
+            f"measure SSIM of preset {profile.preset}",
+        )
+        match = _SSIM_ALL.search(result)
+        if match is None:
+            raise CalibrationError(f"No SSIM reported for preset {profile.preset}")
+
+        measurement = PresetMeasurement(
+            preset=profile.preset,
+            encode_seconds=encode_seconds,
+            bitrate_kbps=encoded.stat().st_size * 8 / 1000 / self.duration,
+            ssim=float(match.group(1)),
+        )
+        self.logger.info(
+            f"{measurement.preset}: {measurement.encode_seconds:.2f}s, "
+            f"{measurement.bitrate_kbps:.0f} kb/s, SSIM {measurement.ssim:.4f}"
+        )
+        return measurement
+
+    async def _ffmpeg(self, arguments: list[str], action: str) -> str:
+        result = await self.executor.execute(
+            ["ffmpeg", "-hide_banner", "-nostats", *arguments]
+        )
+        if result.returncode != 0:
+            raise CalibrationError(f"Failed to {action}: {result.stderr}")
+        return result.stderr
@@ -0,0 +1,168 @@
+import json
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+CALIBRATED_PROFILE = "calibrated"
+
+
+class RenderProfileError(Exception):
+    """Custom exception for unknown or unreadable render profiles."""
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """Resolution and encoder settings used to render videos.
+
+    Attributes:
+        name (str): Name of the profile.
+        width (int): Output width in pixels.
+        height (int): Output height in pixels.
+        scaler (str): Scaling algorithm of the ffmpeg scale filter.
+        video_codec (str): ffmpeg video encoder.
+        preset (str): Encoder speed/compression preset.
+        crf (int): Constant rate factor, lower is better quality.
+        audio_bitrate (str): AAC bitrate, e.g. "192k".
+    """
+
+    name: str
+    width: int = 1080
+    height: int = 1920
+    scaler: str = "lanczos"
+    video_codec: str = "libx264"
+    preset: str = "medium"
+    crf: int = 23
+    audio_bitrate: str = "192k"
+
+    def to_dict(self) -> dict:
+        """Serialize the profile to a JSON-compatible dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RenderProfile":
+        """Build a profile from the output of ``to_dict``."""
+        return cls(**data)
+
+    def with_preset(self, preset: str, name: str | None = None) -> "RenderProfile":
+        """Return a copy of the profile using another encoder preset."""
+        return replace(self, preset=preset, name=name or self.name)
+
+
+RENDER_PROFILES: dict[str, RenderProfile] = {
+    # Half resolution, for quickly reviewing timing and layout
+    "draft": RenderProfile(
+        "draft",
+        width=540,
+        height=960,
+        scaler="bilinear",
+        preset="ultrafast",
+        crf=28,
+        audio_bitrate="96k",
+    ),
+    "standard": RenderProfile("standard"),
+    "final": RenderProfile("final", preset="slow", crf=18, audio_bitrate="256k"),
+}
+
+
+@dataclass(frozen=True)
+class OutputVariant:
+    """Rendition of a video for another platform.
+
+    Variants are encoded by the same ffmpeg process as the main video, from
+    the same decoded and filtered background.
+
+    Attributes:
+        name (str): Name of the variant, appended to the file name of the video.
+        width (int): Output width in pixels.
+        height (int): Output height in pixels, the background is cropped when
+            the aspect ratio differs from the render profile.
+        video_bitrate (str | None): Target video bitrate, e.g. "8M", also used
+            as the maximum rate. ``None`` uses the crf of the render profile.
+        audio_bitrate (str | None): AAC bitrate, that of the render profile by
+            default.
+        safe_margin (float | None): Share of the height kept free of subtitles
+            from the edge they are aligned to, where the platform draws its
+            interface. ``None`` keeps the margins of the subtitle style.
+    """
+
+    name: str
+    width: int = 1080
+    height: int = 1920
+    video_bitrate: str | None = None
+    audio_bitrate: str | None = None
+    safe_margin: float | None = None
+
+    def output_path(self, output: Path) -> Path:
+        """Path of the variant of the video written to ``output``."""
+        return output.with_name(f"{output.stem}.{self.name}{output.suffix}")
+
+
+OUTPUT_VARIANTS: dict[str, OutputVariant] = {
+    "shorts": OutputVariant("shorts", video_bitrate="10M", safe_margin=0.15),
+    "reels": OutputVariant(
+        "reels", video_bitrate="5M", audio_bitrate="128k", safe_margin=0.2
+    ),
+    # 4:5 post in the Instagram feed
+    "feed": OutputVariant(
+        "feed",
+        height=1350,
+        video_bitrate="5M",
+        audio_bitrate="128k",
+        safe_margin=0.1,
+    ),
+}
+
+
+def load_output_variants(names: list[str] | None) -> list[OutputVariant]:
+    """Resolve output variants by name.
+
+    Args:
+        names: Names from ``OUTPUT_VARIANTS``, duplicates are ignored.
+
+    Returns:
+        The variants, in the order of ``names``.
+    """
+    variants = []
+    for name in dict.fromkeys(names or ()):
+        if name not in OUTPUT_VARIANTS:
+            raise RenderProfileError(
+                f"Unknown output variant {name!r}, choose from: "
+                f"{', '.join(OUTPUT_VARIANTS)}"
+            )
+        variants.append(OUTPUT_VARIANTS[name])
+    return variants
+
+
+def load_render_profile(
+    name: str | None = None, calibration_file: Path | None = None
+) -> RenderProfile:
+    """Resolve a render profile by name.
+
+    Args:
+        name: One of ``RENDER_PROFILES`` or ``"calibrated"``. Defaults to
+            ``"standard"``.
+        calibration_file: JSON written by the ``calibrate`` command, required
+            by the calibrated profile.
+
+    Returns:
+        The render profile.
+    """
+    name = name or "standard"
+    if name in RENDER_PROFILES:
+        return RENDER_PROFILES[name]
+    if name != CALIBRATED_PROFILE:
+        raise RenderProfileError(
+            f"Unknown render profile {name!r}, choose from: "
+            f"{', '.join([*RENDER_PROFILES, CALIBRATED_PROFILE])}"
+        )
+
+    if calibration_file is None or not calibration_file.is_file():
+        raise RenderProfileError(
+            "No calibration found, run 'whisper-tiktok calibrate' first"
+        )
+    try:
+        data = json.loads(calibration_file.read_text(encoding="utf-8"))
+        return RenderProfile.from_dict(data["profile"])
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise RenderProfileError(
+            f"Invalid calibration file {calibration_file}: {e}"
+        ) from e
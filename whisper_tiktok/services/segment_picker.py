@@ -0,0 +1,79 @@
+import random
+import threading
+from enum import Enum
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.repositories.keyframe_index import KeyframeIndex
+
+
+class BackgroundSeek(str, Enum):
+    """How the start offset of the background footage is chosen."""
+
+    START = "start"
+    RANDOM = "random"
+    ROUND_ROBIN = "round-robin"
+
+
+class SegmentPicker:
+    """Chooses where each video starts in its background.
+
+    Offsets are always keyframes, so ffmpeg input seeking jumps straight to
+    them without decoding the preceding footage, and always leave enough
+    background for the whole narration.
+
+    Random offsets spread the videos over the background. Round-robin offsets
+    walk through the background one segment after the other, so videos of a
+    batch never share footage until the background is used up.
+
+    Args:
+        keyframe_index: Index providing the keyframes of the backgrounds.
+        logger: Logger instance for logging.
+        mode: Offset selection mode.
+        seed: Seed of the random offsets, for reproducible batches.
+    """
+
+    def __init__(
+        self,
+        keyframe_index: KeyframeIndex,
+        logger: Logger,
+        mode: BackgroundSeek | str | None = BackgroundSeek.RANDOM,
+        seed: int | None = None,
+    ):
+        self.keyframe_index = keyframe_index
+        self.logger = logger
+        self.mode = BackgroundSeek(mode or BackgroundSeek.RANDOM)
+        self._random = random.Random(seed)
+        self._cursors: dict[Path, float] = {}
+        self._lock = threading.Lock()
+
+    async def pick(self, background: Path, duration: float) -> float:
+        """Choose the start offset of a video in a background.
+
+        Args:
+            background: Background video.
+            duration: Length of the video, in seconds.
+
+        Returns:
+            The start offset in seconds, 0 when the background is too short.
+        """
+        if self.mode is BackgroundSeek.START:
+            return 0.0
+
+        keyframes = await self.keyframe_index.get(background)
+        starts = keyframes.starts_fitting(duration)
+        if not starts:
+            self.logger.warning(
+                f"Background {background.name} ({keyframes.duration:.1f}s) is "
+                f"shorter than the video ({duration:.1f}s), starting at 0"
+            )
+            return 0.0
+
+        if self.mode is BackgroundSeek.RANDOM:
+            return self._random.choice(starts)
+
+        with self._lock:
+            cursor = self._cursors.get(background, 0.0)
+            start = next((t for t in starts if t >= cursor), starts[0])
+            self._cursors[background] = start + duration
+        return start
@@ -0,0 +1,255 @@
+import asyncio
+import bisect
+import os
+import wave
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from whisper_tiktok.execution.command_executor import CommandExecutor
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class SilenceTrimError(Exception):
+    """Raised when a narration cannot be decoded or trimmed."""
+
+
+@dataclass(frozen=True)
+class SpeechMap:
+    """Parts of a narration kept by the silence trimming.
+
+    The kept parts are played back to back in the trimmed audio, so a time in
+    the original narration maps to a time in the trimmed one.
+
+    Attributes:
+        regions: Kept (start, end) intervals of the original narration, in
+            seconds, sorted and disjoint.
+        duration: Duration of the original narration, in seconds.
+    """
+
+    regions: tuple[tuple[float, float], ...]
+    duration: float
+
+    @classmethod
+    def build(
+        cls, speech: list[tuple[float, float]], duration: float, max_pause: float
+    ) -> "SpeechMap":
+        """Keep the speech regions and at most ``max_pause`` of every pause.
+
+        Every region is extended by half of ``max_pause`` on both sides, so
+        shorter pauses are kept whole, longer ones are shortened to
+        ``max_pause`` and the leading and trailing silence to half of it.
+        """
+        margin = max_pause / 2
+        regions: list[tuple[float, float]] = []
+        for start, end in speech:
+            start, end = max(0.0, start - margin), min(duration, end + margin)
+            if regions and start <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], max(regions[-1][1], end))
+            else:
+                regions.append((start, end))
+        return cls(tuple(regions), duration)
+
+    @property
+    def offsets(self) -> list[float]:
+        """Start of every kept region in the trimmed narration."""
+        offsets, position = [], 0.0
+        for start, end in self.regions:
+            offsets.append(position)
+            position += end - start
+        return offsets
+
+    @property
+    def trimmed_duration(self) -> float:
+        """Duration of the trimmed narration, in seconds."""
+        return sum(end - start for start, end in self.regions)
+
+    def to_trimmed(self, time: float) -> float:
+        """Map a time of the original narration to the trimmed one.
+
+        Times inside a removed pause map to the cut that replaced it.
+        """
+        if not self.regions:
+            return 0.0
+        index = bisect.bisect_right([start for start, _ in self.regions], time) - 1
+        if index < 0:
+            return 0.0
+        start, end = self.regions[index]
+        return self.offsets[index] + min(time, end) - start
+
+
+def detect_speech(
+    samples: "np.ndarray",
+    sample_rate: int,
+    threshold_db: float = -35.0,
+    frame_seconds: float = 0.02,
+    min_silence: float = 0.15,
+    min_speech: float = 0.05,
+) -> list[tuple[float, float]]:
+    """Find the speech regions of a mono signal from its short-term energy.
+
+    The signal is split into frames whose RMS level is compared to the loudest
+    frame, so the threshold does not depend on the volume of the voice. Runs
+    of voiced frames separated by less than ``min_silence`` are merged and
+    runs shorter than ``min_speech`` are dropped as clicks.
+
+    Args:
+        samples: Mono PCM samples.
+        sample_rate: Sample rate of ``samples``.
+        threshold_db: Level below the loudest frame under which a frame is
+            silent.
+        frame_seconds: Duration of the analysis frames.
+        min_silence: Shortest pause separating two regions, in seconds.
+        min_speech: Shortest region, in seconds.
+
+    Returns:
+        The (start, end) times of the speech regions, in seconds.
+    """
+    import numpy as np
+
+    frame = max(1, int(sample_rate * frame_seconds))
+    count = len(samples) // frame
+    if count == 0:
+        return []
+    frames = samples[: count * frame].astype(np.float32).reshape(count, frame)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    peak = rms.max()
+    if peak == 0:
+        return []
+    voiced = 20 * np.log10(np.maximum(rms, peak * 1e-6) / peak) > threshold_db
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.view(np.int8), [0]))))
+    starts, ends = edges[0::2], edges[1::2]
+    if len(starts) == 0:
+        return []
+    # Merge the runs separated by short pauses, e.g. between two words
+    split = starts[1:] - ends[:-1] >= min_silence / frame_seconds
+    starts = starts[np.concatenate(([True], split))]
+    ends = ends[np.concatenate((split, [True]))]
+    long_enough = ends - starts >= min_speech / frame_seconds
+
+    seconds = frame / sample_rate
+    return [
+        (float(start * seconds), float(end * seconds))
+        for start, end in zip(starts[long_enough], ends[long_enough])
+    ]
+
+
+def cut_regions(
+    samples: "np.ndarray", sample_rate: int, speech_map: SpeechMap
+) -> "np.ndarray":
+    """Concatenate the samples of the kept regions."""
+    import numpy as np
+
+    parts = [
+        samples[round(start * sample_rate) : round(end * sample_rate)]
+        for start, end in speech_map.regions
+    ]
+    return np.concatenate(parts) if parts else samples[:0]
+
+
+class SilenceTrimmer:
+    """Removes the silence of synthesized narrations before transcription.
+
+    edge-tts leaves silence at both ends of the audio and pauses between the
+    sections of the script. The narration is decoded once to PCM, its speech
+    regions are found with ``detect_speech`` and the leading, trailing and
+    long pauses are cut, so Whisper decodes less audio and the video is not
+    longer than the speech.
+
+    Args:
+        executor: Executor running ffmpeg.
+        logger: Logger instance for logging.
+        threshold_db: Level below the loudest part of the narration under
+            which audio counts as silence.
+        max_pause: Longest pause kept between two speech regions, in seconds.
+        sample_rate: Sample rate of the trimmed narration, edge-tts
+            synthesizes at 24 kHz.
+    """
+
+    def __init__(
+        self,
+        executor: CommandExecutor,
+        logger: Logger,
+        threshold_db: float | None = -35.0,
+        max_pause: float | None = 0.3,
+        sample_rate: int = 24000,
+    ):
+        self.executor = executor
+        self.logger = logger
+        self.threshold_db = -35.0 if threshold_db is None else threshold_db
+        self.max_pause = 0.3 if max_pause is None else max_pause
+        self.sample_rate = sample_rate
+
+    async def decode(self, audio_file: Path, pcm_file: Path) -> "np.ndarray":
+        """Decode an audio file to mono 16-bit PCM samples."""
+        import numpy as np
+
+        command = [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-i",
+            audio_file.as_posix(),
+            "-ac",
+            "1",
+            "-ar",
+            str(self.sample_rate),
+            "-f",
+            "s16le",
+            pcm_file.as_posix(),
+            "-y",
+        ]
+        try:
+            result = await self.executor.execute(command)
+            if result.returncode != 0:
+                raise SilenceTrimError(
+                    f"Failed to decode {audio_file}: {result.stderr}"
+                )
+            return await asyncio.to_thread(np.fromfile, pcm_file, dtype="<i2")
+        finally:
+            pcm_file.unlink(missing_ok=True)
+
+    async def trim(self, audio_file: Path, output: Path) -> SpeechMap:
+        """Write the narration without its silence as a WAV file.
+
+        Args:
+            audio_file: Narration to trim.
+            output: Path of the trimmed WAV file.
+
+        Returns:
+            The kept regions of the narration.
+
+        Raises:
+            SilenceTrimError: If the narration cannot be decoded or contains
+                no speech.
+        """
+        samples = await self.decode(
+            audio_file, output.with_suffix(f".{os.getpid()}.pcm")
+        )
+        duration = len(samples) / self.sample_rate
+        speech = detect_speech(samples, self.sample_rate, self.threshold_db)
+        if not speech:
+            raise SilenceTrimError(f"No speech found in {audio_file}")
+
+        speech_map = SpeechMap.build(speech, duration, self.max_pause)
+        await asyncio.to_thread(
+            self._write_wav, cut_regions(samples, self.sample_rate, speech_map), output
+        )
+        self.logger.debug(
+            f"Trimmed {audio_file.name} from {duration:.2f}s to "
+            f"{speech_map.trimmed_duration:.2f}s ({len(speech)} speech regions)"
+        )
+        return speech_map
+
+    def _write_wav(self, samples: "np.ndarray", output: Path) -> None:
+        tmp_path = output.with_suffix(f".{os.getpid()}.tmp")
+        with wave.open(tmp_path.as_posix(), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(samples.astype("<i2").tobytes())
+        os.replace(tmp_path, output)
@@ -1,16 +1,236 @@
+import contextlib
+import functools
+import gc
+import logging
+import os
+from dataclasses import asdict
+from enum import Enum
 from pathlib import Path
 
-import stable_whisper
-import torch
+from whisper_tiktok.interfaces.transcription_service import (
+    ITranscriptionService,
+    TranscriptionJob,
+)
+from whisper_tiktok.services.model_registry import ModelKey, WhisperModelRegistry
 
-from whisper_tiktok.interfaces.transcription_service import ITranscriptionService
+
+class WhisperPrecision(str, Enum):
+    """Weight precision of the Whisper models."""
+
+    FP32 = "fp32"
+    FP16 = "fp16"
+    INT8 = "int8"
+
+
+def quantize_whisper_model(model):
+    """Quantize the linear layers of a Whisper model to int8, in place.
+
+    Weights are stored as int8 and activations are quantized on the fly
+    (dynamic quantization), which speeds up CPU inference and shrinks the
+    model about fourfold. whisper uses its own ``Linear`` subclass, which has
+    to be listed next to ``nn.Linear`` to be matched.
+    """
+    import torch
+    import whisper.model
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear, whisper.model.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def _load_quantized(name: str, cache_dir: Path | None):
+    """Load an int8 model, from the quantized weights cached in ``cache_dir``.
+
+    The cache only holds the model dimensions, the state dict and the
+    alignment heads, read back with ``weights_only`` so loading it never runs
+    pickled code. A tampered file can still hold wrong weights, so
+    ``cache_dir`` should not be writable by untrusted users.
+    """
+    import stable_whisper
+    import torch
+    import whisper
+    from whisper.model import ModelDimensions, Whisper
+
+    logger = logging.getLogger("whisper_tiktok")
+    cache_file = None
+    if cache_dir is not None:
+        # Quantized weights are tied to the torch version that packed them
+        version = torch.__version__.split("+")[0]
+        cache_file = cache_dir / f"{name}-int8-torch{version}.pt"
+
+    if cache_file is not None and cache_file.is_file():
+        try:
+            checkpoint = torch.load(cache_file, map_location="cpu", weights_only=True)
+            model = quantize_whisper_model(
+                Whisper(ModelDimensions(**checkpoint["dims"]))
+            )
+            model.load_state_dict(checkpoint["state_dict"])
+            if checkpoint["alignment_heads"] is not None:
+                model.set_alignment_heads(checkpoint["alignment_heads"].encode())
+            stable_whisper.modify_model(model)
+            return model
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable quantized model {cache_file}: {e}")
+
+    model = stable_whisper.load_model(name, device=torch.device("cpu"))
+    quantize_whisper_model(model)
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        # Alignment heads are base85 bytes, stored as str for weights_only
+        alignment_heads = whisper._ALIGNMENT_HEADS.get(name)
+        torch.save(
+            {
+                "dims": asdict(model.dims),
+                "state_dict": model.state_dict(),
+                "alignment_heads": alignment_heads and alignment_heads.decode(),
+            },
+            tmp_path,
+        )
+        os.replace(tmp_path, cache_file)
+        logger.info(f"Cached int8 Whisper model {name} in {cache_file}")
+    return model
+
+
+def load_whisper_model(
+    name: str, device: str, precision: str, quantized_cache_dir: Path | None = None
+):
+    """Load a Whisper model with stable-ts.
+
+    Args:
+        name: Whisper model name.
+        device: Torch device to load the model on.
+        precision: Weight precision, "fp32", "fp16" or "int8". int8 models
+            always run on the CPU.
+        quantized_cache_dir: Directory caching the int8 weights, so a model is
+            quantized only once.
+
+    Returns:
+        The loaded model.
+    """
+    import stable_whisper
+    import torch
+
+    if precision == WhisperPrecision.INT8:
+        return _load_quantized(name, quantized_cache_dir)
+
+    model = stable_whisper.load_model(name, device=torch.device(device))
+    if precision == "fp16":
+        model = model.half()
+    return model
+
+
+def release_whisper_model(key: ModelKey) -> None:
+    """Release the accelerator memory held by an evicted model."""
+    if key.device.startswith("cuda"):
+        import torch
+
+        gc.collect()
+        torch.cuda.empty_cache()
+
+
+def worker_transcription_service(
+    threads: int | None = None,
+    model: str | None = None,
+    precision: str | None = None,
+    quantized_cache_dir: Path | None = None,
+) -> "TranscriptionService":
+    """Build the transcription service of a transcription worker process.
+
+    Args:
+        threads: Number of torch intra-op threads, all cores when ``None``.
+        model: Whisper model loaded right away, so the first job does not
+            pay for it.
+        precision: Weight precision of the models.
+        quantized_cache_dir: Directory caching the int8 weights.
+
+    Returns:
+        A service with its own model registry.
+    """
+    import torch
+
+    if threads:
+        torch.set_num_threads(threads)
+        # Parallelism comes from the processes, not from inter-op threads
+        torch.set_num_interop_threads(1)
+
+    logger = logging.getLogger("whisper_tiktok")
+    service = TranscriptionService(
+        logger,
+        WhisperModelRegistry(
+            loader=functools.partial(
+                load_whisper_model, quantized_cache_dir=quantized_cache_dir
+            ),
+            logger=logger,
+            on_evict=release_whisper_model,
+        ),
+        precision=precision,
+    )
+    if model:
+        service.preload(model)
+    return service
 
 
 class TranscriptionService(ITranscriptionService):
-    """Service for transcribing audio using Whisper."""
+    """Service for transcribing audio using Whisper.
+
+    torch, whisper and stable-ts take seconds to import, so they are only
+    imported once a transcription runs, not when the service is created.
+
+    Args:
+        logger: Logger instance for logging.
+        model_registry: Registry sharing loaded models across transcriptions.
+        batch_size: Maximum number of clips decoded together.
+        precision: Weight precision of the models. int8 models run on the
+            CPU, fp16 falls back to fp32 without a GPU.
+    """
 
-    def __init__(self, logger):
+    def __init__(
+        self,
+        logger,
+        model_registry: WhisperModelRegistry,
+        batch_size: int = 8,
+        precision: WhisperPrecision | str | None = WhisperPrecision.FP32,
+    ):
         self.logger = logger
+        self.model_registry = model_registry
+        self.batch_size = max(1, batch_size or 1)
+        self.precision = WhisperPrecision(precision or WhisperPrecision.FP32)
+
+    def _resolve(self) -> tuple[str, WhisperPrecision]:
+        """Device and precision the models run with."""
+        import torch
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        precision = self.precision
+        if precision is WhisperPrecision.INT8:
+            # Dynamic quantization only has CPU kernels
+            device = "cpu"
+        elif precision is WhisperPrecision.FP16 and device == "cpu":
+            precision = WhisperPrecision.FP32
+        return device, precision
+
+    def preload(self, model: str) -> None:
+        """Load a model into the registry ahead of the first transcription.
+
+        Args:
+            model: Whisper model name.
+        """
+        device, precision = self._resolve()
+        self.model_registry.get(model, device, precision.value)
+        self.logger.debug(
+            f"Loaded Whisper model: {model} ({device}, {precision.value})"
+        )
+
+    @contextlib.contextmanager
+    def _use(self, model: str):
+        """Hold a model for one inference, see ``WhisperModelRegistry.use``."""
+        device, precision = self._resolve()
+        with self.model_registry.use(model, device, precision.value) as whisper_model:
+            self.logger.debug(
+                f"Using Whisper model: {model} ({device}, {precision.value})"
+            )
+            yield whisper_model, precision.value
 
     def transcribe(
         self,
@@ -24,17 +244,173 @@ class TranscriptionService(ITranscriptionService):
             f"Transcribing {audio_file} with model {model} and options {options}"
         )
 
-        whisper_model = stable_whisper.load_model(
-            model, device=torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        )
-        self.logger.debug(f"Loaded Whisper model: {model}")
-
-        transcription = whisper_model.transcribe(
-            audio_file.as_posix(),
-            regroup=True,
-            fp16=False,
-            word_timestamps=True,
-        )
+        with self._use(model) as (whisper_model, precision):
+            transcription = whisper_model.transcribe(
+                audio_file.as_posix(),
+                regroup=True,
+                fp16=precision == "fp16",
+                word_timestamps=True,
+            )
         transcription.to_srt_vtt(srt_file.as_posix(), word_level=True)
         transcription.to_ass(ass_file.as_posix(), word_level=True, **options)
         return (srt_file, ass_file)
+
+    def align(
+        self,
+        audio_file: Path,
+        text: str,
+        srt_file: Path,
+        ass_file: Path,
+        model: str,
+        options: dict,
+        language: str | None = None,
+        min_probability: float = 0.5,
+    ) -> tuple[Path, Path]:
+        """Align the known script to the audio instead of transcribing it.
+
+        Alignment only scores the given tokens against the audio, so it avoids
+        autoregressive decoding and keeps the exact words of the script. When
+        the mean word probability of the alignment is below
+        ``min_probability``, the audio is transcribed instead.
+        """
+        self.logger.debug(f"Aligning script to {audio_file} with model {model}")
+
+        with self._use(model) as (whisper_model, _):
+            result = whisper_model.align(audio_file.as_posix(), text, language=language)
+
+        quality = self.alignment_quality(result)
+        if quality < min_probability:
+            self.logger.warning(
+                f"Alignment of {audio_file.name} is unreliable (mean word "
+                f"probability {quality:.2f} < {min_probability:.2f}), "
+                "falling back to transcription"
+            )
+            return self.transcribe(audio_file, srt_file, ass_file, model, options)
+
+        self._write_subtitles(
+            result, TranscriptionJob(audio_file, srt_file, ass_file), options
+        )
+        return (srt_file, ass_file)
+
+    @staticmethod
+    def alignment_quality(result) -> float:
+        """Mean word probability of an alignment, 0 when it failed."""
+        if result is None:
+            return 0.0
+        probabilities = [
+            word.probability
+            for word in result.all_words()
+            if word.probability is not None
+        ]
+        return sum(probabilities) / len(probabilities) if probabilities else 0.0
+
+    def transcribe_batch(
+        self, jobs: list[TranscriptionJob], model: str, options: dict
+    ) -> list[tuple[Path, Path]]:
+        """Transcribe several clips, decoding the short ones together.
+
+        Clips that fit in a single 30 second Whisper window are padded into mel
+        batches: the encoder and the decoder process the whole batch at once,
+        then word timestamps are aligned clip by clip. Longer clips go through
+        the regular sequential transcription.
+        """
+        if len(jobs) == 1:
+            job = jobs[0]
+            return [
+                self.transcribe(
+                    job.audio_file, job.srt_file, job.ass_file, model, options
+                )
+            ]
+
+        import whisper
+        from whisper.audio import N_SAMPLES
+
+        audios = [whisper.load_audio(job.audio_file.as_posix()) for job in jobs]
+        short = [i for i, audio in enumerate(audios) if len(audio) <= N_SAMPLES]
+        short_set = set(short)
+
+        for start in range(0, len(short), self.batch_size):
+            chunk = short[start : start + self.batch_size]
+            self.logger.debug(f"Transcribing batch of {len(chunk)} clips")
+            with self._use(model) as (whisper_model, precision):
+                results = self._decode_batch(
+                    whisper_model, [audios[i] for i in chunk], precision
+                )
+            for index, result in zip(chunk, results):
+                self._write_subtitles(result, jobs[index], options)
+
+        for index, job in enumerate(jobs):
+            if index not in short_set:
+                self.transcribe(
+                    job.audio_file, job.srt_file, job.ass_file, model, options
+                )
+
+        return [(job.srt_file, job.ass_file) for job in jobs]
+
+    def _decode_batch(self, whisper_model, audios: list, precision: str) -> list:
+        """Decode padded clips in one pass and align their words."""
+        import stable_whisper
+        import torch
+        import whisper
+        from whisper.audio import HOP_LENGTH, SAMPLE_RATE
+        from whisper.timing import add_word_timestamps
+        from whisper.tokenizer import get_tokenizer
+
+        with torch.no_grad():
+            n_mels = whisper_model.dims.n_mels
+            mels = torch.stack(
+                [
+                    whisper.log_mel_spectrogram(
+                        whisper.pad_or_trim(torch.from_numpy(audio)), n_mels
+                    )
+                    for audio in audios
+                ]
+            ).to(whisper_model.device)
+            if precision == "fp16":
+                mels = mels.half()
+
+            decoded = whisper.decode(
+                whisper_model,
+                mels,
+                whisper.DecodingOptions(
+                    task="transcribe",
+                    without_timestamps=True,
+                    fp16=precision == "fp16",
+                ),
+            )
+
+            results = []
+            for audio, mel, result in zip(audios, mels, decoded):
+                tokenizer = get_tokenizer(
+                    whisper_model.is_multilingual,
+                    num_languages=whisper_model.num_languages,
+                    language=result.language,
+                    task="transcribe",
+                )
+                duration = len(audio) / SAMPLE_RATE
+                segment = {
+                    "seek": 0,
+                    "start": 0.0,
+                    "end": duration,
+                    "text": result.text,
+                    "tokens": result.tokens,
+                }
+                add_word_timestamps(
+                    segments=[segment],
+                    model=whisper_model,
+                    tokenizer=tokenizer,
+                    mel=mel,
+                    num_frames=min(mel.shape[-1], len(audio) // HOP_LENGTH + 1),
+                    last_speech_timestamp=0.0,
+                )
+                results.append(
+                    stable_whisper.WhisperResult(
+                        {"language": result.language, "segments": [segment]}
+                    )
+                )
+            return results
+
+    def _write_subtitles(self, result, job: TranscriptionJob, options: dict) -> None:
+        result.regroup()
+        result.to_srt_vtt(job.srt_file.as_posix(), word_level=True)
+        result.to_ass(job.ass_file.as_posix(), word_level=True, **options)
@@ -1,9 +1,10 @@
 from logging import Logger
 from pathlib import Path
 
-import edge_tts
+from whisper_tiktok.interfaces.tts_service import ITTSService, WordBoundary
 
-from whisper_tiktok.interfaces.tts_service import ITTSService
+# edge-tts reports offsets and durations in 100 ns units
+TICKS_PER_SECOND = 10_000_000
 
 
 class TTSService(ITTSService):
@@ -17,6 +18,9 @@ class TTSService(ITTSService):
         text: str,
         output_file: Path,
         voice: str = "en-US-ChristopherNeural",
+        rate: str = "+0%",
+        volume: str = "+0%",
+        pitch: str = "+0Hz",
     ) -> None:
         """
         Synthesize speech from text and save to output file.
@@ -25,7 +29,62 @@ class TTSService(ITTSService):
             text (str): The text to be converted to speech.
             output_file (Path): The path to save the synthesized audio file.
             voice (str): The voice to be used for synthesis.
+            rate (str): Speaking rate change, e.g. "+10%".
+            volume (str): Volume change, e.g. "-5%".
+            pitch (str): Pitch change, e.g. "+2Hz".
         """
+        import edge_tts
+
         self.logger.debug(f"Synthesizing speech to {output_file} using voice {voice}")
-        communicate = edge_tts.Communicate(text, voice)
+        communicate = edge_tts.Communicate(
+            text, voice, rate=rate, volume=volume, pitch=pitch
+        )
         await communicate.save(output_file.as_posix())
+
+    async def synthesize_with_boundaries(
+        self,
+        text: str,
+        output_file: Path,
+        voice: str = "en-US-ChristopherNeural",
+        rate: str = "+0%",
+        volume: str = "+0%",
+        pitch: str = "+0Hz",
+    ) -> list[WordBoundary]:
+        """
+        Synthesize speech and collect the WordBoundary events of edge-tts.
+
+        Args:
+            text (str): The text to be converted to speech.
+            output_file (Path): The path to save the synthesized audio file.
+            voice (str): The voice to be used for synthesis.
+            rate (str): Speaking rate change, e.g. "+10%".
+            volume (str): Volume change, e.g. "-5%".
+            pitch (str): Pitch change, e.g. "+2Hz".
+
+        Returns:
+            list[WordBoundary]: The spoken words with their start and end time.
+        """
+        import edge_tts
+
+        self.logger.debug(
+            f"Synthesizing speech with word boundaries to {output_file} "
+            f"using voice {voice}"
+        )
+        communicate = edge_tts.Communicate(
+            text,
+            voice,
+            rate=rate,
+            volume=volume,
+            pitch=pitch,
+            boundary="WordBoundary",
+        )
+        words: list[WordBoundary] = []
+        with output_file.open("wb") as audio:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    start = chunk["offset"] / TICKS_PER_SECOND
+                    end = start + chunk["duration"] / TICKS_PER_SECOND
+                    words.append(WordBoundary(chunk["text"], start, end))
+        return words
@@ -16,19 +16,41 @@ class VideoDownloaderService(IVideoDownloader):
         self.executor = executor
         self.logger = logger
 
-    def download(self, url: str, output_dir: Path) -> Path:
-        """Download video from URL."""
+    async def download(
+        self, url: str, output_dir: Path, timeout: float | None = None
+    ) -> Path:
+        """Download video from URL.
+
+        Returns:
+            Path of the downloaded file, as reported by yt-dlp.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        command = rf"yt-dlp -f bestvideo[ext=mp4] --restrict-filenames -o %(id)s.%(ext)s {url}"
-        result = self.executor.execute(command, cwd=output_dir)
+        command = [
+            "yt-dlp",
+            "-f",
+            "bestvideo[ext=mp4]",
+            "--restrict-filenames",
+            "-o",
+            "%(id)s.%(ext)s",
+            "--print",
+            "after_move:filepath",
+            "--no-simulate",
+            url,
+        ]
+        result = await self.executor.execute(command, cwd=output_dir, timeout=timeout)
 
         if result.returncode != 0:
             raise VideoDownloadError(f"Failed to download: {result.stderr}")
 
-        # Find downloaded file
-        videos = list(output_dir.glob("*.mp4"))
-        if not videos:
-            raise VideoDownloadError("No video file found after download")
+        lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        if not lines:
+            raise VideoDownloadError("yt-dlp did not report the downloaded file")
 
-        return videos[-1]  # Most recent
+        video = Path(lines[-1])
+        if not video.is_absolute():
+            video = output_dir / video
+        if not video.is_file():
+            raise VideoDownloadError(f"Downloaded file not found: {video}")
+
+        return video
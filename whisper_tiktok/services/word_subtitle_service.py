@@ -0,0 +1,199 @@
+from logging import Logger
+from pathlib import Path
+
+from whisper_tiktok.interfaces.tts_service import WordBoundary
+
+# Style fields of the ASS files written by stable-ts, with its defaults
+ASS_STYLE = {
+    "Name": "Default",
+    "Fontname": "Arial",
+    "Fontsize": "48",
+    "PrimaryColour": "&Hffffff",
+    "SecondaryColour": "&Hffffff",
+    "OutlineColour": "&H0",
+    "BackColour": "&H0",
+    "Bold": "0",
+    "Italic": "0",
+    "Underline": "0",
+    "StrikeOut": "0",
+    "ScaleX": "100",
+    "ScaleY": "100",
+    "Spacing": "0",
+    "Angle": "0",
+    "BorderStyle": "1",
+    "Outline": "1",
+    "Shadow": "0",
+    "Alignment": "2",
+    "MarginL": "10",
+    "MarginR": "10",
+    "MarginV": "10",
+    "Encoding": "0",
+}
+
+SENTENCE_ENDS = (".", "?", "!", "。", "？")
+
+
+def _hhmmss(seconds: float) -> tuple[int, int, float]:
+    minutes, seconds = divmod(max(0.0, seconds), 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return hours, minutes, seconds
+
+
+def srt_time(seconds: float) -> str:
+    """Format a time as an SRT timestamp, e.g. ``00:00:01,500``."""
+    hours, minutes, seconds = _hhmmss(seconds)
+    return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}".replace(".", ",")
+
+
+def ass_time(seconds: float) -> str:
+    """Format a time as an ASS timestamp, e.g. ``0:00:01.50``."""
+    hours, minutes, seconds = _hhmmss(seconds)
+    return f"{hours:d}:{minutes:02d}:{seconds:05.2f}"
+
+
+class WordSubtitleService:
+    """Writes word-level subtitles from known word timings, without Whisper.
+
+    The files follow the layout stable-ts gives transcribed subtitles: the
+    words are grouped into lines and every line is repeated for each of its
+    words, with the spoken word highlighted. stable-ts is not imported, so
+    subtitles from the TTS word boundaries never load torch.
+
+    Args:
+        logger: Logger instance for logging.
+        max_gap: Silence, in seconds, that starts a new line.
+        max_chars: Longest line, in characters.
+    """
+
+    def __init__(self, logger: Logger, max_gap: float = 0.4, max_chars: int = 70):
+        self.logger = logger
+        self.max_gap = max_gap
+        self.max_chars = max_chars
+
+    def group(self, words: list[WordBoundary]) -> list[list[WordBoundary]]:
+        """Split words into subtitle lines.
+
+        Like the default regrouping of stable-ts, lines end at pauses, at the
+        end of sentences, at commas once the line is long, and before a word
+        that would make the line longer than ``max_chars``.
+
+        Args:
+            words: Spoken words, in order.
+
+        Returns:
+            The lines, as lists of words.
+        """
+        lines: list[list[WordBoundary]] = []
+        length = 0
+        for word in words:
+            text = word.text.strip()
+            if not text:
+                continue
+            if (
+                not lines
+                or word.start - lines[-1][-1].end > self.max_gap
+                or lines[-1][-1].text.strip().endswith(SENTENCE_ENDS)
+                or (lines[-1][-1].text.strip().endswith(",") and length >= 50)
+                or length + 1 + len(text) > self.max_chars
+            ):
+                lines.append([])
+                length = -1
+            lines[-1].append(word)
+            length += 1 + len(text)
+        return lines
+
+    @staticmethod
+    def _highlights(
+        line: list[WordBoundary], tag: tuple[str, str]
+    ) -> list[tuple[float, float, str]]:
+        """Timed copies of a line, each highlighting the word spoken then.
+
+        Pauses between two words get a copy without highlight, so the line
+        stays on screen.
+        """
+        texts = [word.text.strip() for word in line]
+        blocks = []
+        for index, word in enumerate(line):
+            highlighted = texts.copy()
+            highlighted[index] = f"{tag[0]}{texts[index]}{tag[1]}"
+            blocks.append((word.start, word.end, " ".join(highlighted)))
+            if index + 1 < len(line) and line[index + 1].start > word.end:
+                blocks.append((word.end, line[index + 1].start, " ".join(texts)))
+        return blocks
+
+    def to_srt(self, words: list[WordBoundary]) -> str:
+        """Render word-level SRT subtitles."""
+        tag = ('<font color="#00ff00">', "</font>")
+        blocks = [
+            block for line in self.group(words) for block in self._highlights(line, tag)
+        ]
+        return "\n\n".join(
+            f"{index}\n{srt_time(start)} --> {srt_time(end)}\n{text}"
+            for index, (start, end, text) in enumerate(blocks, 1)
+        )
+
+    def to_ass(self, words: list[WordBoundary], options: dict) -> str:
+        """Render word-level ASS subtitles.
+
+        Args:
+            words: Spoken words, in order.
+            options: Configuration holding the ASS style overrides and the
+                ``highlight_color`` of the spoken word, as BGR hex.
+
+        Returns:
+            The content of the ASS file.
+        """
+        highlight = str(options.get("highlight_color") or "00ff00")
+        style = dict(ASS_STYLE)
+        style.update((k, v) for k, v in options.items() if k in ASS_STYLE)
+        for key, value in style.items():
+            if "Colour" in key and not str(value).startswith("&H"):
+                style[key] = f"&H{value}"
+        if "PrimaryColour" not in options:
+            # stable-ts colours the whole line with the highlight colour
+            style["PrimaryColour"] = (
+                highlight if highlight.startswith("&H") else f"&H{highlight}"
+            )
+
+        tag = (f"{{\\1c{highlight}&}}", "{\\r}")
+        blocks = [
+            block for line in self.group(words) for block in self._highlights(line, tag)
+        ]
+        header = (
+            "[Script Info]\nScriptType: v4.00+\nPlayResX: 384\nPlayResY: 288\n"
+            "ScaledBorderAndShadow: yes\n\n"
+            f"[V4+ Styles]\nFormat: {', '.join(style)}\n"
+            f"Style: {','.join(map(str, style.values()))}\n\n"
+            "[Events]\nFormat: Layer, Start, End, Style, Name, MarginL, MarginR, "
+            "MarginV, Effect, Text\n\n"
+        )
+        return header + "\n".join(
+            f"Dialogue: {index},{ass_time(start)},{ass_time(end)},Default,,0,0,0,,{text}"
+            for index, (start, end, text) in enumerate(blocks)
+        )
+
+    def write(
+        self,
+        words: list[WordBoundary],
+        srt_file: Path,
+        ass_file: Path,
+        options: dict,
+    ) -> tuple[Path, Path]:
+        """Write word-level SRT and ASS subtitles.
+
+        Args:
+            words: Spoken words, in order.
+            srt_file: Path of the SRT file to write.
+            ass_file: Path of the ASS file to write.
+            options: Styling options, see ``to_ass``.
+
+        Returns:
+            The SRT and ASS paths.
+        """
+        if not words:
+            raise ValueError("No word boundaries to write subtitles from.")
+
+        self.logger.debug(f"Writing subtitles for {len(words)} words to {ass_file}")
+        srt_file.write_text(self.to_srt(words), encoding="utf-8")
+        ass_file.write_text(self.to_ass(words, options), encoding="utf-8")
+        return (srt_file, ass_file)
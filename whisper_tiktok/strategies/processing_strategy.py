@@ -1,12 +1,38 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from logging import Logger
 from pathlib import Path
 
-from whisper_tiktok.interfaces.transcription_service import ITranscriptionService
-from whisper_tiktok.interfaces.tts_service import ITTSService
-from whisper_tiktok.interfaces.video_downloader import IVideoDownloader
-from whisper_tiktok.services.ffmpeg_service import FFmpegService
+from whisper_tiktok.execution.transcription_batcher import TranscriptionBatcher
+from whisper_tiktok.interfaces.transcription_service import (
+    ITranscriptionService,
+    TranscriptionJob,
+)
+from whisper_tiktok.interfaces.tts_service import ITTSService, WordBoundary
+from whisper_tiktok.repositories.background_cache import BackgroundCache
+from whisper_tiktok.repositories.background_proxy_cache import BackgroundProxyCache
+from whisper_tiktok.services.ffmpeg_service import FFmpegService, MediaInfo
+from whisper_tiktok.services.render_profile import OutputVariant
+from whisper_tiktok.services.segment_picker import SegmentPicker
+from whisper_tiktok.services.silence_trimmer import SilenceTrimmer
+from whisper_tiktok.services.word_subtitle_service import WordSubtitleService
+
+# ASS style overrides of the configuration, see ``WhisperResult.to_ass``
+SUBTITLE_STYLE_KEYS = frozenset(
+    {
+        "Fontname",
+        "Fontsize",
+        "highlight_color",
+        "Alignment",
+        "BorderStyle",
+        "Outline",
+        "Shadow",
+        "Blur",
+        "MarginL",
+        "MarginR",
+    }
+)
 
 
 @dataclass
@@ -22,7 +48,24 @@ class ProcessingContext:
 
 
 class ProcessingStrategy(ABC):
-    """Base strategy for video processing steps."""
+    """Base strategy for video processing steps.
+
+    Attributes:
+        stage: Name of the pipeline stage the step belongs to. The batch
+            scheduler applies a separate concurrency limit to each stage.
+        requires: Keys of ``ProcessingContext.artifacts`` the step reads. ``None``
+            means undeclared: the step then runs after every previous step and
+            before every following one.
+        provides: Keys of ``ProcessingContext.artifacts`` the step writes.
+        config_keys: Keys of ``ProcessingContext.config`` the outputs of the step
+            depend on, used to detect stale outputs on incremental runs. ``None``
+            means every key that is not a runtime setting.
+    """
+
+    stage: str = "default"
+    requires: frozenset[str] | None = None
+    provides: frozenset[str] = frozenset()
+    config_keys: frozenset[str] | None = None
 
     @abstractmethod
     async def execute(self, context: ProcessingContext) -> ProcessingContext:
@@ -32,24 +75,44 @@ class ProcessingStrategy(ABC):
 class DownloadBackgroundStrategy(ProcessingStrategy):
     """Strategy for downloading background video."""
 
-    def __init__(self, downloader: IVideoDownloader, logger: Logger):
-        self.downloader = downloader
+    stage = "download"
+    requires = frozenset()
+    provides = frozenset({"background_video", "background_sha256"})
+    config_keys = frozenset({"background_url"})
+
+    def __init__(self, background_cache: BackgroundCache, logger: Logger):
+        self.background_cache = background_cache
         self.logger = logger
 
     async def execute(self, context: ProcessingContext) -> ProcessingContext:
         url = context.config["background_url"]
-        background_path = self.downloader.download(url, Path("background"))
-        context.artifacts["background_video"] = background_path
-        self.logger.info(f"Downloaded background: {background_path}")
+        background = await self.background_cache.get(url)
+        context.artifacts["background_video"] = background.path
+        context.artifacts["background_sha256"] = background.sha256
+        self.logger.info(f"Using background: {background.path}")
         return context
 
 
 class TTSGenerationStrategy(ProcessingStrategy):
-    """Strategy for generating TTS audio."""
+    """Strategy for generating TTS audio.
+
+    With ``word_boundaries`` enabled, the timing of every spoken word is
+    collected during synthesis and stored as the ``word_boundaries`` artifact.
+    """
+
+    stage = "tts"
+    requires = frozenset()
+    provides = frozenset({"audio_file", "script"})
+    config_keys = frozenset({"tts_voice", "tts_rate", "tts_volume", "tts_pitch"})
 
-    def __init__(self, tts_service: ITTSService, logger: Logger):
+    def __init__(
+        self, tts_service: ITTSService, logger: Logger, word_boundaries: bool = False
+    ):
         self.tts_service = tts_service
         self.logger = logger
+        self.word_boundaries = word_boundaries
+        if word_boundaries:
+            self.provides = self.provides | {"word_boundaries"}
 
     async def execute(self, context: ProcessingContext) -> ProcessingContext:
         """Integrates TTS into the pipeline"""
@@ -59,20 +122,111 @@ class TTSGenerationStrategy(ProcessingStrategy):
 
         output_file = context.media_path / f"{context.uuid}.mp3"
         voice = context.config.get("tts_voice", "en-US-ChristopherNeural")
+        synthesize = (
+            self.tts_service.synthesize_with_boundaries
+            if self.word_boundaries
+            else self.tts_service.synthesize
+        )
 
-        await self.tts_service.synthesize(text, output_file, voice)
+        words = await synthesize(
+            text,
+            output_file,
+            voice,
+            rate=context.config.get("tts_rate", "+0%"),
+            volume=context.config.get("tts_volume", "+0%"),
+            pitch=context.config.get("tts_pitch", "+0Hz"),
+        )
         context.artifacts["audio_file"] = output_file
+        context.artifacts["script"] = text
+        if self.word_boundaries:
+            context.artifacts["word_boundaries"] = words
 
         self.logger.info(f"Generated TTS audio: {output_file}")
         return context
 
 
-class TranscriptionStrategy(ProcessingStrategy):
-    """Strategy for transcribing audio to generate subtitles."""
+class SilenceTrimStrategy(ProcessingStrategy):
+    """Strategy cutting the silence out of the TTS narration.
 
-    def __init__(self, transcription_service: ITranscriptionService, logger: Logger):
+    The trimmed narration replaces the ``audio_file`` artifact, so it is what
+    Whisper transcribes and what the video plays: both share one timeline and
+    the video is only as long as the speech. Word boundaries reported by the
+    TTS, which are timed on the original narration, are mapped to the trimmed
+    one. The kept regions are stored as the ``speech_map`` artifact.
+    """
+
+    stage = "trim"
+    requires = frozenset({"audio_file"})
+    provides = frozenset({"audio_file", "speech_map"})
+    config_keys = frozenset({"silence_threshold_db", "max_pause"})
+
+    def __init__(
+        self, trimmer: SilenceTrimmer, logger: Logger, word_boundaries: bool = False
+    ):
+        self.trimmer = trimmer
+        self.logger = logger
+        self.word_boundaries = word_boundaries
+        if word_boundaries:
+            self.requires = self.requires | {"word_boundaries"}
+            self.provides = self.provides | {"word_boundaries"}
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        audio_file = context.artifacts["audio_file"]
+        output_file = context.media_path / f"{context.uuid}.trimmed.wav"
+        speech_map = await self.trimmer.trim(audio_file, output_file)
+
+        context.artifacts["audio_file"] = output_file
+        context.artifacts["speech_map"] = speech_map
+        if self.word_boundaries:
+            context.artifacts["word_boundaries"] = [
+                WordBoundary(
+                    word.text,
+                    speech_map.to_trimmed(word.start),
+                    speech_map.to_trimmed(word.end),
+                )
+                for word in context.artifacts["word_boundaries"]
+            ]
+
+        self.logger.info(
+            f"Trimmed silence: {speech_map.duration:.2f}s -> "
+            f"{speech_map.trimmed_duration:.2f}s"
+        )
+        return context
+
+
+class TranscriptionStrategy(ProcessingStrategy):
+    """Strategy for transcribing audio to generate subtitles.
+
+    With ``align`` enabled, the script spoken by the TTS is aligned to the audio
+    instead of being transcribed, falling back to transcription when the
+    alignment is unreliable.
+    """
+
+    stage = "transcription"
+    requires = frozenset({"audio_file"})
+    provides = frozenset({"srt_file", "ass_file"})
+    # The voice gives the language of the alignment
+    config_keys = SUBTITLE_STYLE_KEYS | {
+        "model",
+        "subtitle_mode",
+        "alignment_threshold",
+        "whisper_precision",
+        "tts_voice",
+    }
+
+    def __init__(
+        self,
+        transcription_service: ITranscriptionService,
+        logger: Logger,
+        batcher: TranscriptionBatcher | None = None,
+        align: bool = False,
+    ):
         self.transcription_service = transcription_service
         self.logger = logger
+        self.batcher = batcher
+        self.align = align
+        if align:
+            self.requires = self.requires | {"script"}
 
     async def execute(self, context: ProcessingContext) -> ProcessingContext:
         audio_file = context.artifacts.get("audio_file")
@@ -81,13 +235,39 @@ class TranscriptionStrategy(ProcessingStrategy):
 
         srt_file = context.media_path / f"{context.uuid}.srt"
         ass_file = context.media_path / f"{context.uuid}.ass"
-        self.transcription_service.transcribe(
-            audio_file,
-            srt_file,
-            ass_file,
-            model=context.config["model"],
-            options=context.config,
-        )
+        if self.align:
+            script = context.artifacts.get("script")
+            if not script:
+                raise ValueError("Script not found in context artifacts.")
+            # Voices are named after their locale, e.g. "en-US-ChristopherNeural"
+            voice = context.config.get("tts_voice") or ""
+            await self.transcription_service.aalign(
+                audio_file,
+                script,
+                srt_file,
+                ass_file,
+                model=context.config["model"],
+                options=context.config,
+                language=voice.split("-")[0] or None,
+                min_probability=context.config.get("alignment_threshold", 0.5),
+            )
+        elif self.batcher is not None:
+            # Clips of concurrent videos are transcribed together
+            await self.batcher.transcribe(
+                TranscriptionJob(audio_file, srt_file, ass_file),
+                model=context.config["model"],
+                options=context.config,
+            )
+        else:
+            # Whisper inference is blocking, the service runs it off the event
+            # loop so other videos in the batch keep making progress.
+            await self.transcription_service.atranscribe(
+                audio_file,
+                srt_file,
+                ass_file,
+                model=context.config["model"],
+                options=context.config,
+            )
         context.artifacts["srt_file"] = srt_file
         context.artifacts["ass_file"] = ass_file
         self.logger.info(f"Generated transcription SRT: {srt_file}")
@@ -95,44 +275,150 @@ class TranscriptionStrategy(ProcessingStrategy):
         return context
 
 
-class VideoCompositionStrategy(ProcessingStrategy):
-    """Strategy for composing the final video."""
+class TTSSubtitleStrategy(ProcessingStrategy):
+    """Strategy writing subtitles from the word timings reported by the TTS."""
+
+    stage = "subtitles"
+    requires = frozenset({"word_boundaries"})
+    provides = frozenset({"srt_file", "ass_file"})
+    config_keys = SUBTITLE_STYLE_KEYS
+
+    def __init__(self, subtitle_service: WordSubtitleService, logger: Logger):
+        self.subtitle_service = subtitle_service
+        self.logger = logger
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        words = context.artifacts.get("word_boundaries")
+        if not words:
+            raise ValueError("Word boundaries not found in context artifacts.")
+
+        srt_file = context.media_path / f"{context.uuid}.srt"
+        ass_file = context.media_path / f"{context.uuid}.ass"
+        await asyncio.to_thread(
+            self.subtitle_service.write, words, srt_file, ass_file, context.config
+        )
+        context.artifacts["srt_file"] = srt_file
+        context.artifacts["ass_file"] = ass_file
+        self.logger.info(f"Generated subtitles from TTS word boundaries: {ass_file}")
+        return context
+
+
+class BackgroundProxyStrategy(ProcessingStrategy):
+    """Strategy providing the cached vertical proxy of the background video."""
 
-    def __init__(self, ffmpeg_service: FFmpegService, logger: Logger):
+    stage = "proxy"
+    requires = frozenset({"background_video", "background_sha256"})
+    provides = frozenset({"background_proxy"})
+    config_keys = frozenset({"render_settings"})
+
+    def __init__(self, proxy_cache: BackgroundProxyCache, logger: Logger):
+        self.proxy_cache = proxy_cache
+        self.logger = logger
+
+    async def execute(self, context: ProcessingContext) -> ProcessingContext:
+        proxy = await self.proxy_cache.get(
+            context.artifacts["background_video"],
+            context.artifacts["background_sha256"],
+        )
+        context.artifacts["background_proxy"] = proxy
+        self.logger.info(f"Using background proxy: {proxy}")
+        return context
+
+
+class VideoCompositionStrategy(ProcessingStrategy):
+    """Strategy for composing the final video.
+
+    With ``use_proxy`` enabled, the video is composed on top of the
+    ``background_proxy`` artifact, which is already cropped, scaled and
+    blurred, so only the subtitles are burned in.
+
+    With a ``segment_picker``, the background starts at a keyframe chosen by
+    the picker instead of at its beginning.
+
+    With ``variants``, the renditions for other platforms are rendered in the
+    same ffmpeg process and stored by name in the ``variants`` artifact.
+    """
+
+    stage = "composition"
+    requires = frozenset({"background_video", "audio_file", "ass_file"})
+    provides = frozenset({"final_video", "audio_duration", "background_start"})
+    config_keys = frozenset(
+        {"render_settings", "background_proxy", "background_seek", "seed", "variants"}
+    )
+
+    def __init__(
+        self,
+        ffmpeg_service: FFmpegService,
+        logger: Logger,
+        use_proxy: bool = False,
+        segment_picker: SegmentPicker | None = None,
+        variants: list[OutputVariant] | None = None,
+    ):
         self.ffmpeg_service = ffmpeg_service
         self.logger = logger
+        self.use_proxy = use_proxy
+        self.segment_picker = segment_picker
+        self.variants = variants or []
+        if use_proxy:
+            self.requires = self.requires - {"background_video"} | {"background_proxy"}
+        if self.variants:
+            self.provides = self.provides | {"variants"}
 
     async def execute(self, context: ProcessingContext) -> ProcessingContext:
-        background_video = context.artifacts["background_video"]
+        background_video = context.artifacts[
+            "background_proxy" if self.use_proxy else "background_video"
+        ]
         audio_file = context.artifacts["audio_file"]
         ass_file = context.artifacts["ass_file"]
 
         # Get video duration and audio duration to calculate start time
-        audio_info = self.ffmpeg_service.get_media_info(file_path=audio_file)
-        duration = audio_info.duration
-        str_duration = audio_info.convert_time(time_in_seconds=duration)
+        audio_info = await self.ffmpeg_service.probe(audio_file)
+        duration = audio_info.audio_duration
+        str_duration = MediaInfo.convert_time(time_in_seconds=duration)
+
+        start_time = 0.0
+        if self.segment_picker is not None:
+            start_time = await self.segment_picker.pick(background_video, duration)
+            self.logger.debug(f"Background starts at {start_time:.3f}s")
+        context.artifacts["background_start"] = start_time
 
         # Then compose video
         output_file = context.output_path / f"{context.uuid}.mp4"
 
         # Implementation using FFmpegService
-        self.ffmpeg_service.compose_video(
+        await self.ffmpeg_service.compose_video(
             background=background_video,
             audio=audio_file,
             subtitles=ass_file,
             output=output_file,
-            start_time=0,
+            start_time=start_time,
             duration=str_duration,
+            prefiltered=self.use_proxy,
+            variants=self.variants,
         )
 
         context.artifacts["final_video"] = output_file
+        context.artifacts["audio_duration"] = duration
         self.logger.info(f"Composed video: {output_file}")
+        if self.variants:
+            context.artifacts["variants"] = {
+                variant.name: variant.output_path(output_file)
+                for variant in self.variants
+            }
+            self.logger.info(
+                f"Composed variants: {', '.join(v.name for v in self.variants)}"
+            )
         return context
 
 
 class TikTokUploadStrategy(ProcessingStrategy):
     """Strategy for uploading videos to TikTok."""
 
+    stage = "upload"
+    requires = frozenset({"final_video"})
+    provides = frozenset()
+    config_keys = frozenset()
+
     def __init__(self, uploader, logger: Logger):
         self.uploader = uploader
         self.logger = logger
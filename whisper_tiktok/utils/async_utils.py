@@ -0,0 +1,9 @@
+def first_exception(error: BaseException) -> BaseException:
+    """Return the first leaf exception of a (possibly nested) ExceptionGroup.
+
+    TaskGroups wrap failures in exception groups; callers of the pipeline
+    expect the original error instead.
+    """
+    while isinstance(error, BaseExceptionGroup) and error.exceptions:
+        error = error.exceptions[0]
+    return error
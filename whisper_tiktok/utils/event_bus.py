@@ -0,0 +1,39 @@
+from collections.abc import Callable
+from logging import Logger
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class EventBus(Generic[T]):
+    """Minimal publish/subscribe hub for pipeline events.
+
+    Subscribers are called synchronously, in subscription order, from the
+    thread that publishes the event. A failing subscriber is logged and does
+    not prevent the other subscribers from receiving the event.
+
+    Args:
+        logger: Logger instance for logging.
+    """
+
+    def __init__(self, logger: Logger):
+        self.logger = logger
+        self._subscribers: list[Callable[[T], None]] = []
+
+    def subscribe(self, callback: Callable[[T], None]) -> Callable[[], None]:
+        """Register a callback and return a function that unregisters it."""
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, event: T) -> None:
+        """Deliver an event to every subscriber."""
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception:
+                self.logger.exception(f"Event subscriber {callback!r} failed")
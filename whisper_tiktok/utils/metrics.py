@@ -0,0 +1,207 @@
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+
+# Upper bounds, in seconds, suited to steps taking from milliseconds to minutes
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# Upper bounds, in bytes, from 64 KiB to 1 GiB
+SIZE_BUCKETS = tuple(64 * 1024 * 4**i for i in range(8))
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter, one value per label set."""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Increase the counter of a label set."""
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """Current value of a label set."""
+        return self._values.get(_labels(labels), 0)
+
+    def samples(self) -> list[tuple[Labels, float]]:
+        with self._lock:
+            return sorted(self._values.items())
+
+
+class Histogram:
+    """Distribution of observations in cumulative buckets, per label set."""
+
+    def __init__(
+        self, name: str, documentation: str, buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        """Record an observation for a label set."""
+        key = _labels(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            counts[bisect_left(self.buckets, value)] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels) -> int:
+        """Number of observations of a label set."""
+        return sum(self._counts.get(_labels(labels), ()))
+
+    def samples(self) -> list[tuple[Labels, list[int], float]]:
+        """Cumulative bucket counts and sum of every label set."""
+        with self._lock:
+            return [
+                (
+                    key,
+                    [sum(counts[: i + 1]) for i in range(len(counts))],
+                    self._sums[key],
+                )
+                for key, counts in sorted(self._counts.items())
+            ]
+
+
+class MetricsRegistry:
+    """Collects the counters and histograms of a run and exports them.
+
+    Metrics are exported in the Prometheus text exposition format, suitable for
+    the node_exporter textfile collector, and as a JSON summary that is easy
+    to compare across runs.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        """Return the counter with the given name, creating it if needed."""
+        return self._get(name, lambda: Counter(name, documentation), Counter)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with the given name, creating it if needed."""
+        return self._get(
+            name, lambda: Histogram(name, documentation, buckets), Histogram
+        )
+
+    def _get(self, name, create, kind):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = create()
+            if not isinstance(metric, kind):
+                raise ValueError(f"Metric {name} is already a {type(metric).__name__}")
+            return metric
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.documentation}")
+            if isinstance(metric, Counter):
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in metric.samples():
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+                continue
+
+            lines.append(f"# TYPE {name} histogram")
+            for labels, cumulative, total in metric.samples():
+                for bound, count in zip(metric.buckets, cumulative):
+                    bucket_labels = (*labels, ("le", _format_value(bound)))
+                    lines.append(
+                        f"{name}_bucket{_format_labels(bucket_labels)} {count}"
+                    )
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_value(total)}"
+                )
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative[-1]}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> dict:
+        """Summarize every metric as JSON-compatible data."""
+        counters: dict[str, list] = {}
+        histograms: dict[str, list] = {}
+        for name, metric in sorted(self._metrics.items()):
+            if isinstance(metric, Counter):
+                counters[name] = [
+                    {"labels": dict(labels), "value": value}
+                    for labels, value in metric.samples()
+                ]
+                continue
+            histograms[name] = [
+                {
+                    "labels": dict(labels),
+                    "count": cumulative[-1],
+                    "sum": total,
+                    "mean": total / cumulative[-1] if cumulative[-1] else 0.0,
+                    "buckets": {
+                        _format_value(bound): count
+                        for bound, count in zip(metric.buckets, cumulative)
+                    },
+                }
+                for labels, cumulative, total in metric.samples()
+            ]
+        return {
+            "started_at": self.started_at,
+            "finished_at": time.time(),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def write_textfile(self, path: Path) -> None:
+        """Write the Prometheus textfile atomically, as node_exporter expects."""
+        self._write(path, self.to_prometheus())
+
+    def write_json(self, path: Path) -> None:
+        """Write the JSON summary atomically."""
+        self._write(path, json.dumps(self.to_dict(), indent=2))
+
+    @staticmethod
+    def _write(path: Path, content: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -0,0 +1,184 @@
+import hashlib
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+# Size of the reads while streaming a JSON array
+CHUNK_SIZE = 64 * 1024
+
+# Extensions of JSON Lines files, one video entry per line
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+_WHITESPACE = " \t\r\n"
+
+
+class VideoInputError(ValueError):
+    """Raised when the video list is malformed."""
+
+
+def stable_hash(video: dict) -> int:
+    """Hash of a video entry that is identical on every machine and run."""
+    payload = json.dumps(video, sort_keys=True, ensure_ascii=False)
+    return int.from_bytes(hashlib.sha256(payload.encode("utf-8")).digest()[:8], "big")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Slice of a video list, one of ``count`` disjoint slices.
+
+    Entries are assigned to slices by a stable hash of their content, so
+    machines reading the same file split it without coordination.
+
+    Attributes:
+        index: Slice number, from 1 to ``count``.
+        count: Number of slices.
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """Parse a slice written as ``i/N``, e.g. "2/4"."""
+        try:
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise VideoInputError(
+                f"Invalid shard {value!r}, expected i/N, e.g. 1/4"
+            ) from None
+        if not 1 <= index <= count:
+            raise VideoInputError(f"Invalid shard {value!r}, i must be in 1..N")
+        return cls(index, count)
+
+    def contains(self, video: dict) -> bool:
+        """Whether a video entry belongs to this slice."""
+        return stable_hash(video) % self.count == self.index - 1
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def _check_entry(value, position: int) -> dict:
+    if not isinstance(value, dict):
+        raise VideoInputError(
+            f"Video {position} is a {type(value).__name__}, expected an object"
+        )
+    return value
+
+
+def iter_json_lines(handle: TextIO) -> Iterator[dict]:
+    """Yield the entries of a JSON Lines stream, one object per line."""
+    for number, line in enumerate(handle, 1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise VideoInputError(f"Invalid JSON on line {number}: {e}") from e
+        yield _check_entry(value, number)
+
+
+def iter_json_array(handle: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Yield the entries of a JSON array as they are read.
+
+    The stream is read in chunks and every entry is decoded as soon as it is
+    complete, so memory use is bounded by the largest entry, not the array.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+    count = 0
+    expect = "["
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, eof
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer, pos = buffer[pos:] + chunk, 0
+        return True
+
+    while True:
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not read_more():
+                break
+        if pos == len(buffer):
+            if expect == "end":
+                return
+            raise VideoInputError(f"Unexpected end of input after {count} videos")
+
+        char = buffer[pos]
+        if expect == "[":
+            if char != "[":
+                raise VideoInputError("Expected a JSON array of videos")
+            pos += 1
+            expect = "first"
+        elif expect == "separator":
+            if char == "]":
+                pos += 1
+                expect = "end"
+            elif char == ",":
+                pos += 1
+                expect = "value"
+            else:
+                raise VideoInputError(f"Expected ',' or ']' after video {count}")
+        elif expect == "end":
+            raise VideoInputError("Unexpected data after the JSON array")
+        elif char == "]" and expect == "first":
+            pos += 1
+            expect = "end"
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if read_more():
+                    continue
+                raise VideoInputError(f"Invalid JSON in video {count + 1}: {e}") from e
+            # A value ending with the buffer, e.g. a number, may continue
+            if end == len(buffer) and not eof and read_more():
+                continue
+            count += 1
+            yield _check_entry(value, count)
+            pos = end
+            expect = "separator"
+
+
+def read_videos(path: Path, shard: Shard | None = None) -> Iterator[dict]:
+    """Stream the video entries of a JSON array or JSON Lines file.
+
+    JSON Lines is selected by the ``.jsonl``/``.ndjson`` extension or, for
+    other files, when the first character is not ``[``.
+
+    Args:
+        path: Video list.
+        shard: Only yield the entries of this slice.
+
+    Returns:
+        An iterator over the entries, read as it is consumed.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    handle = path.open(encoding="utf-8")
+
+    def entries() -> Iterator[dict]:
+        with handle:
+            if path.suffix.lower() in JSON_LINES_SUFFIXES:
+                videos = iter_json_lines(handle)
+            else:
+                first = handle.read(1)
+                while first and first in _WHITESPACE:
+                    first = handle.read(1)
+                handle.seek(0)
+                videos = (
+                    iter_json_array(handle) if first == "[" else iter_json_lines(handle)
+                )
+            for video in videos:
+                if shard is None or shard.contains(video):
+                    yield video
+
+    return entries()
@@ -1,15 +1,45 @@
+import logging
+from pathlib import Path
 from typing import Any
 
-import edge_tts
+from whisper_tiktok.repositories.voice_catalog import (
+    DEFAULT_TTL_HOURS,
+    VoiceCatalog,
+    VoiceCatalogCache,
+)
 
 
 class VoicesManager:
-    """Wrapper for edge_tts VoicesManager."""
+    """Wrapper for the edge-tts voices, backed by a local voice catalog.
+
+    The voice list is fetched at most once per ``ttl_hours`` and stored in
+    ``cache_file``, every lookup in between is local.
+
+    Args:
+        cache_file: Location of the voice catalog (default: ./cache/voices.json.gz).
+        ttl_hours: Age after which the voice list is fetched again.
+        logger: Logger instance for logging.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        logger: logging.Logger | None = None,
+    ):
+        self.cache = VoiceCatalogCache(
+            cache_file or Path.cwd() / "cache" / "voices.json.gz",
+            logger or logging.getLogger("whisper_tiktok"),
+            ttl_hours=ttl_hours,
+        )
+
+    async def create(self, refresh: bool = False) -> VoiceCatalog:
+        """Return the voice catalog, fetching the voice list when needed.
 
-    @staticmethod
-    async def create():
-        """Create and return voices manager object."""
-        return await edge_tts.VoicesManager.create()
+        Args:
+            refresh: Fetch the voice list even if the catalog is still fresh.
+        """
+        return await self.cache.get(refresh=refresh)
 
     @staticmethod
     def find(voices, gender: str, locale: str) -> Any: